@@ -0,0 +1,77 @@
+import argparse
+import sys
+from pathlib import Path
+from benchmarks.cases import all_cases
+from benchmarks.runner import (
+    Skipped,
+    load_baseline,
+    measure,
+    regressions,
+    report_line,
+    save_baseline,
+    select,
+)
+
+DEFAULT_BASELINE = Path(__file__).parent.joinpath("baseline.json")
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_REPEAT = 3
+DEFAULT_MIN_TIME = 0.5
+
+
+def parse(args=None):
+    parser = argparse.ArgumentParser("Benchmarks")
+    parser.add_argument("--filter", type=str, default=None, help="regex on names")
+    parser.add_argument("--baseline", type=str, default=str(DEFAULT_BASELINE))
+    parser.add_argument(
+        "--save", action="store_true", help="overwrite the baseline with this run"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="fail when a rate drops by more than this fraction of its baseline",
+    )
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    parser.add_argument("--list", action="store_true")
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    args = parse(args)
+    cases = select(all_cases(), args.filter)
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return
+
+    baseline_path = Path(args.baseline)
+    baseline = {}
+    if baseline_path.exists():
+        baseline = load_baseline(baseline_path)
+
+    results = []
+    for case in cases:
+        try:
+            result = measure(case, args.repeat, args.min_time)
+        except Skipped as reason:
+            print(f"{case.name:<72} skipped ({reason})")
+            continue
+        results.append(result)
+        print(report_line(result, baseline.get(case.name)), flush=True)
+
+    if args.save:
+        if baseline:
+            # Keep the entries of cases that were filtered out or skipped
+            kept = {result.name for result in results}
+            results += [result for name, result in baseline.items() if name not in kept]
+        save_baseline(baseline_path, sorted(results, key=lambda result: result.name))
+        print(f"Saved baseline to {baseline_path}")
+        return
+
+    regressed = regressions(results, baseline, args.threshold)
+    if regressed:
+        print(f"{len(regressed)} regression(s) beyond {args.threshold:.0%}:")
+        for name in regressed:
+            print(f"  {name}")
+        sys.exit(1)
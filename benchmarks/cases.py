@@ -0,0 +1,254 @@
+from __future__ import annotations
+import importlib
+import random
+from typing import List
+import numpy as np
+from bball import Game, Space, StrategyInterface
+from bball.space import KINEMATIC_BACKEND, PYMUNK_BACKEND
+from bball.create import create_strategy, created_spaced_strategy
+from ga.evaluation_game import evaluation_game
+from ga.evolution import tournament
+from ga.evolution_types import Population
+from ga.parameters import RegularParameters, compare
+from runner.setup import MAX_SUBSTEP_LENGTH, run_headless, time_frame_for
+from benchmarks.runner import Case, Skipped, Workload, case_name
+
+SEED = 0
+FPS = 60
+SPEED_SCALE = 3.0
+PLAYER_COUNTS = (1, 3, 5)
+FPS_SWEEP = (30, 60, 90)
+SUBSTEP_SWEEP = (0.005, MAX_SUBSTEP_LENGTH, 0.02)
+STEPS_PER_CALL = 20
+HEADLESS_DURATION = 10.0
+COMPARE_DURATION = 10.0
+TOURNAMENT_POPULATION_SIZE = 4
+ENV_STEPS_PER_CALL = 50
+VEC_ENV_NUM_ENVS = 64
+DATASET_SAMPLES = 100000
+
+
+def _regular_strategy() -> StrategyInterface:
+    return create_strategy()
+
+
+def _spaced_strategy() -> StrategyInterface:
+    # No passes, SpacePassShoot can't pick a receiver once every teammate's
+    # shot quality is 0
+    return created_spaced_strategy(pass_probability=0.0)
+
+
+STRATEGIES = {"regular": _regular_strategy, "spaced": _spaced_strategy}
+
+
+def _game(num_players: int, strategy: str) -> Game:
+    game = evaluation_game(num_players).seed(SEED)
+    for team_index in range(2):
+        game.assign_team_strategy(team_index, STRATEGIES[strategy]())
+    return game
+
+
+def _space_step(num_players: int, strategy: str, fps: int, substep: float) -> Case:
+    def setup() -> Workload:
+        space = Space().add(_game(num_players, strategy))
+        time_frame = time_frame_for(fps, SPEED_SCALE)
+
+        def run() -> int:
+            for _ in range(STEPS_PER_CALL):
+                space.step(time_frame, substep)
+            return STEPS_PER_CALL
+
+        return run
+
+    name = case_name(
+        "space_step", players=num_players, strategy=strategy, fps=fps, substep=substep
+    )
+    return Case(name, "steps", setup)
+
+
+def _run_headless(num_players: int, strategy: str) -> Case:
+    def setup() -> Workload:
+        game = _game(num_players, strategy)
+        template = game.snapshot()
+
+        def run() -> int:
+            game.restore(template)
+            run_headless(game, FPS, SPEED_SCALE, HEADLESS_DURATION)
+            return 1
+
+        return run
+
+    name = case_name("run_headless", players=num_players, strategy=strategy)
+    return Case(name, "games", setup)
+
+
+def _parameters(width: float) -> List[RegularParameters]:
+    rng = random.Random(SEED)
+    return [
+        RegularParameters(rng.random(), rng.random(), width)
+        for _ in range(TOURNAMENT_POPULATION_SIZE)
+    ]
+
+
+def _compare(num_players: int, backend: str = PYMUNK_BACKEND) -> Case:
+    def setup() -> Workload:
+        game = evaluation_game(num_players)
+        parameters_1, parameters_2 = _parameters(game.court.width)[:2]
+
+        def run() -> int:
+            compare(
+                game,
+                parameters_1,
+                parameters_2,
+                duration=COMPARE_DURATION,
+                fps=FPS,
+                speed_scale=SPEED_SCALE,
+                seed=SEED,
+                backend=backend,
+            )
+            return 1
+
+        return run
+
+    # Pymunk cases keep the names of the stored baseline
+    params = {} if backend == PYMUNK_BACKEND else {"backend": backend}
+    name = case_name("compare", players=num_players, **params)
+    return Case(name, "comparisons", setup)
+
+
+def _tournament(num_players: int) -> Case:
+    # Serial round robin, so the rate doesn't depend on the worker count
+    def setup() -> Workload:
+        game = evaluation_game(num_players)
+        population: Population = list(_parameters(game.court.width))
+
+        def comparator(parameters_1, parameters_2) -> float:
+            return compare(
+                game,
+                parameters_1,
+                parameters_2,
+                duration=COMPARE_DURATION,
+                fps=FPS,
+                speed_scale=SPEED_SCALE,
+                seed=SEED,
+            )
+
+        def evaluator(population, index_pairs) -> List[float]:
+            return [comparator(population[i], population[j]) for i, j in index_pairs]
+
+        def run() -> int:
+            tournament(comparator, population, evaluator)
+            return 1
+
+        return run
+
+    return Case(case_name("tournament", players=num_players), "generations", setup)
+
+
+def _import(module: str):
+    # The RL and dataset benchmarks need gym / stable-baselines3 / torch
+    try:
+        return importlib.import_module(module)
+    except ImportError as error:
+        raise Skipped(str(error)) from error
+
+
+def _env_step(module: str) -> Case:
+    def setup() -> Workload:
+        environment = _import(module)
+        env = environment.Environment()
+        env.seed(SEED)
+        env.reset()
+        rng = np.random.default_rng(SEED)
+        actions = rng.uniform(
+            -1, 1, size=(ENV_STEPS_PER_CALL, *environment.action_shape)
+        ).astype(environment.action_dtype)
+
+        def run() -> int:
+            for action in actions:
+                _, _, done, _ = env.step(action)
+                if done:
+                    env.reset()
+            return ENV_STEPS_PER_CALL
+
+        return run
+
+    return Case(case_name("env_step", env=module.split(".")[1]), "steps", setup)
+
+
+def _env_reset(module: str) -> Case:
+    def setup() -> Workload:
+        env = _import(module).Environment()
+        env.seed(SEED)
+
+        def run() -> int:
+            for _ in range(ENV_STEPS_PER_CALL):
+                env.reset()
+            return ENV_STEPS_PER_CALL
+
+        return run
+
+    return Case(case_name("env_reset", env=module.split(".")[1]), "resets", setup)
+
+
+def _vec_env_step() -> Case:
+    def setup() -> Workload:
+        vec_environment = _import("neural.basic_offense.vec_environment")
+        vec_env = vec_environment.VecEnvironment(VEC_ENV_NUM_ENVS, SEED)
+        vec_env.reset()
+        rng = np.random.default_rng(SEED)
+        actions = rng.uniform(
+            -1,
+            1,
+            size=(ENV_STEPS_PER_CALL, VEC_ENV_NUM_ENVS, *vec_env.action_space.shape),
+        ).astype(vec_env.action_space.dtype)
+
+        def run() -> int:
+            for action in actions:
+                vec_env.step_async(action)
+                vec_env.step_wait()
+            return ENV_STEPS_PER_CALL * VEC_ENV_NUM_ENVS
+
+        return run
+
+    name = case_name("vec_env_step", env="basic_offense", num_envs=VEC_ENV_NUM_ENVS)
+    return Case(name, "steps", setup)
+
+
+def _dataset() -> Case:
+    def setup() -> Workload:
+        datasets = _import("neural.shot_value.datasets")
+        game = evaluation_game(1)
+
+        def run() -> int:
+            return len(datasets.PlayerDataset(DATASET_SAMPLES, game, seed=SEED))
+
+        return run
+
+    return Case(case_name("player_dataset"), "samples", setup)
+
+
+def all_cases() -> List[Case]:
+    cases = []
+    for num_players in PLAYER_COUNTS:
+        for strategy in STRATEGIES:
+            cases.append(_space_step(num_players, strategy, FPS, MAX_SUBSTEP_LENGTH))
+    for fps in FPS_SWEEP:
+        if fps != FPS:
+            cases.append(_space_step(3, "spaced", fps, MAX_SUBSTEP_LENGTH))
+    for substep in SUBSTEP_SWEEP:
+        if substep != MAX_SUBSTEP_LENGTH:
+            cases.append(_space_step(3, "spaced", FPS, substep))
+    for num_players in PLAYER_COUNTS:
+        for strategy in STRATEGIES:
+            cases.append(_run_headless(num_players, strategy))
+    for num_players in PLAYER_COUNTS:
+        cases.append(_compare(num_players))
+    cases.append(_compare(3, KINEMATIC_BACKEND))
+    cases.append(_tournament(3))
+    for module in ["neural.basic_offense.environment", "neural.movement.environment"]:
+        cases.append(_env_step(module))
+        cases.append(_env_reset(module))
+    cases.append(_vec_env_step())
+    cases.append(_dataset())
+    return cases
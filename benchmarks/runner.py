@@ -0,0 +1,100 @@
+from __future__ import annotations
+import json
+import platform
+import re
+import statistics
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from time import perf_counter
+from typing import Callable, Dict, List, Optional, Sequence
+
+# Runs one unit of work (or a batch of them) and returns how many units it did
+Workload = Callable[[], int]
+
+
+class Skipped(Exception):
+    """Raised by a case's setup when an optional dependency is missing"""
+
+
+@dataclass
+class Case:
+    name: str
+    unit: str
+    setup: Callable[[], Workload]
+
+
+@dataclass
+class Result:
+    name: str
+    unit: str
+    rate: float
+    rates: List[float]
+
+
+def case_name(base: str, **params) -> str:
+    if not params:
+        return base
+    formatted = ",".join(f"{key}={value}" for key, value in params.items())
+    return f"{base}[{formatted}]"
+
+
+def measure(case: Case, repeat: int, min_time: float) -> Result:
+    """
+    Units per second of the case's workload, the median of repeat samples that
+    each keep calling the workload for at least min_time seconds
+    """
+    workload = case.setup()
+    workload()
+    rates = []
+    for _ in range(repeat):
+        units = 0
+        start = perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time:
+            units += workload()
+            elapsed = perf_counter() - start
+        rates.append(units / elapsed)
+    return Result(case.name, case.unit, statistics.median(rates), rates)
+
+
+def select(cases: Sequence[Case], pattern: Optional[str]) -> List[Case]:
+    if pattern is None:
+        return list(cases)
+    compiled = re.compile(pattern)
+    return [case for case in cases if compiled.search(case.name)]
+
+
+def load_baseline(path: Path) -> Dict[str, Result]:
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    return {name: Result(**result) for name, result in data["results"].items()}
+
+
+def save_baseline(path: Path, results: Sequence[Result]):
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {result.name: asdict(result) for result in results},
+    }
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, indent=4, sort_keys=True)
+        file.write("\n")
+
+
+def regressions(
+    results: Sequence[Result], baseline: Dict[str, Result], threshold: float
+) -> List[str]:
+    # Cases slower than (1 - threshold) times their baseline rate
+    regressed = []
+    for result in results:
+        base = baseline.get(result.name)
+        if base is not None and result.rate < base.rate * (1 - threshold):
+            regressed.append(result.name)
+    return regressed
+
+
+def report_line(result: Result, base: Optional[Result]) -> str:
+    line = f"{result.name:<72} {result.rate:>12.1f} {result.unit}/s"
+    if base is not None:
+        line += f"  ({result.rate / base.rate - 1:+.1%} vs baseline)"
+    return line
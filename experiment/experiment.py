@@ -1,7 +1,8 @@
-from dataclasses import asdict
+from dataclasses import asdict, replace
 import pprint
 from experiment import initiate, run, parse
 import ga
+import runner
 
 FPS = 90
 SPEED_SCALE = 5.0
@@ -15,24 +16,19 @@ def load(args):
     args.fps = metadata.fps if args.fps is None else args.fps
     args.duration = metadata.duration if args.duration is None else args.duration
     args.speed_scale *= metadata.speed_scale
+    compare_kwargs = replace(
+        metadata, duration=args.duration, fps=args.fps, speed_scale=args.speed_scale
+    ).compare_kwargs()
     if args.evaluate:
 
         def comparator(parameters_1, parameters_2):
-            return ga.compare(
-                game,
-                parameters_1,
-                parameters_2,
-                duration=args.duration,
-                fps=args.fps,
-                speed_scale=args.speed_scale,
-            )
+            return ga.compare(game, parameters_1, parameters_2, **compare_kwargs)
 
-        serializer = ga.parameters.ParametersSerializer(
-            args.input_folder
-        ).jump_to_generation(args.generation)
         _, evaluation = ga.tournament(comparator, parameters_list)
         pprint.pprint(asdict(evaluation))
-        serializer.serialize_evaluation(evaluation)
+        with ga.parameters.ParametersSerializer(args.input_folder) as serializer:
+            serializer.jump_to_generation(args.generation)
+            serializer.serialize_evaluation(evaluation)
     elif args.visualize:
         index_1 = args.index_1
         index_2 = args.index_2
@@ -61,9 +57,7 @@ def load(args):
                 game,
                 parameters_list[args.index_1],
                 parameters_list[args.index_2],
-                fps=args.fps,
-                duration=args.duration,
-                speed_scale=args.speed_scale,
+                **compare_kwargs,
             )
             pprint.pprint(f"delta = {delta}")
 
@@ -75,6 +69,17 @@ def learn(args):
         generation_limit=args.generations,
         output_folder=args.output_folder,
         output_frequency=args.output_frequency,
+        scheduler=args.scheduler,
+        seed=args.seed,
+        variance_reduction=(
+            ga.VarianceReduction() if args.variance_reduction else None
+        ),
+        early_stopping=(
+            ga.EarlyStopping(at_possession_boundaries=True)
+            if args.early_stopping
+            else None
+        ),
+        backend=args.backend,
     )
 
 
@@ -87,15 +92,35 @@ def simulate(args, game=None):
             fps=args.fps,
             speed_scale=args.speed_scale,
             display_scale=args.display_scale,
+            profile=args.profile,
+            trace=args.trace,
         )
     else:
         assert args.duration is not None
         run.headless(
-            game, fps=args.fps, speed_scale=args.speed_scale, duration=args.duration
+            game,
+            fps=args.fps,
+            speed_scale=args.speed_scale,
+            duration=args.duration,
+            profile=args.profile,
+            trace=args.trace,
         )
 
 
+def replay(args):
+    trace = runner.Trace(args.input_folder)
+    num_players, other_num_players = trace.team_sizes
+    assert num_players == other_num_players, "Traces replay on the canonical game"
+    game = initiate.canonical_game(num_players)
+    run.replay(game, trace, fps=args.fps, display_scale=args.display_scale)
+
+
 def main():
     args = parse.parse()
-    table = {parse.SIMULATE: simulate, parse.LEARN: learn, parse.LOAD: load}
+    table = {
+        parse.SIMULATE: simulate,
+        parse.LEARN: learn,
+        parse.LOAD: load,
+        parse.REPLAY: replay,
+    }
     table[args.type](args)
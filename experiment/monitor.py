@@ -2,6 +2,7 @@ from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 from time import monotonic
 from bball.game import Game, Scoreboard
+from bball.instrumentation import Instrumentation
 from bball.player import Player
 from bball.utils import distance_between
 
@@ -24,6 +25,8 @@ def monitor_distance(game: Game):
 @dataclass
 class Monitor:
     allowed_distance_off_court: float = float("inf")
+    # Filled in by the Space that steps the game, reported under "profile"
+    instrumentation: Optional[Instrumentation] = None
     _max_distance: float = field(init=False, default=0.0)
     _start_time: Optional[float] = field(init=False, default=None)
     _simulation_time: float = field(init=False, default=0.0)
@@ -49,7 +52,7 @@ class Monitor:
             return round(value, 2)
 
         score = self._last_scoreboard.score
-        return {
+        stats = {
             "max_distance": format_float(self.max_distance),
             "runtime": format_float(self.runtime),
             "simulationtime": self.simulationtime,
@@ -59,6 +62,9 @@ class Monitor:
             ),
             "possessions": self._last_scoreboard.possessions,
         }
+        if self.instrumentation is not None:
+            stats["profile"] = self.instrumentation.stats()
+        return stats
 
     def monitor(self, game: Game, time_frame: float):
         if self._start_time is None:
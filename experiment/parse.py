@@ -1,9 +1,12 @@
 from typing import Optional
 import argparse
+from bball.space import BACKENDS, PYMUNK_BACKEND
+from ga.schedulers import SCHEDULER_NAMES
 
 SIMULATE = "simulate"
 LEARN = "learn"
 LOAD = "load"
+REPLAY = "replay"
 
 DURATION_SHORT = "-d"
 DURATION_LONG = "--duration"
@@ -12,6 +15,10 @@ DISPLAY_SCALE_LONG = "--display-scale"
 SPEED_SHORT = "-s"
 SPEED_LONG = "--speed"
 SPEED_DEST = "speed_scale"
+PROFILE_LONG = "--profile"
+PROFILE_HELP = "report time spent in each part of a simulation step"
+TRACE_LONG = "--trace"
+TRACE_HELP = "record every step to this folder for replay"
 
 
 def _build_simulation_parser(parser: argparse.ArgumentParser):
@@ -21,6 +28,8 @@ def _build_simulation_parser(parser: argparse.ArgumentParser):
         SPEED_SHORT, SPEED_LONG, dest=SPEED_DEST, type=float, default=1.0
     )
     parser.add_argument(DISPLAY_SCALE_SHORT, DISPLAY_SCALE_LONG, type=float)
+    parser.add_argument(PROFILE_LONG, action="store_true", help=PROFILE_HELP)
+    parser.add_argument(TRACE_LONG, type=str, help=TRACE_HELP)
 
 
 def _build_learning_subparser(parser: argparse.ArgumentParser):
@@ -29,6 +38,26 @@ def _build_learning_subparser(parser: argparse.ArgumentParser):
     parser.add_argument("output_folder", type=str)
     parser.add_argument("--output_frequency", type=int, default=10)
     parser.add_argument("--generations", type=int)
+    parser.add_argument(
+        "--scheduler", choices=SCHEDULER_NAMES, default=SCHEDULER_NAMES[0]
+    )
+    parser.add_argument("--seed", type=int, help="run seed, random if not given")
+    parser.add_argument(
+        "--variance-reduction",
+        action="store_true",
+        help="compare with common random numbers, antithetic and adaptive samples",
+    )
+    parser.add_argument(
+        "--early-stopping",
+        action="store_true",
+        help="end matchups at a possession boundary once they are decided",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default=PYMUNK_BACKEND,
+        help="space backend matchups are played in",
+    )
 
 
 def _build_loading_subparser(parser: argparse.ArgumentParser):
@@ -44,6 +73,16 @@ def _build_loading_subparser(parser: argparse.ArgumentParser):
     parser.add_argument("-i1", "--index_1", type=int)
     parser.add_argument("-i2", "--index_2", type=int)
     parser.add_argument("-e", "--evaluate", action="store_true")
+    parser.add_argument(PROFILE_LONG, action="store_true", help=PROFILE_HELP)
+    parser.add_argument(TRACE_LONG, type=str, help=TRACE_HELP)
+
+
+def _build_replay_subparser(parser: argparse.ArgumentParser):
+    parser.add_argument("input_folder", type=str)
+    parser.add_argument("fps", type=int)
+    parser.add_argument(
+        DISPLAY_SCALE_SHORT, DISPLAY_SCALE_LONG, type=float, required=True
+    )
 
 
 def _build_parser(parser: argparse.ArgumentParser):
@@ -52,6 +91,7 @@ def _build_parser(parser: argparse.ArgumentParser):
     _build_simulation_parser(subparsers.add_parser(SIMULATE))
     _build_learning_subparser(subparsers.add_parser(LEARN))
     _build_loading_subparser(subparsers.add_parser(LOAD))
+    _build_replay_subparser(subparsers.add_parser(REPLAY))
     return parser
 
 
@@ -1,28 +1,69 @@
+from contextlib import nullcontext
 from pprint import pprint
-from runner import run, run_headless
+from typing import Optional
+from runner import run, run_headless, replay as replay_trace, Trace, TraceRecorder
 from experiment.monitor import Monitor
-from bball import Game
-
-
-def visualize(game: Game, fps: int, speed_scale: float, display_scale: float):
-    monitor = Monitor()
-    run(
-        game,
-        fps=fps,
-        speed_scale=speed_scale,
-        display_scale=display_scale,
-        monitor=lambda time_frame: monitor.monitor(game, time_frame),
-    )
+from bball import Game, Instrumentation
+
+
+def _monitor(profile: bool) -> Monitor:
+    return Monitor(instrumentation=Instrumentation() if profile else None)
+
+
+def _recorder(game: Game, trace: Optional[str]):
+    return nullcontext() if trace is None else TraceRecorder(trace, game)
+
+
+def _monitoring_function(game: Game, monitor: Monitor, recorder):
+    def monitoring_function(time_frame: float):
+        if recorder is not None:
+            recorder(time_frame)
+        monitor.monitor(game, time_frame)
+
+    return monitoring_function
+
+
+def visualize(
+    game: Game,
+    fps: int,
+    speed_scale: float,
+    display_scale: float,
+    profile=False,
+    trace: Optional[str] = None,
+):
+    monitor = _monitor(profile)
+    with _recorder(game, trace) as recorder:
+        run(
+            game,
+            fps=fps,
+            speed_scale=speed_scale,
+            display_scale=display_scale,
+            monitor=_monitoring_function(game, monitor, recorder),
+            instrumentation=monitor.instrumentation,
+        )
     pprint(monitor.stats())
 
 
-def headless(game: Game, fps: int, speed_scale: float, duration: float):
-    monitor = Monitor()
-    run_headless(
-        game,
-        fps=fps,
-        speed_scale=speed_scale,
-        duration=duration,
-        monitor=lambda time_frame: monitor.monitor(game, time_frame),
-    )
+def headless(
+    game: Game,
+    fps: int,
+    speed_scale: float,
+    duration: float,
+    profile=False,
+    trace: Optional[str] = None,
+):
+    monitor = _monitor(profile)
+    with _recorder(game, trace) as recorder:
+        run_headless(
+            game,
+            fps=fps,
+            speed_scale=speed_scale,
+            duration=duration,
+            monitor=_monitoring_function(game, monitor, recorder),
+            instrumentation=monitor.instrumentation,
+        )
     pprint(monitor.stats())
+
+
+def replay(game: Game, trace: Trace, fps: int, display_scale: float):
+    replay_trace(game, trace.frames(), fps=fps, display_scale=display_scale)
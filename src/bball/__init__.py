@@ -1,5 +1,7 @@
 from .player import Player, PlayerAttributes
 from .space import Space
+from .instrumentation import Instrumentation
+from .batch_space import BatchSpace
 from .ball import Ball, BallMode
 from .court import Court, Hoop, ThreePointLine, RectangleThreePointLine
 from .shot_probability import (
@@ -7,7 +9,7 @@ from .shot_probability import (
     LinearShotProbability,
     GuaranteedShotProbability,
 )
-from .game import Game, GameSettings, Scoreboard, Score, Possessions
+from .game import Game, GameSettings, GameState, Scoreboard, Score, Possessions
 from .team import Team, Teams
 from .behavior import ReachVelocity, Stop, ReachPosition
 from .draw import draw_game, DrawInterface, Color, Corners
@@ -0,0 +1,47 @@
+import numpy as np
+
+# Batched versions of the helpers in bball.utils, points and vectors are arrays
+# of shape (..., 2) and angles / lengths are arrays of shape (...)
+
+
+def normalized_angles_degrees(degrees: np.ndarray) -> np.ndarray:
+    normalized = np.mod(degrees + 180.0, 360.0) - 180.0
+    return np.where(normalized >= 180.0, normalized - 360.0, normalized)
+
+
+def distances_between(points_1: np.ndarray, points_2: np.ndarray) -> np.ndarray:
+    offsets = points_1 - points_2
+    return np.hypot(offsets[..., 0], offsets[..., 1])
+
+
+def vector_lengths(vectors: np.ndarray) -> np.ndarray:
+    return np.hypot(vectors[..., 0], vectors[..., 1])
+
+
+def vector_angles_degrees(vectors: np.ndarray) -> np.ndarray:
+    return normalized_angles_degrees(
+        np.degrees(np.arctan2(vectors[..., 1], vectors[..., 0]))
+    )
+
+
+def angles_degrees_to_vectors(
+    angles_degrees: np.ndarray, lengths: np.ndarray
+) -> np.ndarray:
+    angles = np.radians(angles_degrees)
+    return np.stack([lengths * np.cos(angles), lengths * np.sin(angles)], axis=-1)
+
+
+def dot_products(vectors_1: np.ndarray, vectors_2: np.ndarray) -> np.ndarray:
+    return vectors_1[..., 0] * vectors_2[..., 0] + vectors_1[..., 1] * vectors_2[..., 1]
+
+
+def interpolate_points(
+    points_1: np.ndarray, points_2: np.ndarray, interps: np.ndarray
+) -> np.ndarray:
+    return points_1 + (points_2 - points_1) * np.asarray(interps)[..., np.newaxis]
+
+
+def in_between_of(
+    candidates: np.ndarray, extremes_1: np.ndarray, extremes_2: np.ndarray
+) -> np.ndarray:
+    return dot_products(candidates - extremes_1, extremes_2 - candidates) >= 0
@@ -1,2 +1,2 @@
-from .ball import Ball
+from .ball import Ball, BallSnapshot
 from .ball_mode import BallMode
@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import Optional, TYPE_CHECKING, Type, TypeVar, List
+from copy import copy
+from dataclasses import dataclass
+from typing import Optional, TYPE_CHECKING, Type, TypeVar, List, Callable
 from bball.utils import coords_to_string, Point
 from bball.ball.ball_mode import BallMode
 from bball.ball.state import BallState
@@ -10,11 +12,11 @@ from bball.ball.mid_shot import MidShot
 from bball.ball.reached_shot import ReachedShot, ShotParameters
 from bball.ball.dead_ball import DeadBall
 
-
 if TYPE_CHECKING:
     from bball.player import Player
 
 T = TypeVar("T")
+TransitionListener = Callable[[BallMode], None]
 
 
 def checked_type(state: BallState, state_type: Type[T]) -> T:
@@ -22,21 +24,33 @@ def checked_type(state: BallState, state_type: Type[T]) -> T:
     return state
 
 
+@dataclass(frozen=True)
+class BallSnapshot:
+    state: BallState
+    position: Point
+    last_belonged_to: Optional[Player]
+
+
 class Ball:
     _position: Point
     _last_belonged_to: Optional[Player]
     _state: BallState
+    _listener: Optional[TransitionListener]
 
     def __init__(self):
         self._position = (0, 0)
         self._last_belonged_to = None
         self._state = DeadBall(False)
+        self._listener = None
 
     def __repr__(self):
         return f"Ball(position = {coords_to_string(self.position)}, mode = {self.mode})"
 
     @property
     def position(self) -> Point:
+        lazy_position = self._state._lazy_position()
+        if lazy_position is not None:
+            return lazy_position
         return self._position
 
     @property
@@ -66,9 +80,26 @@ class Ball:
     def _step(self, time_frame: float) -> bool:
         return self._state._step(time_frame)
 
+    def _snapshot(self) -> BallSnapshot:
+        # Ball states only mutate their own scalar fields, a shallow copy keeps
+        # the snapshot independent of further steps
+        return BallSnapshot(copy(self._state), self._position, self._last_belonged_to)
+
+    def _restore(self, snapshot: BallSnapshot) -> Ball:
+        self._state = copy(snapshot.state)
+        self._position = snapshot.position
+        self._last_belonged_to = snapshot.last_belonged_to
+        self._state._resume()
+        return self
+
     def _transition(self, prior_state_type: Type[BallState], state: BallState) -> Ball:
         checked_type(self._state, prior_state_type)._reset()
+        return self._enter(state)
+
+    def _enter(self, state: BallState) -> Ball:
         self._state = state
+        if self._listener is not None:
+            self._listener(state.mode())
         return self
 
     def turnover(self) -> Ball:
@@ -112,3 +143,9 @@ class Ball:
 
     def jump_ball_won_by(self, receiver: Player) -> Ball:
         return self._transition(DeadBall, HeldBall(receiver, self))
+
+    def reset_held_by(self, receiver: Player) -> Ball:
+        # Valid from any state, used to start episodes / possessions directly.
+        # The prior state is reset first since it may belong to the receiver
+        self._state._reset()
+        return self._enter(HeldBall(receiver, self))
@@ -1,11 +1,12 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 from bball.ball.state import BallState
 from bball.ball.ball_mode import BallMode
 
 if TYPE_CHECKING:
     from bball.player import Player
     from bball.ball import Ball
+    from bball.utils import Point
 
 
 class HeldBall(BallState):
@@ -19,11 +20,14 @@ class HeldBall(BallState):
         ball._last_belonged_to = receiver
         ball._position = receiver.position
 
-    def _step(self, _time_frame: float) -> bool:
-        self._ball._position = self._ball_handler.position
-        return False
+    def _lazy_position(self) -> Optional[Point]:
+        return self._ball_handler.position
+
+    def _resume(self):
+        self._ball_handler._ball = self._ball
 
     def _reset(self):
+        self._ball._position = self._ball_handler.position
         self._ball_handler._ball = None
 
     @staticmethod
@@ -1,15 +1,15 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
-import pymunk
+from typing import TYPE_CHECKING, Optional
 from bball.validator import valid_pass_velocity
-from bball.utils import convert_to_tuple, approx
+from bball.utils import approx, distance_between, interpolate_points
 from bball.ball.state import BallState
 from bball.ball.ball_mode import BallMode
 
 if TYPE_CHECKING:
     from bball.player import Player
     from bball.ball import Ball
+    from bball.utils import Point
 
 
 @dataclass
@@ -22,7 +22,7 @@ class MidPass(BallState):
     _players_involved: PassPlayers
     _ball: Ball
     _pass_velocity: float
-    _original_position: pymunk.Vec2d
+    _original_position: Point
     _time_since_pass: float
 
     def __init__(self, ball: Ball, receiver: Player, pass_velocity: float):
@@ -30,7 +30,7 @@ class MidPass(BallState):
         passer = ball.belongs_to
         self._players_involved = PassPlayers(passer, receiver)
         self._ball = ball
-        self._original_position = pymunk.Vec2d(*passer.position)
+        self._original_position = passer.position
         self._pass_velocity = pass_velocity
         self._time_since_pass = 0
 
@@ -39,21 +39,29 @@ class MidPass(BallState):
         return True
 
     def _step(self, time_step: float) -> bool:
+        # Receivers can be moved by collisions or placed anywhere, so the
+        # distance is checked every step
         self._time_since_pass += time_step
         receiver_position = self._players_involved.receiver.position
-        distance = self._original_position.get_distance(receiver_position)
+        distance = distance_between(self._original_position, receiver_position)
         covered = self._pass_velocity * self._time_since_pass
         if approx(covered, distance) or covered > distance:
             return self._complete_pass()
-        fraction_completed = covered / distance
-        assert 0.0 <= fraction_completed <= 1.0
-        self._ball._position = convert_to_tuple(
-            self._original_position.interpolate_to(
-                receiver_position, fraction_completed
-            )
-        )
         return False
 
+    def _lazy_position(self) -> Optional[Point]:
+        receiver_position = self._players_involved.receiver.position
+        distance = distance_between(self._original_position, receiver_position)
+        covered = self._pass_velocity * self._time_since_pass
+        if covered >= distance:
+            return receiver_position
+        return interpolate_points(
+            self._original_position, receiver_position, covered / distance
+        )
+
+    def _reset(self):
+        self._ball._position = self._lazy_position()
+
     @staticmethod
     def mode() -> BallMode:
         return BallMode.MIDPASS
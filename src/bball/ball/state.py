@@ -1,14 +1,25 @@
 from abc import ABC, abstractmethod
+from typing import Optional
 from bball.ball.ball_mode import BallMode
+from bball.utils import Point
 
 
 class BallState(ABC):
     def _step(self, _time_frame: float) -> bool:
         return False
 
+    def _lazy_position(self) -> Optional[Point]:
+        # States whose ball position follows a player or a flight path compute
+        # it on read instead of every step, None means use Ball._position
+        return None
+
     def _reset(self) -> None:
         return
 
+    def _resume(self) -> None:
+        # Called when a snapshot of this state is restored into its ball
+        return
+
     @staticmethod
     @abstractmethod
     def mode() -> BallMode:
@@ -0,0 +1,282 @@
+from __future__ import annotations
+import math
+from typing import Sequence, TYPE_CHECKING
+import numpy as np
+from bball.ball import BallMode
+from bball.ball.held_ball import HeldBall
+from bball.ball.mid_pass import MidPass
+from bball.ball.mid_shot import MidShot
+from bball.utils import DEFAULT_EPS
+from bball.array_utils import normalized_angles_degrees, vector_lengths
+from bball.validator import (
+    valid_multiplier,
+    valid_shot_velocity,
+    valid_pass_velocity,
+)
+
+if TYPE_CHECKING:
+    from bball.game import Game
+    from bball.player import Player
+
+NO_PLAYER = -1
+
+
+def _players_of(game: Game) -> Sequence[Player]:
+    return [player for team in game.teams for player in team]
+
+
+class BatchSpace:
+    """
+    Steps many games in lockstep, storing the kinematic state of every player
+    and ball as (games, players, ...) arrays instead of pymunk bodies.
+
+    Reproduces PhysicsObject.turn / accelerate and the max velocity / decay
+    clamp of velocity_func_with_limit_and_decay, but does not resolve collisions
+    and does not apply game rules (scoring, inbounding, shot clock), those are
+    left to the caller which can inspect ball_modes after each step.
+    """
+
+    positions: np.ndarray
+    velocities: np.ndarray
+    orientations_degrees: np.ndarray
+    max_velocities: np.ndarray
+    max_accelerations: np.ndarray
+    max_turn_degrees: np.ndarray
+    velocity_decays: np.ndarray
+    ball_modes: np.ndarray
+    ball_positions: np.ndarray
+    ball_holders: np.ndarray
+    ball_receivers: np.ndarray
+    ball_origins: np.ndarray
+    ball_targets: np.ndarray
+    ball_velocities: np.ndarray
+    ball_flight_times: np.ndarray
+    _turn_degrees: np.ndarray
+    _accelerations: np.ndarray
+
+    def __init__(self, num_games: int, num_players: int):
+        assert num_games > 0
+        shape = (num_games, num_players)
+        self.positions = np.zeros((*shape, 2))
+        self.velocities = np.zeros((*shape, 2))
+        self.orientations_degrees = np.zeros(shape)
+        self.max_velocities = np.ones(shape)
+        self.max_accelerations = np.ones(shape)
+        self.max_turn_degrees = np.ones(shape)
+        self.velocity_decays = np.zeros(shape)
+
+        self.ball_modes = np.full(num_games, BallMode.DEAD.value)
+        self.ball_positions = np.zeros((num_games, 2))
+        self.ball_holders = np.full(num_games, NO_PLAYER)
+        self.ball_receivers = np.full(num_games, NO_PLAYER)
+        self.ball_origins = np.zeros((num_games, 2))
+        self.ball_targets = np.zeros((num_games, 2))
+        self.ball_velocities = np.zeros(num_games)
+        self.ball_flight_times = np.zeros(num_games)
+
+        self._turn_degrees = np.zeros(shape)
+        self._accelerations = np.zeros(shape)
+
+    @staticmethod
+    def from_games(games: Sequence[Game]) -> BatchSpace:
+        players_per_game = [_players_of(game) for game in games]
+        num_players = len(players_per_game[0])
+        assert all(len(players) == num_players for players in players_per_game)
+        batch = BatchSpace(len(games), num_players)
+        for game_index, (game, players) in enumerate(zip(games, players_per_game)):
+            for player_index, player in enumerate(players):
+                batch._load_player(game_index, player_index, player)
+            batch._load_ball(game_index, game, players)
+        return batch
+
+    def _load_player(self, game_index: int, player_index: int, player: Player):
+        index = (game_index, player_index)
+        physical = player.physical_attributes
+        self.positions[index] = player.position
+        self.velocities[index] = player.velocity
+        self.orientations_degrees[index] = player.orientation_degrees
+        self.max_velocities[index] = physical.max_velocity
+        self.max_accelerations[index] = physical.max_acceleration
+        self.max_turn_degrees[index] = physical.max_turn_degrees
+        self.velocity_decays[index] = physical.velocity_decay
+
+    def _load_ball(self, game_index: int, game: Game, players: Sequence[Player]):
+        ball = game.ball
+        state = ball._state
+        self.ball_modes[game_index] = ball.mode.value
+        self.ball_positions[game_index] = ball.position
+        if isinstance(state, HeldBall):
+            self.ball_holders[game_index] = players.index(state._ball_handler)
+        elif isinstance(state, MidShot):
+            self.ball_origins[game_index] = tuple(state._original_position)
+            self.ball_targets[game_index] = state._target
+            self.ball_velocities[game_index] = state._shot_velocity
+            self.ball_flight_times[game_index] = state._time_since_shot
+        elif isinstance(state, MidPass):
+            receiver = state._players_involved.receiver
+            self.ball_receivers[game_index] = players.index(receiver)
+            self.ball_origins[game_index] = tuple(state._original_position)
+            self.ball_velocities[game_index] = state._pass_velocity
+            self.ball_flight_times[game_index] = state._time_since_pass
+
+    def apply_to(self, games: Sequence[Game]) -> BatchSpace:
+        """
+        Writes the player kinematics back into games (eg. for drawing),
+        ball states are not written back
+        """
+        assert len(games) == self.num_games
+        for game_index, game in enumerate(games):
+            for player_index, player in enumerate(_players_of(game)):
+                index = (game_index, player_index)
+                player._physics.position = tuple(self.positions[index])
+                player._physics.orientation_degrees = float(
+                    self.orientations_degrees[index]
+                )
+                player._physics.velocity = tuple(self.velocities[index])
+        return self
+
+    @property
+    def num_games(self) -> int:
+        return self.positions.shape[0]
+
+    @property
+    def num_players(self) -> int:
+        return self.positions.shape[1]
+
+    def mode_mask(self, mode: BallMode) -> np.ndarray:
+        return self.ball_modes == mode.value
+
+    def turn(self, multipliers: np.ndarray) -> BatchSpace:
+        assert multipliers.shape == self._turn_degrees.shape
+        assert valid_multiplier(multipliers.min(initial=0.0))
+        assert valid_multiplier(multipliers.max(initial=0.0))
+        self._turn_degrees = multipliers * self.max_turn_degrees
+        return self
+
+    def accelerate(self, multipliers: np.ndarray) -> BatchSpace:
+        assert multipliers.shape == self._accelerations.shape
+        assert valid_multiplier(multipliers.min(initial=0.0))
+        assert valid_multiplier(multipliers.max(initial=0.0))
+        self._accelerations = multipliers * self.max_accelerations
+        return self
+
+    def shoot_at(
+        self, game_indices: np.ndarray, targets: np.ndarray, shot_velocity: float
+    ) -> BatchSpace:
+        assert valid_shot_velocity(shot_velocity)
+        assert (self.ball_modes[game_indices] == BallMode.HELD.value).all()
+        holders = self.ball_holders[game_indices]
+        self.ball_modes[game_indices] = BallMode.MIDSHOT.value
+        self.ball_origins[game_indices] = self.positions[game_indices, holders]
+        self.ball_targets[game_indices] = targets
+        self.ball_velocities[game_indices] = shot_velocity
+        self.ball_flight_times[game_indices] = 0.0
+        self.ball_holders[game_indices] = NO_PLAYER
+        return self
+
+    def pass_to(
+        self, game_indices: np.ndarray, receivers: np.ndarray, pass_velocity: float
+    ) -> BatchSpace:
+        assert valid_pass_velocity(pass_velocity)
+        assert (self.ball_modes[game_indices] == BallMode.HELD.value).all()
+        holders = self.ball_holders[game_indices]
+        self.ball_modes[game_indices] = BallMode.MIDPASS.value
+        self.ball_origins[game_indices] = self.positions[game_indices, holders]
+        self.ball_receivers[game_indices] = receivers
+        self.ball_velocities[game_indices] = pass_velocity
+        self.ball_flight_times[game_indices] = 0.0
+        self.ball_holders[game_indices] = NO_PLAYER
+        return self
+
+    def step(self, time_frame: float, max_substep_length=None) -> BatchSpace:
+        substeps_per_unit_time = (
+            1
+            if max_substep_length is None
+            else max(1, math.ceil(time_frame / max_substep_length))
+        )
+        time_per_substep = time_frame / substeps_per_unit_time
+        for _ in range(substeps_per_unit_time):
+            self._substep(time_per_substep)
+        self._turn_degrees = np.zeros_like(self._turn_degrees)
+        self._accelerations = np.zeros_like(self._accelerations)
+        return self
+
+    def _substep(self, time_frame: float):
+        self._turn(time_frame)
+        self._accelerate(time_frame)
+        self._integrate(time_frame)
+        self._step_balls(time_frame)
+
+    def _turn(self, time_frame: float):
+        angles = np.radians(self._turn_degrees) * time_frame
+        self.orientations_degrees = normalized_angles_degrees(
+            self.orientations_degrees + np.degrees(angles)
+        )
+        cos, sin = np.cos(angles), np.sin(angles)
+        velocity_x = self.velocities[..., 0].copy()
+        velocity_y = self.velocities[..., 1]
+        self.velocities[..., 0] = velocity_x * cos - velocity_y * sin
+        self.velocities[..., 1] = velocity_x * sin + velocity_y * cos
+
+    def _accelerate(self, time_frame: float):
+        # Impulse of acceleration * mass * time_frame applied to a body of mass
+        heading = np.radians(self.orientations_degrees)
+        velocity_change = self._accelerations * time_frame
+        self.velocities[..., 0] += velocity_change * np.cos(heading)
+        self.velocities[..., 1] += velocity_change * np.sin(heading)
+
+    def _integrate(self, time_frame: float):
+        # pymunk integrates positions before velocities
+        self.positions += self.velocities * time_frame
+        self.velocities *= (1.0 - self.velocity_decays)[..., np.newaxis]
+        speeds = vector_lengths(self.velocities)
+        too_fast = speeds > self.max_velocities
+        scale = np.ones_like(speeds)
+        scale[too_fast] = self.max_velocities[too_fast] / speeds[too_fast]
+        self.velocities *= scale[..., np.newaxis]
+
+    def _step_balls(self, time_frame: float):
+        held = np.flatnonzero(self.mode_mask(BallMode.HELD))
+        self.ball_positions[held] = self.positions[held, self.ball_holders[held]]
+
+        mid_shot = np.flatnonzero(self.mode_mask(BallMode.MIDSHOT))
+        if mid_shot.size > 0:
+            self._step_flights(
+                mid_shot, self.ball_targets[mid_shot], BallMode.REACHEDSHOT, time_frame
+            )
+
+        mid_pass = np.flatnonzero(self.mode_mask(BallMode.MIDPASS))
+        if mid_pass.size > 0:
+            receivers = self.ball_receivers[mid_pass]
+            destinations = self.positions[mid_pass, receivers]
+            self._step_flights(
+                mid_pass, destinations, BallMode.RECEIVEDPASS, time_frame
+            )
+
+    def _step_flights(
+        self,
+        game_indices: np.ndarray,
+        destinations: np.ndarray,
+        completed_mode: BallMode,
+        time_frame: float,
+    ):
+        self.ball_flight_times[game_indices] += time_frame
+        covered = self.ball_flight_times[game_indices] * (
+            self.ball_velocities[game_indices]
+        )
+        origins = self.ball_origins[game_indices]
+        offsets = destinations - origins
+        distances = vector_lengths(offsets)
+        completed = covered > distances - DEFAULT_EPS
+        fractions = np.divide(
+            covered, distances, out=np.ones_like(covered), where=~completed
+        )
+        in_flight_positions = origins + offsets * fractions[:, np.newaxis]
+
+        self.ball_modes[game_indices[completed]] = completed_mode.value
+        if completed_mode == BallMode.REACHEDSHOT:
+            self.ball_positions[game_indices[completed]] = destinations[completed]
+        self.ball_positions[game_indices[~completed]] = in_flight_positions[~completed]
+
+    def held_by(self, player_index: int) -> np.ndarray:
+        return self.mode_mask(BallMode.HELD) & (self.ball_holders == player_index)
@@ -0,0 +1,74 @@
+# Closed form versions of the search based helpers in bball.behavior.utils,
+# which are kept as the reference implementation
+import math
+from typing import Tuple
+from bball.utils import clamp
+from bball.behavior.utils import distance_covered
+
+
+def _positive_root(a: float, b: float, c: float) -> float:
+    # Larger root of a*x^2 + b*x + c for c <= 0 <= a, b, written to avoid
+    # cancellation when a is small
+    if c >= 0:
+        return 0.0
+    return -2 * c / (b + math.sqrt(b * b - 4 * a * c))
+
+
+def steady_steps_needed(
+    a_max: float, v_curr: float, distance: float, time_frame: float
+) -> int:
+    half_step_acceleration = a_max * time_frame**2 / 2
+    estimate = _positive_root(
+        half_step_acceleration, v_curr * time_frame + half_step_acceleration, -distance
+    )
+    num_steps = max(0, math.ceil(estimate))
+    while (
+        num_steps > 0
+        and distance_covered(a_max, v_curr, num_steps - 1, time_frame) >= distance
+    ):
+        num_steps -= 1
+    while distance_covered(a_max, v_curr, num_steps, time_frame) < distance:
+        num_steps += 1
+    return num_steps
+
+
+def min_steps_needed(
+    a_max: float, v_curr: float, distance: float, time_frame: float
+) -> float:
+    slowdown_steps = v_curr / (a_max * time_frame)
+    slowdown_distance = slowdown_steps * v_curr * time_frame / 2
+    extra_steps = _positive_root(
+        a_max * time_frame**2 / 4, v_curr * time_frame, slowdown_distance - distance
+    )
+    return slowdown_steps + extra_steps
+
+
+def _largest_acceleration_within(
+    a_max: float, constant: float, coefficient: float, distance: float
+) -> float:
+    # Largest acceleration in [-a_max, a_max] for which
+    # constant + coefficient * acceleration <= distance
+    if coefficient <= 0:
+        return a_max if constant <= distance else -a_max
+    return clamp((distance - constant) / coefficient, -a_max, a_max)
+
+
+def acceleration_for(
+    a_max: float, v_curr: float, distance: float, time_frame: float
+) -> Tuple[float, int]:
+    steps = 2 * steady_steps_needed(a_max, v_curr, distance / 2, time_frame)
+    half_steps = steps / 2
+    constant = 2 * v_curr * half_steps * time_frame
+    coefficient = half_steps * (half_steps + 1) * time_frame**2
+    return _largest_acceleration_within(a_max, constant, coefficient, distance), steps
+
+
+def highest_acceleration_without_overshoot(
+    a_max: float, v_curr: float, distance: float, time_frame: float
+) -> float:
+    steps = min_steps_needed(a_max, v_curr, distance, time_frame)
+    constant = (
+        v_curr * time_frame * steps - (steps - 1) * steps / 2 * a_max * time_frame**2
+    )
+    coefficient = steps * time_frame**2
+    return _largest_acceleration_within(a_max, constant, coefficient, distance)
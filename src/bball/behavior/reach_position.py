@@ -12,7 +12,7 @@ from bball.behavior.behavior_interface import BehaviorInterface
 from bball.behavior.reach_orientation import ReachOrientation
 from bball.behavior.stop import Stop
 from bball.behavior.scheduled_acceleration import ScheduledAcceleration
-from bball.behavior.utils import acceleration_for
+from bball.behavior.kinematics import acceleration_for
 
 
 @dataclass
@@ -42,9 +42,9 @@ class ReachPosition(BehaviorInterface):
             )
             self._scheduled_behavior = ScheduledAcceleration(
                 [
-                    (target_acceleration, num_steps / 2),
+                    (target_acceleration, num_steps // 2),
                     (0, 1),
-                    (-target_acceleration, num_steps / 2),
+                    (-target_acceleration, num_steps // 2),
                 ]
             )
         return self._scheduled_behavior.drive(player, self._time_frame)
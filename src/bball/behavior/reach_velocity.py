@@ -1,14 +1,13 @@
 from dataclasses import dataclass, field
-from typing import Optional, Callable
+from typing import Optional
 from bball.utils import (
     Vector,
+    clamp,
     close_to,
     ZERO_VECTOR,
     vector_angle_degrees,
-    vector_length,
     angle_degrees_to_vector,
-    multiply_by,
-    sum_of,
+    dot_product,
     difference_between,
 )
 from bball.player import Player
@@ -16,46 +15,17 @@ from bball.behavior.behavior_interface import BehaviorInterface
 from bball.behavior.reach_orientation import ReachOrientation
 
 
-def ternary_search_for_min(
-    func: Callable[[float], float],
-    lower_bound: float,
-    upper_bound: float,
-    iterations: int = 50,
-    tolerance: float = 10**-6,
-) -> float:
-    assert lower_bound <= upper_bound
-    for _ in range(iterations):
-        gap = upper_bound - lower_bound
-        lower_third = lower_bound + gap / 3
-        upper_third = upper_bound - gap / 3
-        if func(lower_third) > func(upper_third):
-            lower_bound = lower_third
-        else:
-            upper_bound = upper_third
-    lower_eval = func(lower_bound)
-    upper_eval = func(upper_bound)
-    err = abs(lower_eval - upper_eval)
-    assert err <= tolerance
-    return lower_bound
-
-
 def ideal_acceleration_multiplier(player: Player, v_target: Vector, time_frame: float):
-    v_curr = player.velocity
+    # v_next = v_curr + a_coeff * time_frame * a_unit, the distance to v_target
+    # is minimized by projecting the remaining difference onto a_unit
     a_unit = angle_degrees_to_vector(
         player.orientation_degrees, player.physical_attributes.max_acceleration
     )
-
-    def remaining_difference_after_accelerating(a_coeff):
-        a_applied = multiply_by(a_unit, a_coeff * time_frame)
-        v_next = sum_of(a_applied, v_curr)
-        v_diff = difference_between(v_target, v_next)
-        diff_magnitude = vector_length(v_diff)
-        return diff_magnitude
-
-    ideal_a_coeff = ternary_search_for_min(
-        remaining_difference_after_accelerating, -1.0, 1.0
-    )
-    return ideal_a_coeff
+    scale = dot_product(a_unit, a_unit) * time_frame
+    if scale <= 0:
+        return 0.0
+    v_diff = difference_between(v_target, player.velocity)
+    return clamp(dot_product(v_diff, a_unit) / scale, -1.0, 1.0)
 
 
 @dataclass
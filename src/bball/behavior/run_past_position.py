@@ -14,10 +14,8 @@ from bball.player import Player
 from bball.behavior.behavior_interface import BehaviorInterface
 from bball.behavior.reach_orientation import ReachOrientation
 from bball.behavior.stop import Stop
-from bball.behavior.utils import (
-    highest_acceleration_without_overshoot,
-    acceleration_multiplier,
-)
+from bball.behavior.utils import acceleration_multiplier
+from bball.behavior.kinematics import highest_acceleration_without_overshoot
 
 
 @dataclass
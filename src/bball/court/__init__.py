@@ -1,3 +1,4 @@
 from .court import Court, HalfCourt
 from .three_point_line import ThreePointLine, RectangleThreePointLine
 from .hoop import Hoop
+from .shot_value_grid import ShotValueGrid, shot_value_grid_for
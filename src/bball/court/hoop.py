@@ -1,12 +1,17 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING
 from dataclasses import dataclass
+import numpy as np
 from bball.court.three_point_line import ThreePointLine
 from bball.utils import distance_between
+from bball.array_utils import distances_between
 
 if TYPE_CHECKING:
     from bball.utils import Point
     from bball.player import Player
+    from bball.shot_probability import ShotProbability
+
+MAX_SHOT_VALUE = 3
 
 
 @dataclass
@@ -30,7 +35,7 @@ class Hoop:
         return self.three_point_line.is_beyond(position)
 
     def value_of_shot_from(self, position: Point) -> int:
-        return 3 if self.is_beyond_three_point_line(position) else 2
+        return MAX_SHOT_VALUE if self.is_beyond_three_point_line(position) else 2
 
     def expected_value_of_shot_by(self, player: Player) -> float:
         distance = distance_between(player.position, self.position)
@@ -38,3 +43,15 @@ class Hoop:
         probability = probability_function(distance)
         value = self.value_of_shot_from(player.position)
         return value * probability
+
+    def values_of_shots_from(self, positions: np.ndarray) -> np.ndarray:
+        return np.where(self.three_point_line.are_beyond(positions), MAX_SHOT_VALUE, 2)
+
+    def expected_values_of_shots_from(
+        self, positions: np.ndarray, shot_probability: ShotProbability
+    ) -> np.ndarray:
+        # Batched expected_value_of_shot_by for players at (..., 2) positions
+        positions = np.asarray(positions, dtype=float)
+        distances = distances_between(positions, np.array(self.position))
+        probabilities = shot_probability.probabilities(distances)
+        return self.values_of_shots_from(positions) * probabilities
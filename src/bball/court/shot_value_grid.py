@@ -0,0 +1,130 @@
+from __future__ import annotations
+import math
+from dataclasses import astuple, is_dataclass
+from typing import Any, Dict, Tuple, TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    from bball.court.hoop import Hoop
+    from bball.shot_probability import ShotProbability
+    from bball.utils import Point
+
+DEFAULT_SHOT_VALUE_GRID_RESOLUTION = 4.0
+
+
+class ShotValueGrid:
+    """
+    Expected value of a shot at hoop, sampled every 1 / resolution units over
+    the court and bilinearly interpolated in between. Positions off the court
+    are clamped to its edges and the three point line is blurred over one cell
+    """
+
+    values: np.ndarray
+    _dimensions: Tuple[float, float]
+    _columns: list
+    _cell_width: float
+    _cell_height: float
+    _last_column: int
+    _last_row: int
+
+    def __init__(
+        self,
+        court_dimensions: Tuple[float, float],
+        hoop: Hoop,
+        shot_probability: ShotProbability,
+        resolution: float,
+    ):
+        assert resolution > 0
+        width, height = court_dimensions
+        self._dimensions = (width, height)
+        num_columns = max(2, math.ceil(width * resolution) + 1)
+        num_rows = max(2, math.ceil(height * resolution) + 1)
+        self._cell_width = width / (num_columns - 1)
+        self._cell_height = height / (num_rows - 1)
+        self._last_column = num_columns - 1
+        self._last_row = num_rows - 1
+        xs, ys = np.meshgrid(
+            np.linspace(0.0, width, num_columns),
+            np.linspace(0.0, height, num_rows),
+            indexing="ij",
+        )
+        positions = np.stack([xs, ys], axis=-1)
+        self.values = hoop.expected_values_of_shots_from(positions, shot_probability)
+        # Scalar lookups index nested lists, numpy scalar indexing is slower
+        self._columns = self.values.tolist()
+
+    def __call__(self, position: Point) -> float:
+        # Inlined clamping, this is called for every player every substep
+        x_cells = position[0] / self._cell_width
+        y_cells = position[1] / self._cell_height
+        last_column = self._last_column
+        last_row = self._last_row
+        x_cells = (
+            0.0 if x_cells < 0.0 else last_column if x_cells > last_column else x_cells
+        )
+        y_cells = 0.0 if y_cells < 0.0 else last_row if y_cells > last_row else y_cells
+        column = int(x_cells)
+        if column == last_column:
+            column -= 1
+        row = int(y_cells)
+        if row == last_row:
+            row -= 1
+        x_fraction = x_cells - column
+        y_fraction = y_cells - row
+        left = self._columns[column]
+        right = self._columns[column + 1]
+        bottom = left[row] + (right[row] - left[row]) * x_fraction
+        top = left[row + 1] + (right[row + 1] - left[row + 1]) * x_fraction
+        return bottom + (top - bottom) * y_fraction
+
+    def values_at(self, positions: np.ndarray) -> np.ndarray:
+        positions = np.asarray(positions, dtype=float)
+        width, height = self._dimensions
+        x_cells = np.clip(positions[..., 0], 0.0, width) / self._cell_width
+        y_cells = np.clip(positions[..., 1], 0.0, height) / self._cell_height
+        num_columns, num_rows = self.values.shape
+        columns = np.minimum(x_cells.astype(int), num_columns - 2)
+        rows = np.minimum(y_cells.astype(int), num_rows - 2)
+        x_fractions = x_cells - columns
+        y_fractions = y_cells - rows
+        values = self.values
+        bottom = (
+            values[columns, rows]
+            + (values[columns + 1, rows] - values[columns, rows]) * x_fractions
+        )
+        top = (
+            values[columns, rows + 1]
+            + (values[columns + 1, rows + 1] - values[columns, rows + 1]) * x_fractions
+        )
+        return bottom + (top - bottom) * y_fractions
+
+
+def _value_key(obj: Any) -> Tuple:
+    # Hoops and shot probabilities are mutable dataclasses, so their field
+    # values identify them instead of their (unavailable) hashes
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return (type(obj), astuple(obj))
+    return (type(obj), ())
+
+
+_grids: Dict[Tuple, ShotValueGrid] = {}
+
+
+def shot_value_grid_for(
+    court_dimensions: Tuple[float, float],
+    hoop: Hoop,
+    shot_probability: ShotProbability,
+    resolution: float = DEFAULT_SHOT_VALUE_GRID_RESOLUTION,
+) -> ShotValueGrid:
+    key = (
+        tuple(court_dimensions),
+        _value_key(hoop),
+        _value_key(hoop.three_point_line),
+        _value_key(shot_probability),
+        resolution,
+    )
+    grid = _grids.get(key)
+    if grid is None:
+        grid = ShotValueGrid(court_dimensions, hoop, shot_probability, resolution)
+        _grids[key] = grid
+    return grid
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
+import numpy as np
 from bball.utils import Point
 
 
@@ -8,6 +9,9 @@ class ThreePointLine(ABC):
     def is_beyond(self, point: Point):
         return not self.contains(point)
 
+    def are_beyond(self, points: np.ndarray) -> np.ndarray:
+        return ~self.contains_points(points)
+
     @abstractmethod
     def other_line(self, width: float):
         pass
@@ -16,6 +20,11 @@ class ThreePointLine(ABC):
     def contains(self, _point: Point):
         pass
 
+    @abstractmethod
+    def contains_points(self, _points: np.ndarray) -> np.ndarray:
+        # Array kernel matching contains for (..., 2) points
+        pass
+
 
 @dataclass
 class RectangleThreePointLine(ThreePointLine):
@@ -36,3 +45,13 @@ class RectangleThreePointLine(ThreePointLine):
 
     def contains(self, point: Point):
         return self.x_lo <= point[0] <= self.x_hi and self.y_lo <= point[1] <= self.y_hi
+
+    def contains_points(self, points: np.ndarray) -> np.ndarray:
+        points = np.asarray(points, dtype=float)
+        xs, ys = points[..., 0], points[..., 1]
+        return (
+            (self.x_lo <= xs)
+            & (xs <= self.x_hi)
+            & (self.y_lo <= ys)
+            & (ys <= self.y_hi)
+        )
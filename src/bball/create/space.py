@@ -1,5 +1,11 @@
-from bball.space import Space, AddableObject
+from typing import Optional
+from bball.space import Space, AddableObject, PYMUNK_BACKEND
+from bball.instrumentation import Instrumentation
 
 
-def create_space(*objs: AddableObject) -> Space:
-    return Space().add(*objs)
+def create_space(
+    *objs: AddableObject,
+    backend: str = PYMUNK_BACKEND,
+    instrumentation: Optional[Instrumentation] = None,
+) -> Space:
+    return Space(backend, instrumentation).add(*objs)
@@ -1,2 +1,2 @@
-from .game import Game, GameSettings
+from .game import Game, GameSettings, GameState
 from .scoreboard import Score, Scoreboard, Possessions
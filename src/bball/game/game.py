@@ -1,17 +1,31 @@
 from __future__ import annotations
-from typing import List, Callable, Optional
+import math
+from typing import Dict, Callable, Optional, List, Tuple
+from copy import copy
 from dataclasses import dataclass, field
-from random import random
-from bball.ball import BallMode, Ball
-from bball.court import Court, Hoop, HalfCourt
+from random import Random
+import numpy as np
+from bball.ball import BallMode, Ball, BallSnapshot
+from bball.court import (
+    Court,
+    Hoop,
+    HalfCourt,
+    ShotValueGrid,
+    shot_value_grid_for,
+)
+from bball.court.hoop import MAX_SHOT_VALUE
+from bball.court.shot_value_grid import DEFAULT_SHOT_VALUE_GRID_RESOLUTION
 from bball.player import Player
-from bball.utils import close_to
+from bball.utils import close_to, GLOBAL_RNG
 from bball.game.scoreboard import Scoreboard
-from bball.team import Team, Teams, other_team_index
+from bball.team import Teams, other_team_index
 from bball.strategy import StrategyInterface
 
 MonitoringFunction = Callable[[], bool]
-TimedMonitoringFunction = Callable[[float], bool]
+
+MAX_POINTS_DISTANCE_SAMPLES = 64
+
+POSSESSION_ENDING_MODES = (BallMode.DEAD, BallMode.MIDSHOT, BallMode.REACHEDSHOT)
 
 
 @dataclass
@@ -19,38 +33,62 @@ class GameSettings:
     shot_clock_duration: float = float("inf")
     use_expected_value_for_points: bool = False
     use_instant_inbounding: bool = True
+    # Look expected shot values up in a cached ShotValueGrid instead of
+    # evaluating them exactly
+    use_shot_value_grid: bool = False
+    shot_value_grid_resolution: float = DEFAULT_SHOT_VALUE_GRID_RESOLUTION
 
 
 @dataclass
 class ShotClock:
+    """
+    Keeps the time at which the active possession expires instead of counting
+    down every step, possessions are started / ended by ball transitions
+    """
+
     shot_clock_duration: float
-    possession_time: float = field(init=False, default=0.0)
+    elapsed_time: float = field(init=False, default=0.0)
+    deadline: float = field(init=False, default=float("inf"))
     active_possession: Optional[int] = field(init=False, default=None)
 
-    def __post_init__(self):
-        self.possession_ended()
+    @property
+    def possession_time(self) -> float:
+        if self.active_possession is None:
+            return self.shot_clock_duration
+        return max(0.0, self.deadline - self.elapsed_time)
 
     def did_expire_after_step(self, time_frame: float) -> bool:
-        self.possession_time -= time_frame
-        self.possession_time = max(0, self.possession_time)
+        self.elapsed_time += time_frame
         if self.active_possession is None:
             return False
-        return self.possession_time <= 0.0
+        return self.elapsed_time >= self.deadline
 
     def possession_ended(self) -> Optional[int]:
         previous_active_possession = self.active_possession
-        self.possession_time = self.shot_clock_duration
         self.active_possession = None
         return previous_active_possession
 
     def possession_started(self, team_index: int) -> bool:
         if self.active_possession != team_index:
-            self.possession_time = self.shot_clock_duration
+            self.deadline = self.elapsed_time + self.shot_clock_duration
             self.active_possession = team_index
             return True
         return False
 
 
+@dataclass(frozen=True)
+class GameState:
+    """
+    Everything a game mutates while running, players are stored as one row of
+    physics state each in team order. Strategies are not part of the state
+    """
+
+    player_kinematics: np.ndarray
+    ball: BallSnapshot
+    clock: ShotClock
+    scoreboard: Scoreboard
+
+
 @dataclass
 class Game:
     teams: Teams
@@ -59,9 +97,28 @@ class Game:
     settings: GameSettings = field(default_factory=GameSettings)
     _scoreboard: Scoreboard = field(init=False, default_factory=Scoreboard)
     _clock: ShotClock = field(init=False)
+    _team_indices: Dict[Player, int] = field(init=False)
+    _checks: Dict[BallMode, MonitoringFunction] = field(init=False)
+    _shot_value_grids: Dict[Player, ShotValueGrid] = field(
+        init=False, default_factory=dict
+    )
+    _rng: Random = field(init=False, default=GLOBAL_RNG)
 
     def __post_init__(self):
         self._clock = ShotClock(self.settings.shot_clock_duration)
+        self._team_indices = {
+            player: team_index
+            for team_index, team in enumerate(self.teams)
+            for player in team
+        }
+        self._checks = {
+            BallMode.HELD: self.check_out_of_bounds,
+            BallMode.DEAD: self.arbitrary_inbound,
+            BallMode.RECEIVEDPASS: self.transfer_possession,
+            BallMode.REACHEDSHOT: self.potentially_make_basket,
+        }
+        self.ball._listener = self._ball_transitioned
+        self._ball_transitioned(self.ball.mode)
 
     def assign_team_strategy(
         self, team_index: int, strategy: StrategyInterface
@@ -70,34 +127,59 @@ class Game:
         self.teams[team_index]._strategy = strategy
         return self
 
-    @property
-    def _checks(self) -> List[MonitoringFunction]:
-        return [
-            self.check_out_of_bounds,
-            self.arbitrary_inbound,
-            self.transfer_possession,
-            self.potentially_make_basket,
-        ]
+    def seed(self, seed: Optional[int]) -> Game:
+        # None goes back to the shared stream of the random module
+        self._rng = GLOBAL_RNG if seed is None else Random(seed)
+        return self
 
     @property
-    def _timed_checks(self) -> List[TimedMonitoringFunction]:
-        return [self.check_shot_clock]
+    def rng(self) -> Random:
+        """Source of every random outcome in the game, including strategies"""
+        return self._rng
+
+    @rng.setter
+    def rng(self, rng: Random):
+        self._rng = rng
+
+    def snapshot(self) -> GameState:
+        return GameState(
+            np.array([player._snapshot() for player in self._team_indices]),
+            self.ball._snapshot(),
+            copy(self._clock),
+            copy(self._scoreboard),
+        )
+
+    def restore(self, state: GameState) -> Game:
+        assert len(state.player_kinematics) == len(self._team_indices)
+        for player, row in zip(self._team_indices, state.player_kinematics.tolist()):
+            player._restore(row)
+        self.ball._restore(state.ball)
+        self._clock = copy(state.clock)
+        self._scoreboard = copy(state.scoreboard)
+        return self
 
     def _step(self, time_frame: float) -> bool:
-        for timed_check in self._timed_checks:
-            if timed_check(time_frame):
-                return True
-        for check in self._checks:
-            if check():
-                return True
+        if self.check_shot_clock(time_frame):
+            return True
+        check = self._checks.get(self.ball.mode)
+        if check is not None:
+            return check()
         return False
 
+    def _ball_transitioned(self, mode: BallMode):
+        if mode in POSSESSION_ENDING_MODES:
+            team_with_last_possession = self._clock.possession_ended()
+            if team_with_last_possession is not None:
+                self._scoreboard.increment_possessions(team_with_last_possession)
+        elif mode == BallMode.HELD:
+            team_with_possession = self.team_with_last_possession
+            assert team_with_possession is not None
+            self._clock.possession_started(team_with_possession)
+
     def team_index_of(self, player: Player) -> int:
-        for team_index, team in enumerate(self.teams):
-            assert isinstance(team, Team)
-            if player in team:
-                return team_index
-        assert False, f"Player {player} does not exist in game"
+        team_index = self._team_indices.get(player)
+        assert team_index is not None, f"Player {player} does not exist in game"
+        return team_index
 
     @property
     def shot_clock(self) -> float:
@@ -107,6 +189,10 @@ class Game:
     def shot_clock_duration(self) -> float:
         return self._clock.shot_clock_duration
 
+    @property
+    def elapsed_time(self) -> float:
+        return self._clock.elapsed_time
+
     @property
     def scoreboard(self) -> Scoreboard:
         return self._scoreboard
@@ -122,19 +208,82 @@ class Game:
         team_index = self.team_index_of(player)
         return self.court._hoops[other_team_index(team_index)]
 
+    def expected_value_of_shot_by(self, player: Player) -> float:
+        target_hoop = self.target_hoop(player)
+        if not self.settings.use_shot_value_grid:
+            return target_hoop.expected_value_of_shot_by(player)
+        grid = self._shot_value_grids.get(player)
+        if grid is None:
+            grid = shot_value_grid_for(
+                self.court.dimensions,
+                target_hoop,
+                player.skill_attributes.shot_probability,
+                self.settings.shot_value_grid_resolution,
+            )
+            self._shot_value_grids[player] = grid
+        return grid(player.position)
+
+    def max_points_per_possession(self) -> float:
+        """
+        Upper bound on what one possession can add to a score, a single shot
+        at the highest value (times the best sampled probability with expected
+        value scoring)
+        """
+        if not self.settings.use_expected_value_for_points:
+            return MAX_SHOT_VALUE
+        distances = np.linspace(
+            0.0, math.hypot(*self.court.dimensions), MAX_POINTS_DISTANCE_SAMPLES
+        )
+        max_probability = max(
+            float(
+                player.skill_attributes.shot_probability.probabilities(distances).max()
+            )
+            for player in self._team_indices
+        )
+        return MAX_SHOT_VALUE * max_probability
+
+    def min_possession_duration(self) -> float:
+        """
+        Lower bound on the length of a possession that scores. Non instant
+        inbounds place the offense in its own half, so someone has to run
+        until the target hoop is in range and the shot has to fly from there.
+        Instant inbounds give the ball to wherever a player is, so 0
+        """
+        if self.settings.use_instant_inbounding:
+            return 0.0
+        durations = []
+        first_row = 0
+        for team_index, team in enumerate(self.teams):
+            _, placements = self.inbound_placements(team_index)
+            for player, row in zip(team, placements[first_row:]):
+                distance = math.dist(row[:2], self.target_hoop(player).position)
+                shot_distance = min(distance, self._shot_range_of(player))
+                max_velocity = player.physical_attributes.max_velocity
+                run_time = (distance - shot_distance) / max_velocity
+                flight_time = shot_distance / player.skill_attributes.shot_velocity
+                # Running all the way is faster with slow shots
+                durations.append(min(run_time + flight_time, distance / max_velocity))
+            first_row += len(team)
+        return min(durations)
+
+    def _shot_range_of(self, player: Player) -> float:
+        # Sampled distance past the last one with a positive probability
+        distances = np.linspace(
+            0.0, math.hypot(*self.court.dimensions), MAX_POINTS_DISTANCE_SAMPLES
+        )
+        probabilities = player.skill_attributes.shot_probability.probabilities(
+            distances
+        )
+        in_range = np.flatnonzero(probabilities > 0.0)
+        if len(in_range) == 0:
+            return 0.0
+        return float(distances[min(in_range[-1] + 1, len(distances) - 1)])
+
     def target_half_court(self, player: Player) -> HalfCourt:
         team_index = self.team_index_of(player)
         return self.court.half_court(other_team_index(team_index))
 
     def check_shot_clock(self, time_frame: float) -> bool:
-        if self.ball.mode in [BallMode.DEAD, BallMode.MIDSHOT, BallMode.REACHEDSHOT]:
-            team_with_last_possession = self._clock.possession_ended()
-            if team_with_last_possession is not None:
-                self._scoreboard.increment_possessions(team_with_last_possession)
-        else:
-            team_with_possession = self.team_with_last_possession
-            assert team_with_possession is not None
-            self._clock.possession_started(team_with_possession)
         if self._clock.did_expire_after_step(time_frame):
             self.ball.shot_clock_expired()
             return True
@@ -169,22 +318,52 @@ class Game:
             self.ball.jump_ball_won_by(player)
             return True
 
+        ball_handler, placements = self.inbound_placements(new_team_with_possession)
+        self.ball.jump_ball_won_by(ball_handler)
+        self.place_players(placements)
+        return True
+
+    def inbound_placements(
+        self, team_with_possession: int
+    ) -> Tuple[Player, np.ndarray]:
+        """
+        Player receiving the inbound and the (x, y, orientation_degrees) row of
+        every player in team order after a non instant inbound
+        """
+        ball_handler: Optional[Player] = None
+        placements: List[Tuple[float, float, float]] = []
         for team_index, team in enumerate(self.teams):
-            has_possession = team_index == new_team_with_possession
+            has_possession = team_index == team_with_possession
             inbounding_data = team.reset_on_inbound(has_possession)
             if has_possession:
-                self.ball.jump_ball_won_by(team[inbounding_data.player_with_ball])
+                ball_handler = team[inbounding_data.player_with_ball]
             half_court = self.court.half_court(team_index)
             positions = inbounding_data.positions_for_half_court(half_court)
             if team_index == 1:
-                positions = reversed(positions)
+                positions = list(reversed(positions))
             base_orientation = 0 if team_index == 0 else -180
-            orientations = [
-                base_orientation + delta for delta in inbounding_data.orientation_deltas
-            ]
-            for player, position, orientation in zip(team, positions, orientations):
-                player.place_at(position, orientation).with_velocity(0.0)
-        return True
+            for position, delta in zip(positions, inbounding_data.orientation_deltas):
+                placements.append((*position, base_orientation + delta))
+        assert ball_handler is not None
+        return ball_handler, np.array(placements, dtype=float)
+
+    def place_players(self, placements: np.ndarray) -> Game:
+        # Rows of (x, y, orientation_degrees) in team order, place_at also stops
+        # the players
+        assert placements.shape == (len(self._team_indices), 3)
+        for player, (x, y, orientation) in zip(self._team_indices, placements.tolist()):
+            player.place_at((x, y), orientation)
+        return self
+
+    def reset_possession(self, ball_handler: Player, placements: np.ndarray) -> Game:
+        """
+        Places every player and gives ball_handler the ball with a full shot
+        clock, without stepping through dead ball and inbound states
+        """
+        self.place_players(placements)
+        self._clock.possession_ended()
+        self.ball.reset_held_by(ball_handler)
+        return self
 
     def transfer_possession(self) -> bool:
         if self.ball.mode != BallMode.RECEIVEDPASS:
@@ -203,7 +382,7 @@ class Game:
         if self.settings.use_expected_value_for_points:
             self._scoreboard.increment_score(team, shot.probability * value)
             return True
-        made_shot = random() < shot.probability
+        made_shot = self._rng.random() < shot.probability
         if made_shot:
             self._scoreboard.increment_score(team, value)
         return made_shot
@@ -0,0 +1,82 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import Any, Callable, Dict, TypeVar
+
+T = TypeVar("T")
+
+# Sections of Space._substep, in the order they run
+STRATEGIES = "strategies"
+PLAYERS = "players"
+PHYSICS = "physics"
+BALL = "ball"
+RULES = "rules"
+SECTIONS = (STRATEGIES, PLAYERS, PHYSICS, BALL, RULES)
+
+
+@dataclass
+class SectionStats:
+    calls: int = 0
+    total_time: float = 0.0
+    max_time: float = 0.0
+
+    def record(self, elapsed: float):
+        self.calls += 1
+        self.total_time += elapsed
+        if elapsed > self.max_time:
+            self.max_time = elapsed
+
+
+@dataclass
+class Instrumentation:
+    """
+    Wall time and call counts of every section of a Space substep, passed to
+    Space to enable it. Totals are cumulative over all steps, per substep
+    numbers divide them by the number of substeps
+    """
+
+    sections: Dict[str, SectionStats] = field(
+        default_factory=lambda: {section: SectionStats() for section in SECTIONS}
+    )
+    steps: int = 0
+    substeps: int = 0
+
+    def record(self, section: str, elapsed: float):
+        self.sections[section].record(elapsed)
+
+    def timed(self, section: str, function: Callable[..., T], *args: Any) -> T:
+        start = perf_counter()
+        result = function(*args)
+        self.record(section, perf_counter() - start)
+        return result
+
+    def reset(self):
+        for stats in self.sections.values():
+            stats.calls = 0
+            stats.total_time = 0.0
+            stats.max_time = 0.0
+        self.steps = 0
+        self.substeps = 0
+
+    @property
+    def total_time(self) -> float:
+        return sum(stats.total_time for stats in self.sections.values())
+
+    def stats(self) -> Dict[str, Any]:
+        total_time = self.total_time
+        substeps = max(self.substeps, 1)
+        return {
+            "steps": self.steps,
+            "substeps": self.substeps,
+            "total_time": total_time,
+            "sections": {
+                section: {
+                    "calls": stats.calls,
+                    "total_time": stats.total_time,
+                    "time_per_substep": stats.total_time / substeps,
+                    "max_time": stats.max_time,
+                    "fraction": stats.total_time / total_time if total_time else 0.0,
+                }
+                for section, stats in self.sections.items()
+            },
+        }
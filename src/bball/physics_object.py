@@ -1,4 +1,5 @@
-from typing import Optional
+from typing import Optional, Sequence, Tuple
+import math
 import pymunk
 from bball.utils import (
     to_degrees,
@@ -27,9 +28,52 @@ def velocity_func_with_limit_and_decay(max_velocity: float, velocity_decay: floa
     return velocity_func
 
 
+class KinematicBody:
+    """
+    Plain float replacement for a pymunk.Body that is never involved in
+    collisions, integrates the same way as pymunk (positions before velocities)
+    followed by the clamp in velocity_func_with_limit_and_decay
+    """
+
+    __slots__ = (
+        "position_x",
+        "position_y",
+        "velocity_x",
+        "velocity_y",
+        "angle",
+        "max_velocity",
+        "damping",
+    )
+
+    def __init__(self, max_velocity: float, velocity_decay: float):
+        self.position_x = 0.0
+        self.position_y = 0.0
+        self.velocity_x = 0.0
+        self.velocity_y = 0.0
+        self.angle = 0.0
+        self.max_velocity = max_velocity
+        self.damping = 1.0 - velocity_decay
+
+    def update(self, time_step: float):
+        self.position_x += self.velocity_x * time_step
+        self.position_y += self.velocity_y * time_step
+        velocity_x = self.velocity_x * self.damping
+        velocity_y = self.velocity_y * self.damping
+        velocity_length = math.hypot(velocity_x, velocity_y)
+        if velocity_length > self.max_velocity:
+            scale = self.max_velocity / velocity_length
+            velocity_x *= scale
+            velocity_y *= scale
+        self.velocity_x = velocity_x
+        self.velocity_y = velocity_y
+
+
 class PhysicsObject:
     _body: pymunk.Body
     _shape: Optional[pymunk.Shape]
+    _kinematics: Optional[KinematicBody]
+    _max_velocity: float
+    _velocity_decay: float
     _last_acceleration: float
     _has_position: bool
     _has_orientation: bool
@@ -48,11 +92,71 @@ class PhysicsObject:
         self._body.velocity_func = velocity_func_with_limit_and_decay(
             max_velocity, velocity_decay
         )
+        self._kinematics = None
+        self._max_velocity = max_velocity
+        self._velocity_decay = velocity_decay
 
         self._last_acceleration = 0.0
         self._has_position = False
         self._has_orientation = False
 
+    def _use_kinematics(self) -> KinematicBody:
+        if self._kinematics is None:
+            kinematics = KinematicBody(self._max_velocity, self._velocity_decay)
+            kinematics.position_x, kinematics.position_y = self._body.position
+            kinematics.velocity_x, kinematics.velocity_y = self._body.velocity
+            kinematics.angle = self._body.angle
+            self._kinematics = kinematics
+        return self._kinematics
+
+    def _use_body(self) -> pymunk.Body:
+        kinematics = self._kinematics
+        if kinematics is not None:
+            self._kinematics = None
+            self._body.position = (kinematics.position_x, kinematics.position_y)
+            self._body.velocity = (kinematics.velocity_x, kinematics.velocity_y)
+            self._body.angle = kinematics.angle
+        return self._body
+
+    def _snapshot(self) -> Tuple[float, ...]:
+        # position_x, position_y, velocity_x, velocity_y, angle, last_acceleration
+        assert self.is_initialized
+        kinematics = self._kinematics
+        if kinematics is not None:
+            return (
+                kinematics.position_x,
+                kinematics.position_y,
+                kinematics.velocity_x,
+                kinematics.velocity_y,
+                kinematics.angle,
+                self._last_acceleration,
+            )
+        position, velocity = self._body.position, self._body.velocity
+        return (
+            position.x,
+            position.y,
+            velocity.x,
+            velocity.y,
+            self._body.angle,
+            self._last_acceleration,
+        )
+
+    def _restore(self, state: Sequence[float]) -> None:
+        position_x, position_y, velocity_x, velocity_y, angle, acceleration = state
+        kinematics = self._kinematics
+        if kinematics is not None:
+            kinematics.position_x, kinematics.position_y = position_x, position_y
+            kinematics.velocity_x, kinematics.velocity_y = velocity_x, velocity_y
+            kinematics.angle = angle
+        else:
+            self._body.position = (position_x, position_y)
+            self._body.velocity = (velocity_x, velocity_y)
+            self._body.angle = angle
+            self._body.angular_velocity = 0.0
+        self._last_acceleration = acceleration
+        self._has_position = True
+        self._has_orientation = True
+
     @property
     def is_initialized(self):
         return self._has_orientation and self._has_position
@@ -60,33 +164,58 @@ class PhysicsObject:
     @property
     def position(self) -> Point:
         assert self.is_initialized
+        kinematics = self._kinematics
+        if kinematics is not None:
+            return (kinematics.position_x, kinematics.position_y)
         return convert_to_tuple(self._body.position)
 
     @position.setter
     def position(self, position: Point):
-        self._body.position = pymunk.Vec2d(*position)
+        kinematics = self._kinematics
+        if kinematics is not None:
+            kinematics.position_x, kinematics.position_y = position
+        else:
+            self._body.position = pymunk.Vec2d(*position)
         self._has_position = True
 
+    @property
+    def _angle(self) -> float:
+        kinematics = self._kinematics
+        if kinematics is not None:
+            return kinematics.angle
+        return self._body.angle
+
     @property
     def orientation_degrees(self):
         assert self.is_initialized
-        return normalized_angle_degrees(to_degrees(self._body.angle))
+        return normalized_angle_degrees(to_degrees(self._angle))
 
     @orientation_degrees.setter
     def orientation_degrees(self, orientation_degrees: float):
         orientation_degrees = normalized_angle_degrees(orientation_degrees)
         assert valid_angle_degrees(orientation_degrees)
-        self._body.angle = to_radians(orientation_degrees)
+        kinematics = self._kinematics
+        if kinematics is not None:
+            kinematics.angle = to_radians(orientation_degrees)
+        else:
+            self._body.angle = to_radians(orientation_degrees)
         self._has_orientation = True
 
     @property
     def velocity(self) -> Vector:
         assert self.is_initialized
+        kinematics = self._kinematics
+        if kinematics is not None:
+            return (kinematics.velocity_x, kinematics.velocity_y)
         return convert_to_tuple(self._body.velocity)
 
     @velocity.setter
     def velocity(self, velocity: Vector):
-        self._body.velocity = pymunk.Vec2d(*velocity)
+        kinematics = self._kinematics
+        if kinematics is not None:
+            kinematics.velocity_x, kinematics.velocity_y = velocity
+        else:
+            self._body.velocity = pymunk.Vec2d(*velocity)
 
     def reset_velocity(self) -> None:
         self.velocity = (0, 0)
@@ -102,11 +231,25 @@ class PhysicsObject:
         self.orientation_degrees = normalized_angle_degrees(
             self.orientation_degrees + to_degrees(angle * time_step)
         )
-        self._body.velocity = self._body.velocity.rotated(angle * time_step)
+        kinematics = self._kinematics
+        if kinematics is not None:
+            cos, sin = math.cos(angle * time_step), math.sin(angle * time_step)
+            velocity_x, velocity_y = kinematics.velocity_x, kinematics.velocity_y
+            kinematics.velocity_x = velocity_x * cos - velocity_y * sin
+            kinematics.velocity_y = velocity_x * sin + velocity_y * cos
+        else:
+            self._body.velocity = self._body.velocity.rotated(angle * time_step)
 
     def accelerate(self, acceleration: float, time_step: float) -> None:
         assert self.is_initialized
         self._last_acceleration = acceleration
+        kinematics = self._kinematics
+        if kinematics is not None:
+            # Impulse of acceleration * mass * time_step along the heading
+            velocity_change = acceleration * time_step
+            kinematics.velocity_x += velocity_change * math.cos(kinematics.angle)
+            kinematics.velocity_y += velocity_change * math.sin(kinematics.angle)
+            return
         force = acceleration * self._body.mass * convert_to_vec2d(BASE_DIRECTION)
         impulse = force * time_step
         self._body.apply_impulse_at_local_point(impulse)
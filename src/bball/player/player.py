@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, Sequence, Tuple, TYPE_CHECKING
 from bball.utils import coords_to_string, ROUND_DIGITS, angle_degrees_to_vector
 from bball.validator import valid_multiplier, valid_angle_degrees
 from bball.player.player_attributes import PlayerAttributes
@@ -122,6 +122,16 @@ class Player:
         self._move.do_action()
         return self._physics._step(self._move, time_step)
 
+    def _snapshot(self) -> Tuple[float, ...]:
+        return self._physics._snapshot()
+
+    def _restore(self, state: Sequence[float]) -> Player:
+        # The ball state being restored re-attaches the ball to its handler
+        self._physics._restore(state)
+        self._move = PlayerMove()
+        self._ball = None
+        return self
+
     def _reset(self) -> Player:
         assert self.is_initialized
         self._move.reset()
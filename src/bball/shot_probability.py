@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+import numpy as np
 from bball.validator import valid_probability
 from bball.utils import clamp, interpolate, interpolation_coefficient
 
@@ -9,6 +10,11 @@ class ShotProbability(ABC):
     def __call__(self, shot_distance: float) -> float:
         pass
 
+    @abstractmethod
+    def probabilities(self, shot_distances: np.ndarray) -> np.ndarray:
+        # Array kernel matching __call__ element-wise, for any shape of distances
+        pass
+
 
 def checked_probability(probability: float) -> float:
     assert valid_probability(probability)
@@ -42,7 +48,24 @@ class LinearShotProbability(ShotProbability):
             )
         )
 
+    def probabilities(self, shot_distances: np.ndarray) -> np.ndarray:
+        shot_distances = np.asarray(shot_distances, dtype=float)
+        clamped_distances = np.clip(
+            shot_distances, self.min_shot_distance, self.max_shot_distance
+        )
+        fractions_from_min_percentage = (clamped_distances - self.min_shot_distance) / (
+            self.max_shot_distance - self.min_shot_distance
+        )
+        probabilities = (
+            self.max_percentage * (1 - fractions_from_min_percentage)
+            + self.min_percentage * fractions_from_min_percentage
+        )
+        return np.where(shot_distances > self.max_shot_distance, 0.0, probabilities)
+
 
 class GuaranteedShotProbability(ShotProbability):
     def __call__(self, _shot_distance: float) -> float:
         return 1.0
+
+    def probabilities(self, shot_distances: np.ndarray) -> np.ndarray:
+        return np.ones(np.shape(shot_distances))
@@ -1,30 +1,61 @@
 from __future__ import annotations
 import math
-from typing import List, Union, Sequence, Set
+from typing import Any, Callable, List, Optional, Union, Sequence, Set, TypeVar
 import pymunk
 from bball.ball import Ball
 from bball.player import Player
-from bball.game import Game
+from bball.game import Game, GameState
 from bball.team import Team, Teams
-from bball.physics_object import PhysicsObject
+from bball.physics_object import PhysicsObject, KinematicBody
+from bball.instrumentation import (
+    Instrumentation,
+    STRATEGIES,
+    PLAYERS,
+    PHYSICS,
+    BALL,
+    RULES,
+)
+
+T = TypeVar("T")
 
 AddableObject = Union[Player, Ball, Game, Team, Teams]
 StoredObject = Union[Player, Ball, Game]
 
+PYMUNK_BACKEND = "pymunk"
+KINEMATIC_BACKEND = "kinematic"
+BACKENDS = [PYMUNK_BACKEND, KINEMATIC_BACKEND]
+
 
 class Space:
-    _space: pymunk.Space
+    """
+    The pymunk backend resolves collisions between players with a size, the
+    kinematic backend skips pymunk entirely and only integrates velocities.
+    Passing an Instrumentation times every section of each substep
+    """
+
+    _backend: str
+    _space: Optional[pymunk.Space]
+    _kinematic_bodies: List[KinematicBody]
     _players: List[Player]
     _balls: List[Ball]
     _games: List[Game]
     _ids: Set[int]
-
-    def __init__(self):
-        self._space = pymunk.Space()
+    _instrumentation: Optional[Instrumentation]
+
+    def __init__(
+        self,
+        backend: str = PYMUNK_BACKEND,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
+        assert backend in BACKENDS, f"unknown backend {backend}"
+        self._backend = backend
+        self._space = pymunk.Space() if backend == PYMUNK_BACKEND else None
+        self._kinematic_bodies = []
         self._players = []
         self._balls = []
         self._games = []
         self._ids = set()
+        self._instrumentation = instrumentation
 
     def add(self, *objs: AddableObject) -> Space:
         for obj in objs:
@@ -63,9 +94,20 @@ class Space:
         return self
 
     def _add_physics_object(self, physics_object: PhysicsObject) -> Space:
-        self._space.add(physics_object._body)
-        if physics_object._shape is not None:
-            self._space.add(physics_object._shape)
+        if self._space is None:
+            self._kinematic_bodies.append(physics_object._use_kinematics())
+            return self
+        body = physics_object._use_body()
+        shape = physics_object._shape
+        shapes = [] if shape is None else [shape]
+        if body.space is not None:
+            # Still owned by a space that has not been garbage collected yet
+            body.space.remove(body, *shapes)
+        if shape is not None:
+            # Freeing a pymunk space detaches its shapes, so reattach in case the
+            # object was part of an earlier space
+            shape.body = body
+        self._space.add(body, *shapes)
         return self
 
     def _add_ball(self, ball: Ball) -> Space:
@@ -82,6 +124,14 @@ class Space:
         self.add(game.ball)
         return self
 
+    def restore(self, state: GameState) -> Space:
+        assert len(self._games) == 1
+        self._games[0].restore(state)
+        if self._space is not None:
+            for body in self._space.bodies:
+                self._space.reindex_shapes_for_body(body)
+        return self
+
     def step(self, time_frame: float, max_substep_length=None) -> Space:
         substeps_per_unit_time = (
             1
@@ -91,18 +141,36 @@ class Space:
         time_per_substep = time_frame / substeps_per_unit_time
         for _ in range(substeps_per_unit_time):
             self._substep(time_per_substep)
+        if self._instrumentation is not None:
+            self._instrumentation.steps += 1
+            self._instrumentation.substeps += substeps_per_unit_time
         self._reset_players()
         return self
 
+    def _section(self, section: str, function: Callable[..., T], *args: Any) -> T:
+        if self._instrumentation is None:
+            return function(*args)
+        return self._instrumentation.timed(section, function, *args)
+
     def _substep(self, time_frame: float):
-        self._run_strategies(self._games, time_frame)
-        self._step_each(self._players, time_frame)
-        self._space.step(time_frame)
-        self._reset_players_with_strategies(self._games)
-        if self._step_one(self._balls, time_frame):
+        self._section(STRATEGIES, self._run_strategies, self._games, time_frame)
+        self._section(PLAYERS, self._step_each, self._players, time_frame)
+        self._section(PHYSICS, self._step_physics_and_reset, time_frame)
+        if self._section(BALL, self._step_one, self._balls, time_frame):
+            return
+        if self._section(RULES, self._step_one, self._games, time_frame):
             return
-        if self._step_one(self._games, time_frame):
+
+    def _step_physics_and_reset(self, time_frame: float):
+        self._step_physics(time_frame)
+        self._reset_players_with_strategies(self._games)
+
+    def _step_physics(self, time_frame: float):
+        if self._space is not None:
+            self._space.step(time_frame)
             return
+        for body in self._kinematic_bodies:
+            body.update(time_frame)
 
     def _run_strategies(self, games: Sequence[Game], time_frame: float):
         if len(games) == 0:
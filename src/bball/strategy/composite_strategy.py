@@ -18,6 +18,13 @@ class CompositeStrategy(StrategyInterface):
         self.offensive_strategy = offensive_strategy
         self.defensive_strategy = defensive_strategy
 
+    @property
+    def draws_random_numbers(self) -> bool:
+        return (
+            self.offensive_strategy.draws_random_numbers
+            or self.defensive_strategy.draws_random_numbers
+        )
+
     def _after_team_set(self):
         self.offensive_strategy.for_team_index_in_game(self._team_index, self._game)
         self.defensive_strategy.for_team_index_in_game(self._team_index, self._game)
@@ -1,5 +1,4 @@
 from __future__ import annotations
-from random import choices, random
 from dataclasses import dataclass, field
 from typing import List, TYPE_CHECKING
 from bball.behavior import RunPastPosition
@@ -52,6 +51,10 @@ class SpacePassShoot(StrategyInterface):
         )
         return (half_court.multiplier_to_position(clamped_coefficients), DEFAULT_EPS)
 
+    @property
+    def draws_random_numbers(self) -> bool:
+        return self.pass_probability > 0
+
     def _shot_clock_coeff(self) -> float:
         total_shot_clock = self._game.settings.shot_clock_duration
         if total_shot_clock == float("inf"):
@@ -62,9 +65,7 @@ class SpacePassShoot(StrategyInterface):
         return shot_clock_coeff
 
     def _shot_quality_for(self, player: Player):
-        target_hoop = self._game.target_hoop(player)
-        expected_value = target_hoop.expected_value_of_shot_by(player)
-        return expected_value
+        return self._game.expected_value_of_shot_by(player)
 
     def update(self):
         self._behaviors = [
@@ -80,20 +81,22 @@ class SpacePassShoot(StrategyInterface):
 
     def _drive(self):
         self.update()
-        for behavior, player in zip(self._behaviors, self._team):
+        for behavior, player, shot_quality in zip(
+            self._behaviors, self._team, self._shot_quality_metric
+        ):
             target_hoop = self._game.target_hoop(player)
             if player.has_ball:
                 coeff = self._shot_clock_coeff()
-                shot_quality = self._shot_quality_for(player)
                 threshold = self.shot_quality_threshold * coeff
                 good_shot = shot_quality > threshold
                 low_time = self._game.shot_clock < 1.0
                 if good_shot or low_time:
                     player.shoot_at(target_hoop.position)
                     return
-                if random() < self.pass_probability:
+                rng = self._game.rng
+                if rng.random() < self.pass_probability:
 
-                    receiver = choices(self._team, self._shot_quality_metric)[0]
+                    receiver = rng.choices(self._team, self._shot_quality_metric)[0]
                     if receiver != player:
                         player.pass_to(receiver)
                         return
@@ -32,6 +32,11 @@ class StrategyInterface(ABC):
         assert approx(self._time_frame, time_frame)
         self._drive()
 
+    @property
+    def draws_random_numbers(self) -> bool:
+        """Whether driving the strategy draws from the game's rng"""
+        return False
+
     def after_team_set(self):
         if not self._has_run:
             return
@@ -1,5 +1,6 @@
 from __future__ import annotations
 import math
+import random
 from typing import Tuple, Union, TYPE_CHECKING
 import pymunk
 
@@ -17,6 +18,11 @@ BASE_DIRECTION = (1, 0)
 
 ROUND_DIGITS = 4
 
+# The stream behind the random module functions, games draw from it until
+# they are seeded so unseeded runs keep following random.seed
+# pylint: disable-next=protected-access
+GLOBAL_RNG: random.Random = random._inst  # type: ignore
+
 
 def polar_to_cartesian(angle_degrees: float, length: float):
     angle_degrees = normalized_angle_degrees(angle_degrees)
@@ -70,20 +76,21 @@ def to_degrees(radians: float) -> float:
 
 
 def normalized_angle(radians: float) -> float:
-    while radians < -math.pi:
-        radians += 2 * math.pi
-    while radians >= math.pi:
+    if -math.pi <= radians < math.pi:
+        return radians
+    radians = (radians + math.pi) % (2 * math.pi) - math.pi
+    # The modulo can round up to exactly pi for inputs just below a multiple
+    if radians >= math.pi:
         radians -= 2 * math.pi
-    assert -math.pi <= radians < math.pi
     return radians
 
 
 def normalized_angle_degrees(degrees: float) -> float:
-    while degrees < -180:
-        degrees += 360
-    while degrees >= 180:
+    if -180 <= degrees < 180:
+        return degrees
+    degrees = (degrees + 180) % 360 - 180
+    if degrees >= 180:
         degrees -= 360
-    assert -180 <= degrees <= 180
     return degrees
 
 
@@ -116,31 +123,31 @@ def close_to(point_1: Point, point_2: Point, eps: float = DEFAULT_EPS) -> bool:
 
 
 def distance_between(point_1: Point, point_2: Point) -> float:
-    return convert_to_vec2d(point_1).get_distance(convert_to_vec2d(point_2))
+    return math.hypot(point_1[0] - point_2[0], point_1[1] - point_2[1])
 
 
 def difference_between(point_1: Point, point_2: Point) -> Vector:
-    return convert_to_tuple(convert_to_vec2d(point_1) - convert_to_vec2d(point_2))
+    return (point_1[0] - point_2[0], point_1[1] - point_2[1])
 
 
 def sum_of(vector_1: Vector, vector_2: Vector) -> Vector:
-    return convert_to_tuple(convert_to_vec2d(vector_1) + convert_to_vec2d(vector_2))
+    return (vector_1[0] + vector_2[0], vector_1[1] + vector_2[1])
 
 
 def divide_by(vector: Vector, denominator: float):
-    return convert_to_tuple(convert_to_vec2d(vector) / denominator)
+    return (vector[0] / denominator, vector[1] / denominator)
 
 
 def multiply_by(vector: Vector, coefficient: float):
-    return convert_to_tuple(convert_to_vec2d(vector) * coefficient)
+    return (vector[0] * coefficient, vector[1] * coefficient)
 
 
 def interpolate_points(point_1: Point, point_2: Point, interp: float) -> Point:
     assert 0 <= interp <= 1
-    vec_1 = convert_to_vec2d(point_1)
-    vec_2 = convert_to_vec2d(point_2)
-    vec_res = vec_1.interpolate_to(vec_2, interp)
-    return convert_to_tuple(vec_res)
+    return (
+        point_1[0] + (point_2[0] - point_1[0]) * interp,
+        point_1[1] + (point_2[1] - point_1[1]) * interp,
+    )
 
 
 def midpoint_of(point_1: Point, point_2: Point) -> Point:
@@ -148,16 +155,17 @@ def midpoint_of(point_1: Point, point_2: Point) -> Point:
 
 
 def vector_angle_degrees(vector: Vector) -> float:
-    return normalized_angle_degrees(convert_to_vec2d(vector).angle_degrees)
+    return normalized_angle_degrees(math.degrees(math.atan2(vector[1], vector[0])))
 
 
 def vector_length(vector: Vector) -> float:
-    return convert_to_vec2d(vector).length
+    return math.hypot(vector[0], vector[1])
 
 
 def angle_degrees_to_vector(angle_degrees: float, length: float) -> Vector:
-    vec = length * convert_to_vec2d(BASE_DIRECTION).rotated_degrees(angle_degrees)
-    return convert_to_tuple(vec)
+    # Rotates BASE_DIRECTION = (1, 0)
+    angle = math.radians(angle_degrees)
+    return (length * math.cos(angle), length * math.sin(angle))
 
 
 def clamp(value: float, min_value: float, max_value: float) -> float:
@@ -165,14 +173,10 @@ def clamp(value: float, min_value: float, max_value: float) -> float:
 
 
 def dot_product(vector_1: Vector, vector_2: Vector) -> float:
-    return convert_to_vec2d(vector_1).dot(vector_2)
+    return vector_1[0] * vector_2[0] + vector_1[1] * vector_2[1]
 
 
 def in_between_of(candidate: Point, extreme_1: Point, extreme_2: Point) -> bool:
-    pt_1 = convert_to_vec2d(extreme_1)
-    pt_2 = convert_to_vec2d(candidate)
-    pt_3 = convert_to_vec2d(extreme_2)
-    vec_1 = pt_2 - pt_1
-    vec_2 = pt_3 - pt_2
-    dot = vec_1.dot(convert_to_tuple(vec_2))
-    return dot >= 0
+    vec_1 = difference_between(candidate, extreme_1)
+    vec_2 = difference_between(extreme_2, candidate)
+    return dot_product(vec_1, vec_2) >= 0
@@ -3,3 +3,5 @@ from .learn import learn
 from .load import load
 from .parameters import compare
 from .evolution import tournament
+from .pool import ComparisonPool
+from .comparison import Comparison, VarianceReduction, EarlyStopping
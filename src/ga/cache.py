@@ -0,0 +1,135 @@
+from __future__ import annotations
+from collections import OrderedDict
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import hashlib
+import json
+import os
+from ga.evolution_types import (
+    IndexPair,
+    IndividualInterface,
+    PairEvaluator,
+    Population,
+)
+
+DEFAULT_CAPACITY = 100_000
+
+
+def canonical_hash(obj: Any) -> str:
+    serialized = json.dumps(obj, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+class MatchupCache:
+    """
+    Least recently used cache of compare() score deltas keyed by the hash of
+    both individuals and the game config, optionally persisted as json.
+
+    Entries are stored for the pair in canonical (sorted hash) order, looking up
+    the reversed pair returns the negated delta
+    """
+
+    _config_hash: str
+    _capacity: int
+    _path: Optional[Path]
+    _entries: OrderedDict[str, Tuple[float, int]]
+    hits: int
+    misses: int
+
+    def __init__(
+        self,
+        config: Any,
+        path: Optional[str] = None,
+        capacity: int = DEFAULT_CAPACITY,
+    ):
+        assert capacity > 0
+        self._config_hash = canonical_hash(config)
+        self._capacity = capacity
+        self._path = None if path is None else Path(path)
+        self._entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        if self._path is not None and self._path.exists():
+            self._load(self._path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _key(
+        self, individual_1: IndividualInterface, individual_2: IndividualInterface
+    ) -> Tuple[str, bool]:
+        hash_1 = canonical_hash(asdict(individual_1))  # type: ignore
+        hash_2 = canonical_hash(asdict(individual_2))  # type: ignore
+        flipped = hash_2 < hash_1
+        if flipped:
+            hash_1, hash_2 = hash_2, hash_1
+        return f"{self._config_hash}:{hash_1}:{hash_2}", flipped
+
+    def lookup(
+        self, individual_1: IndividualInterface, individual_2: IndividualInterface
+    ) -> Optional[float]:
+        key, flipped = self._key(individual_1, individual_2)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        delta = entry[0]
+        return -delta if flipped else delta
+
+    def store(
+        self,
+        individual_1: IndividualInterface,
+        individual_2: IndividualInterface,
+        delta: float,
+    ):
+        key, flipped = self._key(individual_1, individual_2)
+        if flipped:
+            delta = -delta
+        mean, count = self._entries.pop(key, (0.0, 0))
+        self._entries[key] = ((mean * count + delta) / (count + 1), count + 1)
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+
+    def wrap(self, evaluator: PairEvaluator) -> PairEvaluator:
+        def evaluate(
+            population: Population, index_pairs: Sequence[IndexPair]
+        ) -> List[float]:
+            deltas: List[Optional[float]] = [
+                self.lookup(population[i], population[j]) for i, j in index_pairs
+            ]
+            missing = [
+                index_pair
+                for index_pair, delta in zip(index_pairs, deltas)
+                if delta is None
+            ]
+            computed: Dict[IndexPair, float] = {}
+            if missing:
+                for (i, j), delta in zip(missing, evaluator(population, missing)):
+                    computed[(i, j)] = delta
+                    self.store(population[i], population[j], delta)
+            return [
+                computed[index_pair] if delta is None else delta
+                for index_pair, delta in zip(index_pairs, deltas)
+            ]
+
+        return evaluate
+
+    def _load(self, path: Path):
+        with open(path, "r", encoding="utf-8") as input_file:
+            entries = json.load(input_file)
+        for key, (mean, count) in entries.items():
+            self._entries[key] = (mean, count)
+        while len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+
+    def save(self):
+        if self._path is None:
+            return
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self._path.with_suffix(self._path.suffix + ".tmp")
+        with open(temporary_path, "w", encoding="utf-8") as output_file:
+            json.dump(self._entries, output_file)
+        os.replace(temporary_path, self._path)
@@ -0,0 +1,112 @@
+from __future__ import annotations
+import math
+from dataclasses import dataclass
+from random import Random
+from typing import Optional, Sequence, Tuple
+
+
+class AntitheticRandom(Random):
+    """
+    Stream of 1 - u for every uniform u the same seeded Random would draw, so a
+    shot made in one sample tends to be missed in its antithetic twin
+    """
+
+    def random(self) -> float:
+        return 1.0 - super().random()
+
+
+@dataclass(frozen=True)
+class VarianceReduction:
+    """
+    How compare plays a matchup whose outcome is random. Every sample plays
+    both periods with common random numbers, optionally averaged with its
+    antithetic twin, and samples stop once the confidence interval of the mean
+    delta excludes 0 or max_samples were played
+    """
+
+    min_samples: int = 3
+    max_samples: int = 16
+    z_score: float = 1.96
+    antithetic: bool = True
+
+    def __post_init__(self):
+        assert 2 <= self.min_samples <= self.max_samples
+        assert self.z_score > 0
+
+    def is_done(self, observations: Sequence[float]) -> bool:
+        count = len(observations)
+        if count < self.min_samples:
+            return False
+        if count >= self.max_samples:
+            return True
+        mean, standard_error = mean_and_standard_error(observations)
+        # Identical samples give a standard error of 0, which isn't evidence
+        # for a winner when their mean is 0 as well
+        return abs(mean) > self.z_score * standard_error
+
+
+@dataclass(frozen=True)
+class EarlyStopping:
+    """
+    Ends a sample once the trailing side can't overturn the margin. Each of
+    its scoring possessions lasts at least the game's min_possession_duration
+    and adds at most max_points_per_possession. Possessions that end without
+    a score can be shorter, so the other side's possessions don't reduce the
+    trailing side's count. compare extrapolates the margin at the stop point
+    to the full sample
+    """
+
+    at_possession_boundaries: bool = False
+
+    def is_decided(
+        self,
+        margin: float,
+        remaining_time: float,
+        min_possession_duration: float,
+        max_points_per_possession: float,
+    ) -> bool:
+        if min_possession_duration <= 0:
+            return False
+        # The possession in progress can still score
+        scoring_possessions = math.floor(remaining_time / min_possession_duration)
+        scoring_possessions += 1
+        return abs(margin) > scoring_possessions * max_points_per_possession
+
+
+def mean_and_standard_error(observations: Sequence[float]) -> Tuple[float, float]:
+    count = len(observations)
+    mean = sum(observations) / count
+    if count < 2:
+        return mean, float("inf")
+    variance = sum((value - mean) ** 2 for value in observations) / (count - 1)
+    return mean, math.sqrt(variance / count)
+
+
+class Comparison(float):
+    """
+    Score delta of a matchup with the number of samples and standard error
+    behind it. It is a float so schedulers, caches and pools keep using it as
+    the delta
+    """
+
+    samples: Optional[int]
+    standard_error: Optional[float]
+
+    def __new__(
+        cls,
+        delta: float,
+        samples: Optional[int] = None,
+        standard_error: Optional[float] = None,
+    ):
+        comparison = super().__new__(cls, delta)
+        comparison.samples = samples
+        comparison.standard_error = standard_error
+        return comparison
+
+    def __reduce__(self):
+        return (Comparison, (float(self), self.samples, self.standard_error))
+
+
+def sampling_of(delta: float) -> Tuple[Optional[int], Optional[float]]:
+    # Plain floats come from single sample compares or the matchup cache
+    return getattr(delta, "samples", None), getattr(delta, "standard_error", None)
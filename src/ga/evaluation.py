@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import List, Tuple
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 
 
 @dataclass
@@ -7,3 +7,6 @@ class Evaluation:
     deltas: List[Tuple[int, int, float]]
     fitness: List[float]
     winners: List[int]
+    # Per delta, None when it was a single sample compare or a cached result
+    samples: List[Optional[int]] = field(default_factory=list)
+    standard_errors: List[Optional[float]] = field(default_factory=list)
@@ -1,15 +1,25 @@
 from __future__ import annotations
-from typing import Callable, Tuple, Dict, List
+from typing import Callable, Tuple, Dict, List, Optional, Sequence, TYPE_CHECKING
 from copy import copy
-from random import shuffle
+from random import Random
 import multiprocess as mp  # type: ignore
 from ga.evaluation import Evaluation
+from ga.comparison import sampling_of
 from ga.evolution_types import (
     IndividualComparator,
     IndividualCreator,
     Population,
     IndividualInterface,
+    PairEvaluator,
+    IndexPair,
+    TournamentScheduler,
 )
+from ga.schedulers import round_robin
+from ga.pool import worker_count
+from bball.utils import GLOBAL_RNG
+
+if TYPE_CHECKING:
+    from ga.cache import MatchupCache
 
 
 def rotated(lis):
@@ -50,25 +60,30 @@ def determine_winning_indices(sorted_indices: List[int], types: List[str]) -> Li
     return winner_indices
 
 
+def pool_evaluator(comparator: IndividualComparator) -> PairEvaluator:
+    def evaluate(
+        population: Population, index_pairs: Sequence[IndexPair]
+    ) -> List[float]:
+        evaluations = [(population[i], population[j]) for i, j in index_pairs]
+        with mp.Pool(worker_count()) as pool:  # pylint: disable=not-callable
+            return pool.starmap(comparator, evaluations)
+
+    return evaluate
+
+
 def tournament(
-    comparator: IndividualComparator, population: Population
+    comparator: IndividualComparator,
+    population: Population,
+    evaluator: Optional[PairEvaluator] = None,
+    scheduler: TournamentScheduler = round_robin,
+    cache: Optional[MatchupCache] = None,
 ) -> Tuple[Population, Evaluation]:
     assert len(population) % 2 == 0
-    evaluation_indices = [
-        (i, j) for i in range(0, len(population)) for j in range(i + 1, len(population))
-    ]
-    evaluations = [(population[i], population[j]) for i, j in evaluation_indices]
-
-    with mp.Pool(mp.cpu_count() - 2) as pool:  # pylint: disable=no-member,not-callable
-        # pylint: disable=no-member
-        score_differences = pool.starmap(comparator, evaluations)
-
-    scores = [float("inf") for _ in population]
-    deltas = []
-    for (i, j), delta in zip(evaluation_indices, score_differences):
-        scores[i] = min(scores[i], delta)
-        scores[j] = min(scores[j], -delta)
-        deltas.append((i, j, delta))
+    if evaluator is None:
+        evaluator = pool_evaluator(comparator)
+    if cache is not None:
+        evaluator = cache.wrap(evaluator)
+    deltas, scores = scheduler(population, evaluator)
 
     sorted_indices = sorted(
         list(range(len(population))), key=lambda ind: scores[ind], reverse=True
@@ -76,11 +91,20 @@ def tournament(
     types = [population[index].type for index in sorted_indices]
     winning_indices = determine_winning_indices(sorted_indices, types)
 
-    evaluation = Evaluation(deltas, scores, winning_indices)
+    sampling = [sampling_of(delta) for _, _, delta in deltas]
+    evaluation = Evaluation(
+        [(i, j, float(delta)) for i, j, delta in deltas],
+        scores,
+        winning_indices,
+        [samples for samples, _ in sampling],
+        [standard_error for _, standard_error in sampling],
+    )
     return [population[ind] for ind in winning_indices], evaluation
 
 
-def next_generation(creator: IndividualCreator, population: Population) -> Population:
+def next_generation(
+    creator: IndividualCreator, population: Population, rng: Random = GLOBAL_RNG
+) -> Population:
     if not PRESERVE_TYPE_RATIOS:
         groups = [population]
     else:
@@ -94,7 +118,7 @@ def next_generation(creator: IndividualCreator, population: Population) -> Popul
     children = []
     for group in groups:
         for individuals_1, individuals_2 in zip(group, rotated(group)):
-            child = creator(individuals_1, individuals_2, P_FIRST)
+            child = creator(individuals_1, individuals_2, P_FIRST, rng)
             children.append(child)
     return children
 
@@ -119,14 +143,18 @@ def evolve(
     creator: IndividualCreator,
     population: Population,
     serialize: Callable[[Population, Evaluation], None],
+    evaluator: Optional[PairEvaluator] = None,
+    scheduler: TournamentScheduler = round_robin,
+    cache: Optional[MatchupCache] = None,
+    rng: Random = GLOBAL_RNG,
 ) -> Population:
-    shuffle(population)
+    rng.shuffle(population)
     assert len(population) % 2 == 0
-    winners, metrics = tournament(comparator, population)
+    winners, metrics = tournament(comparator, population, evaluator, scheduler, cache)
     serialize(population, metrics)
 
-    shuffle(winners)
-    children = next_generation(creator, winners)
+    rng.shuffle(winners)
+    children = next_generation(creator, winners, rng)
     check_population_type(winners, children)
 
     population_str = (
@@ -135,7 +163,7 @@ def evolve(
         f" {len(children)} children"
     )
     assert len(children) + len(winners) == len(population), population_str
-    mutated = [individual.mutate(DELTA, P_CHANGE) for individual in children]
+    mutated = [individual.mutate(DELTA, P_CHANGE, rng) for individual in children]
     next_population = mutated + list(winners)
     check_population_type(population, next_population)
     return next_population
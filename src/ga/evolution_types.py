@@ -1,5 +1,6 @@
 from __future__ import annotations
-from typing import MutableSequence, Callable, Protocol, TypeVar
+from random import Random
+from typing import MutableSequence, Callable, Protocol, TypeVar, Sequence, Tuple, List
 
 T = TypeVar("T")
 
@@ -7,14 +8,20 @@ T = TypeVar("T")
 class IndividualInterface(Protocol):
     type: str
 
-    def mutate(self: T, delta: float, p_change: float) -> T:
+    def mutate(self: T, delta: float, p_change: float, rng: Random) -> T:
         pass
 
-    def crossover(self: T, other: T, p_first: float) -> T:
+    def crossover(self: T, other: T, p_first: float, rng: Random) -> T:
         pass
 
 
 Individual = TypeVar("Individual")
 IndividualComparator = Callable[[Individual, Individual], float]
-IndividualCreator = Callable[[Individual, Individual, float], Individual]
+IndividualCreator = Callable[[Individual, Individual, float, Random], Individual]
 Population = MutableSequence[IndividualInterface]
+IndexPair = Tuple[int, int]
+Delta = Tuple[int, int, float]
+PairEvaluator = Callable[[Population, Sequence[IndexPair]], List[float]]
+TournamentScheduler = Callable[
+    [Population, PairEvaluator], Tuple[List[Delta], List[float]]
+]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 import uuid
-from typing import Optional, Callable, TYPE_CHECKING
+from random import Random
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, TYPE_CHECKING
 from tqdm import tqdm
 from ga.evaluation_game import evaluation_game
 from ga.parameters import (
@@ -12,7 +14,15 @@ from ga.parameters import (
     combine,
 )
 from ga.evolution import evolve, tournament, Population
+from ga.evolution_types import PairEvaluator, TournamentScheduler
+from ga.schedulers import round_robin, scheduler_for
+from ga.pool import ComparisonPool
 from ga.metadata import Metadata
+from ga.cache import MatchupCache
+from ga.seeding import derive_rng, new_run_seed
+from ga.comparison import EarlyStopping, VarianceReduction
+from bball.utils import GLOBAL_RNG
+from bball.space import PYMUNK_BACKEND
 
 if TYPE_CHECKING:
     from bball import Game
@@ -23,18 +33,36 @@ if TYPE_CHECKING:
 DURATION = 100
 FPS = 60
 SPEED_SCALE = 3.0
+MATCHUP_CACHE_FILE = "matchups.json"
 
 
-def create_initial_population(population_size: int, width: float) -> Population:
+def cache_config(metadata: Metadata, game: Game) -> Dict[str, Any]:
+    """
+    Key of the matchup cache. Games scored with expected values only draw for
+    strategy decisions, so they leave the run seed out and share
+    matchups.json across runs. Hits are never replayed, the first delta of a
+    matchup stands in for every seed
+    """
+    config = metadata.game_config()
+    if game.settings.use_expected_value_for_points:
+        del config["seed"]
+    return config
+
+
+def create_initial_population(
+    population_size: int, width: float, rng: Random = GLOBAL_RNG
+) -> Population:
     num_types = 2
     while population_size % (2 * num_types) != 0:
         population_size += 1
     individuals_per_type = population_size // num_types
     spaced_parameters: Population = [
-        SpacedParameters.generate_random(width) for _ in range(individuals_per_type)
+        SpacedParameters.generate_random(width, rng)
+        for _ in range(individuals_per_type)
     ]
     regular_parameters: Population = [
-        RegularParameters.generate_random(width) for _ in range(individuals_per_type)
+        RegularParameters.generate_random(width, rng)
+        for _ in range(individuals_per_type)
     ]
     return list(spaced_parameters) + list(regular_parameters)
 
@@ -43,23 +71,20 @@ def genalgo(
     gen_id: str,
     game_generator: GameGenerator,
     comparator: Comparator,
+    metadata: Metadata,
     *,
-    population_size: int,
-    generation_limit: Optional[int],
     output_folder: Optional[str],
     output_frequency: int,
+    evaluator: Optional[PairEvaluator] = None,
+    scheduler: TournamentScheduler = round_robin,
+    cache: Optional[MatchupCache] = None,
 ):
+    population_size = metadata.population_size
+    generation_limit = metadata.generation_limit
+    seed = metadata.seed
     serializer = None
     if output_folder is not None:
         serializer = ParametersSerializer(output_folder, gen_id, output_frequency)
-        metadata = Metadata.create(
-            game_generator,
-            population_size,
-            generation_limit,
-            duration=DURATION,
-            fps=FPS,
-            speed_scale=SPEED_SCALE,
-        )
         serializer.serialize_metadata(metadata)
 
     def serialize(parameters_list, evaluations, force: bool = False):
@@ -67,18 +92,39 @@ def genalgo(
             serializer.serialize_evaluation(evaluations, force)
             serializer.serialize_parameters(parameters_list, force)
 
+    rng = GLOBAL_RNG if seed is None else derive_rng(seed, "evolution")
     parameters_list = create_initial_population(
-        population_size, game_generator().court.width
+        population_size, game_generator().court.width, rng
     )
 
-    generation_number = 0
-    with tqdm(total=generation_limit) as progress_bar:
-        while generation_limit is None or generation_number < generation_limit:
-            parameters_list = evolve(comparator, combine, parameters_list, serialize)
-            generation_number += 1
-            progress_bar.update(1)
-    _, evaluation = tournament(comparator, parameters_list)
-    serialize(parameters_list, evaluation, True)
+    try:
+        generation_number = 0
+        with tqdm(total=generation_limit) as progress_bar:
+            while generation_limit is None or generation_number < generation_limit:
+                parameters_list = evolve(
+                    comparator,
+                    combine,
+                    parameters_list,
+                    serialize,
+                    evaluator,
+                    scheduler,
+                    cache,
+                    rng,
+                )
+                if cache is not None:
+                    cache.save()
+                generation_number += 1
+                progress_bar.update(1)
+        _, evaluation = tournament(
+            comparator, parameters_list, evaluator, scheduler, cache
+        )
+        serialize(parameters_list, evaluation, True)
+        if cache is not None:
+            cache.save()
+    finally:
+        # Waits for the generations still being written
+        if serializer is not None:
+            serializer.close()
 
 
 def learn(
@@ -87,29 +133,61 @@ def learn(
     generation_limit: Optional[int] = None,
     output_folder: Optional[str] = None,
     output_frequency: int = 1,
+    scheduler: str = "round-robin",
+    seed: Optional[int] = None,
+    variance_reduction: Optional[VarianceReduction] = None,
+    early_stopping: Optional[EarlyStopping] = None,
+    backend: str = PYMUNK_BACKEND,
 ):
+    seeded = seed is not None
+    if seed is None:
+        seed = new_run_seed()
     gen_id = str(uuid.uuid1()).replace("-", "")[:16]
 
     def game_generator() -> Game:
         return evaluation_game(num_players)
 
+    metadata = Metadata.create(
+        game_generator,
+        population_size,
+        generation_limit,
+        duration=DURATION,
+        fps=FPS,
+        speed_scale=SPEED_SCALE,
+        seed=seed,
+        variance_reduction=variance_reduction,
+        early_stopping=early_stopping,
+        backend=backend,
+    )
+    compare_kwargs = metadata.compare_kwargs()
+
     def comparator(parameters_1: Parameters, parameters_2: Parameters):
-        game = game_generator()
-        return compare(
-            game,
-            parameters_1,
-            parameters_2,
-            duration=DURATION,
-            fps=FPS,
-            speed_scale=SPEED_SCALE,
-        )
+        return compare(game_generator(), parameters_1, parameters_2, **compare_kwargs)
 
-    genalgo(
-        gen_id,
-        game_generator,
-        comparator,
-        population_size=population_size,
-        generation_limit=generation_limit,
-        output_folder=output_folder,
-        output_frequency=output_frequency,
+    config = cache_config(metadata, game_generator())
+    if "seed" in config and not seeded and output_folder is not None:
+        tqdm.write(
+            f"{MATCHUP_CACHE_FILE} is only reused by runs with the same --seed,"
+            f" this run's seed is {seed}"
+        )
+    cache_path = (
+        None
+        if output_folder is None
+        else str(Path(output_folder).joinpath(MATCHUP_CACHE_FILE))
     )
+    cache = MatchupCache(config, cache_path)
+
+    with ComparisonPool(game_generator, **compare_kwargs) as pool:
+        genalgo(
+            gen_id,
+            game_generator,
+            comparator,
+            metadata,
+            output_folder=output_folder,
+            output_frequency=output_frequency,
+            evaluator=pool,
+            scheduler=scheduler_for(
+                scheduler, population_size, derive_rng(seed, "scheduler")
+            ),
+            cache=cache,
+        )
@@ -1,6 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass, asdict
-from typing import Any, Optional, List, Tuple, Callable
+from typing import Any, Optional, List, Tuple, Callable, Dict
+from bball.space import PYMUNK_BACKEND
+from ga.comparison import EarlyStopping, VarianceReduction
 
 
 @dataclass
@@ -17,6 +19,11 @@ class Metadata:
     duration: float
     fps: int
     speed_scale: float
+    # Run seed every random stream of the run is derived from
+    seed: Optional[int] = None
+    variance_reduction: Optional[VarianceReduction] = None
+    early_stopping: Optional[EarlyStopping] = None
+    backend: str = PYMUNK_BACKEND
 
     @staticmethod
     def create(
@@ -27,6 +34,10 @@ class Metadata:
         duration: float,
         fps: int,
         speed_scale: float,
+        seed: Optional[int] = None,
+        variance_reduction: Optional[VarianceReduction] = None,
+        early_stopping: Optional[EarlyStopping] = None,
+        backend: str = PYMUNK_BACKEND,
     ) -> Metadata:
         game = game_generator()
         teams = tuple(
@@ -43,4 +54,26 @@ class Metadata:
             duration,
             fps,
             speed_scale,
+            seed,
+            variance_reduction,
+            early_stopping,
+            backend,
         )
+
+    def compare_kwargs(self) -> Dict[str, Any]:
+        """Keyword arguments of compare and ComparisonPool for this run"""
+        return {
+            "duration": self.duration,
+            "fps": self.fps,
+            "speed_scale": self.speed_scale,
+            "seed": self.seed,
+            "variance_reduction": self.variance_reduction,
+            "early_stopping": self.early_stopping,
+            "backend": self.backend,
+        }
+
+    def game_config(self) -> Dict[str, Any]:
+        config = asdict(self)
+        del config["population_size"]
+        del config["generation_limit"]
+        return config
@@ -1,31 +1,81 @@
 from __future__ import annotations
-from random import random
-from copy import deepcopy
-from typing import Union, TYPE_CHECKING
-from runner import run_headless
+from dataclasses import dataclass, fields
+from functools import partial
+from random import Random
+from typing import Callable, Union, Sequence, List, Optional, Type, TYPE_CHECKING
+from bball.utils import GLOBAL_RNG
+from bball.space import PYMUNK_BACKEND
+from runner import run_headless, at_possession_boundaries
+from runner.setup import time_frame_for
+from ga.comparison import (
+    AntitheticRandom,
+    Comparison,
+    EarlyStopping,
+    VarianceReduction,
+    mean_and_standard_error,
+)
+from ga.seeding import SEED_BITS, derive_seed, matchup_seed
 from ga.parameters.regular_parameters import RegularParameters
 from ga.parameters.spaced_parameters import SpacedParameters
 
 if TYPE_CHECKING:
-    from bball import Game
+    from bball import Game, GameState, StrategyInterface
+    from runner.setup import StopCondition
 
 Parameters = Union[RegularParameters, SpacedParameters]
 
+PERIODS = 2
+
+PARAMETERS_TYPES: List[Type[Parameters]] = [RegularParameters, SpacedParameters]
+VECTOR_SIZE = 1 + max(
+    len(fields(parameters_type)) - 1 for parameters_type in PARAMETERS_TYPES
+)
+
+
+def to_vector(parameters: Parameters) -> List[float]:
+    """
+    Encodes parameters as [type index, *fields] padded to VECTOR_SIZE floats,
+    so populations can be shipped to worker processes as a flat array
+    """
+    type_index = PARAMETERS_TYPES.index(type(parameters))
+    values = [
+        float(getattr(parameters, field_obj.name))
+        for field_obj in fields(parameters)
+        if field_obj.name != "type"
+    ]
+    vector = [float(type_index), *values]
+    return vector + [0.0] * (VECTOR_SIZE - len(vector))
+
+
+def from_vector(vector: Sequence[float]) -> Parameters:
+    parameters_type = PARAMETERS_TYPES[int(vector[0])]
+    vector_fields = [
+        field_obj for field_obj in fields(parameters_type) if field_obj.name != "type"
+    ]
+    values = [
+        bool(value) if field_obj.type in ("bool", bool) else float(value)
+        for field_obj, value in zip(vector_fields, vector[1:])
+    ]
+    return parameters_type(*values)  # type: ignore
+
 
 def combine(
-    parameters_1: Parameters, parameters_2: Parameters, probability: float
+    parameters_1: Parameters,
+    parameters_2: Parameters,
+    probability: float,
+    rng: Random = GLOBAL_RNG,
 ) -> Parameters:
     regular_2 = isinstance(parameters_2, RegularParameters)
 
     if isinstance(parameters_1, RegularParameters) and isinstance(
         parameters_2, RegularParameters
     ):
-        return parameters_1.crossover(parameters_2, probability)
+        return parameters_1.crossover(parameters_2, probability, rng)
 
     if isinstance(parameters_1, SpacedParameters) and isinstance(
         parameters_2, SpacedParameters
     ):
-        return parameters_1.crossover(parameters_2, probability)
+        return parameters_1.crossover(parameters_2, probability, rng)
 
     if regular_2:
         parameters_1, parameters_2 = parameters_2, parameters_1
@@ -33,7 +83,7 @@ def combine(
     assert isinstance(parameters_1, RegularParameters)
     assert isinstance(parameters_2, SpacedParameters)
 
-    if random() < 0.5:
+    if rng.random() < 0.5:
         return parameters_1.crossover(
             RegularParameters(
                 parameters_2.spacing_distance,
@@ -41,6 +91,7 @@ def combine(
                 parameters_2.width,
             ),
             probability,
+            rng,
         )
     return parameters_2.crossover(
         SpacedParameters(
@@ -52,35 +103,196 @@ def combine(
             parameters_1.width,
         ),
         probability,
+        rng,
     )
 
 
-def compare(
+@dataclass
+class _SampleProgress:
+    # Steps the periods of a sample ran and whether it stopped as decided. The
+    # game clock skips substeps with ball transitions, so steps are counted
+    steps: int = 0
+    decided: bool = False
+
+
+def _decided_condition(
+    early_stopping: EarlyStopping,
+    progress: _SampleProgress,
+    *,
+    carried_scores: List[float],
+    teams: List[int],
+    time_frame: float,
+    remaining_time: float,
+    min_possession_duration: float,
+    max_points_per_possession: float,
+) -> StopCondition:
+    # remaining_time covers this period and the ones after it, teams maps team
+    # indices of this period to the side (0 for parameters_1) playing them
+    start_steps = progress.steps
+
+    def is_decided(game: Game) -> bool:
+        scores = list(carried_scores)
+        for team_index, side in enumerate(teams):
+            scores[side] += game.scoreboard.score[team_index]
+        elapsed_time = (progress.steps - start_steps) * time_frame
+        progress.decided = early_stopping.is_decided(
+            scores[0] - scores[1],
+            remaining_time - elapsed_time,
+            min_possession_duration,
+            max_points_per_possession,
+        )
+        return progress.decided
+
+    should_stop: StopCondition = is_decided
+    if early_stopping.at_possession_boundaries:
+        should_stop = at_possession_boundaries(is_decided)
+
+    def count_steps(game: Game) -> bool:
+        if should_stop(game):
+            return True
+        progress.steps += 1
+        return False
+
+    return count_steps
+
+
+def _play_sample(
     game: Game,
-    parameters_1: Parameters,
-    parameters_2: Parameters,
+    template: GameState,
+    strategies: List[StrategyInterface],
     *,
     duration: float,
     fps: int,
-    speed_scale: float = 1.0,
+    speed_scale: float,
+    backend: str = PYMUNK_BACKEND,
+    rng_for_period: Optional[Callable[[], Random]] = None,
+    early_stopping: Optional[EarlyStopping] = None,
 ) -> float:
-    indexed_strategies = [
-        (0, parameters_1.strategy()),
-        (1, parameters_2.strategy()),
-    ]
-    periods = 2
+    # Both periods of one sample, strategies[0] plays team 0 in the first one
+    indexed_strategies = list(enumerate(strategies))
     total_scores = [0.0, 0.0]
-    for _ in range(periods):
-        game_copy = deepcopy(game)
+    time_frame = time_frame_for(fps, speed_scale)
+    progress = _SampleProgress()
+    for period in range(PERIODS):
+        game.restore(template)
+        if rng_for_period is not None:
+            game.rng = rng_for_period()
         for team_index, indexed_strategy in enumerate(indexed_strategies):
-            total_scores[indexed_strategy[0]] -= game_copy.scoreboard.score[team_index]
-            game_copy.assign_team_strategy(team_index, indexed_strategy[1])
+            total_scores[indexed_strategy[0]] -= game.scoreboard.score[team_index]
+            game.assign_team_strategy(team_index, indexed_strategy[1])
 
+        should_stop = None
+        if early_stopping is not None:
+            should_stop = _decided_condition(
+                early_stopping,
+                progress,
+                carried_scores=list(total_scores),
+                teams=[indexed_strategy[0] for indexed_strategy in indexed_strategies],
+                time_frame=time_frame,
+                remaining_time=(PERIODS - period) * duration / PERIODS,
+                min_possession_duration=game.min_possession_duration(),
+                max_points_per_possession=game.max_points_per_possession(),
+            )
         scoreboard = run_headless(
-            game_copy, fps, speed_scale, duration / periods
+            game,
+            fps,
+            speed_scale,
+            duration / PERIODS,
+            backend=backend,
+            should_stop=should_stop,
         ).scoreboard
         for team_index, indexed_strategy in enumerate(indexed_strategies):
             total_scores[indexed_strategy[0]] += scoreboard.score[team_index]
         indexed_strategies = list(reversed(indexed_strategies))
+    margin = total_scores[0] - total_scores[1]
+    if progress.decided:
+        # Scale the margin up to the full sample so stopped and full samples
+        # sum to comparable fitness
+        return margin * duration / (progress.steps * time_frame)
+    return margin
+
+
+def _has_random_outcomes(game: Game, strategies: List[StrategyInterface]) -> bool:
+    if not game.settings.use_expected_value_for_points:
+        return True
+    return any(strategy.draws_random_numbers for strategy in strategies)
+
+
+def _reduced_variance_comparison(
+    game: Game,
+    variance_reduction: VarianceReduction,
+    play_sample: Callable[..., float],
+) -> Comparison:
+    base_seed = game.rng.getrandbits(SEED_BITS)
+    observations: List[float] = []
+    while not variance_reduction.is_done(observations):
+        # Common random numbers, both periods replay the sample's stream
+        sample_seed = derive_seed(base_seed, len(observations))
+        observation = play_sample(rng_for_period=partial(Random, sample_seed))
+        if variance_reduction.antithetic:
+            antithetic_observation = play_sample(
+                rng_for_period=partial(AntitheticRandom, sample_seed)
+            )
+            observation = (observation + antithetic_observation) / 2
+        observations.append(observation)
+    mean, standard_error = mean_and_standard_error(observations)
+    return Comparison(mean, len(observations), standard_error)
+
+
+def compare(
+    game: Game,
+    parameters_1: Parameters,
+    parameters_2: Parameters,
+    *,
+    duration: float,
+    fps: int,
+    speed_scale: float = 1.0,
+    seed: Optional[int] = None,
+    variance_reduction: Optional[VarianceReduction] = None,
+    early_stopping: Optional[EarlyStopping] = None,
+    backend: str = PYMUNK_BACKEND,
+) -> float:
+    """
+    Score difference of parameters_1 over parameters_2 across two periods with
+    swapped sides. With a run seed the game draws from a stream derived from
+    it and the matchup, so the result is the same in every process.
+
+    With variance_reduction, duration is the length of one sample and the
+    result is a Comparison averaging as many samples as the matchup needs,
+    or of a single sample when nothing in the game is random.
+    With early_stopping, samples whose winner is already decided end early
+    and their margin is scaled up to the full duration.
+    backend selects the Space backend the periods are played in
+    """
+    strategies = [parameters_1.strategy(), parameters_2.strategy()]
+    # Every period starts from the same template, restored in place instead of
+    # deepcopying the game; the game is handed back as it was passed in
+    template = game.snapshot()
+    original_strategies = [team._strategy for team in game.teams]
+    original_rng = game.rng
+    if seed is not None:
+        game.seed(matchup_seed(seed, parameters_1, parameters_2))
+    play_sample = partial(
+        _play_sample,
+        game,
+        template,
+        strategies,
+        duration=duration,
+        fps=fps,
+        speed_scale=speed_scale,
+        backend=backend,
+        early_stopping=early_stopping,
+    )
+    if variance_reduction is None:
+        delta = play_sample()
+    elif not _has_random_outcomes(game, strategies):
+        # Every sample would play out the same
+        delta = Comparison(play_sample(), 1, 0.0)
+    else:
+        delta = _reduced_variance_comparison(game, variance_reduction, play_sample)
 
-    return total_scores[0] - total_scores[1]
+    game.restore(template)
+    for team, strategy in zip(game.teams, original_strategies):
+        team._strategy = strategy
+    game.rng = original_rng
+    return delta
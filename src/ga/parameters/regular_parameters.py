@@ -1,8 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from random import uniform
+from random import Random
 from bball.create import create_strategy
-from bball.utils import clamp
+from bball.utils import clamp, GLOBAL_RNG
 from ga.utils import crossover, mutate
 from ga.evolution_types import IndividualInterface
 
@@ -25,22 +25,28 @@ class RegularParameters(IndividualInterface):
         )
 
     @staticmethod
-    def generate_random(width: float) -> RegularParameters:
+    def generate_random(width: float, rng: Random = GLOBAL_RNG) -> RegularParameters:
         return RegularParameters(
-            uniform(*SHOOTING_DISTANCE_RANGE),
-            uniform(*DEFENSIVE_TIGHTNESS_RANGE),
+            rng.uniform(*SHOOTING_DISTANCE_RANGE),
+            rng.uniform(*DEFENSIVE_TIGHTNESS_RANGE),
             width,
         )
 
-    def mutate(self, delta: float, p_change: float) -> RegularParameters:
-        shooting_distance = mutate(self.shooting_distance, delta, p_change)
-        defensive_tightness = mutate(self.defensive_tightness, delta, p_change)
+    def mutate(
+        self, delta: float, p_change: float, rng: Random = GLOBAL_RNG
+    ) -> RegularParameters:
+        shooting_distance = mutate(self.shooting_distance, delta, p_change, rng)
+        defensive_tightness = mutate(self.defensive_tightness, delta, p_change, rng)
         return RegularParameters(shooting_distance, defensive_tightness, self.width)
 
-    def crossover(self, other: RegularParameters, p_first: float) -> RegularParameters:
+    def crossover(
+        self, other: RegularParameters, p_first: float, rng: Random = GLOBAL_RNG
+    ) -> RegularParameters:
         return RegularParameters(
-            crossover(self.shooting_distance, other.shooting_distance, p_first),
-            crossover(self.defensive_tightness, other.defensive_tightness, p_first),
+            crossover(self.shooting_distance, other.shooting_distance, p_first, rng),
+            crossover(
+                self.defensive_tightness, other.defensive_tightness, p_first, rng
+            ),
             self.width,
         )
 
@@ -0,0 +1,174 @@
+from __future__ import annotations
+import json
+import queue
+import struct
+import threading
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+LOG_FILE_NAME = "run_log.jsonl"
+INDEX_FILE_NAME = "run_log.idx"
+
+PARAMETERS = "parameters"
+EVALUATION = "evaluation"
+KINDS = (PARAMETERS, EVALUATION)
+
+# generation, kind, offset and length of a line in the log
+INDEX_RECORD = struct.Struct("<qqqq")
+
+# Entries are (generation, kind index, offset, length)
+IndexEntry = Tuple[int, int, int, int]
+
+
+def _read_index(path: Path) -> List[IndexEntry]:
+    data = path.read_bytes()
+    # A record cut short by a crash is dropped, its line is rewritten on resume
+    usable = len(data) - len(data) % INDEX_RECORD.size
+    return list(INDEX_RECORD.iter_unpack(data[:usable]))
+
+
+def _scan_log(path: Path) -> List[IndexEntry]:
+    # Rebuilds the index of a log whose index is missing
+    entries = []
+    offset = 0
+    with open(path, "rb") as log_file:
+        for line in log_file:
+            if not line.endswith(b"\n"):
+                break
+            record = json.loads(line)
+            kind_index = KINDS.index(record["kind"])
+            entries.append((record["generation"], kind_index, offset, len(line)))
+            offset += len(line)
+    return entries
+
+
+def _write_index(path: Path, entries: List[IndexEntry]):
+    with open(path, "wb") as index_file:
+        for entry in entries:
+            index_file.write(INDEX_RECORD.pack(*entry))
+
+
+def _load_entries(folder: Path) -> List[IndexEntry]:
+    log_path = folder.joinpath(LOG_FILE_NAME)
+    index_path = folder.joinpath(INDEX_FILE_NAME)
+    if not log_path.exists():
+        return []
+    if not index_path.exists():
+        entries = _scan_log(log_path)
+        _write_index(index_path, entries)
+        return entries
+    return _read_index(index_path)
+
+
+class RunLogWriter:
+    """
+    Appends generation records to one JSONL file from a background thread, so
+    callers only pay for converting records to plain objects. Every line gets
+    a fixed size record in the index file once it is written. Errors of the
+    writer thread are raised by the next append / flush / close
+    """
+
+    def __init__(self, folder: Path):
+        self._folder = folder
+        entries = _load_entries(folder)
+        end = max((offset + length for _, _, offset, length in entries), default=0)
+        self._log_file = open(folder.joinpath(LOG_FILE_NAME), "ab")
+        # Drops a partially written last line, it has no index record
+        self._log_file.truncate(end)
+        self._index_file = open(folder.joinpath(INDEX_FILE_NAME), "ab")
+        self._index_file.truncate(len(entries) * INDEX_RECORD.size)
+        self._offset = end
+        self._queue: queue.Queue = queue.Queue()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._write_records, daemon=True)
+        self._thread.start()
+
+    def append(self, generation: int, kind: str, data: Any):
+        assert kind in KINDS
+        self._raise_error()
+        self._queue.put((generation, kind, data))
+
+    def flush(self):
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        self._log_file.close()
+        self._index_file.close()
+        self._raise_error()
+
+    def __enter__(self) -> RunLogWriter:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def _raise_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _write_records(self):
+        while True:
+            record = self._queue.get()
+            try:
+                if record is None:
+                    return
+                if self._error is None:
+                    self._write_record(*record)
+            except Exception as error:  # pylint: disable=broad-except
+                self._error = error
+            finally:
+                self._queue.task_done()
+
+    def _write_record(self, generation: int, kind: str, data: Any):
+        record = {"generation": generation, "kind": kind, "data": data}
+        line = (json.dumps(record) + "\n").encode("utf-8")
+        self._log_file.write(line)
+        # The line is complete on disk before its index record points at it
+        self._log_file.flush()
+        entry = (generation, KINDS.index(kind), self._offset, len(line))
+        self._index_file.write(INDEX_RECORD.pack(*entry))
+        self._index_file.flush()
+        self._offset += len(line)
+
+
+class RunLogReader:
+    """
+    Reads records of a run log by seeking to the offsets of its index, which
+    is loaded once. Later records of the same generation and kind win
+    """
+
+    def __init__(self, folder: Path):
+        self._log_path = folder.joinpath(LOG_FILE_NAME)
+        self._entries: Dict[str, Dict[int, Tuple[int, int]]] = {
+            kind: {} for kind in KINDS
+        }
+        for generation, kind_index, offset, length in _load_entries(folder):
+            self._entries[KINDS[kind_index]][generation] = (offset, length)
+        self._generations = {
+            kind: sorted(entries) for kind, entries in self._entries.items()
+        }
+
+    @staticmethod
+    def exists(folder: Path) -> bool:
+        return folder.joinpath(LOG_FILE_NAME).exists()
+
+    def generations(self, kind: str) -> List[int]:
+        return self._generations[kind]
+
+    def latest_at_or_below(self, generation: int, kind: str) -> Optional[int]:
+        generations = self._generations[kind]
+        position = bisect_right(generations, generation)
+        return generations[position - 1] if position > 0 else None
+
+    def read(self, generation: int, kind: str) -> Any:
+        offset, length = self._entries[kind][generation]
+        with open(self._log_path, "rb") as log_file:
+            log_file.seek(offset)
+            line = log_file.read(length)
+        return json.loads(line)["data"]
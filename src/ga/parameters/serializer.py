@@ -1,14 +1,28 @@
 from __future__ import annotations
 from dataclasses import dataclass, asdict, field
-from typing import Sequence, Optional, Tuple
+from bisect import bisect_right
+from typing import List, Sequence, Optional, Tuple
 from pathlib import Path
 import json
 from tqdm import tqdm
 from ga.metadata import Metadata, TeamMetadata
+from ga.comparison import EarlyStopping, VarianceReduction
 from ga.evaluation import Evaluation
 from ga.parameters.parameters import Parameters
 from ga.parameters.regular_parameters import RegularParameters
 from ga.parameters.spaced_parameters import SpacedParameters
+from ga.parameters.run_log import (
+    RunLogReader,
+    RunLogWriter,
+    PARAMETERS,
+    EVALUATION,
+)
+
+# Metadata fields that are dataclasses, stored as json objects
+CONFIG_TYPES = {
+    "variance_reduction": VarianceReduction,
+    "early_stopping": EarlyStopping,
+}
 
 
 def generation_file_name(generation_number: int):
@@ -22,10 +36,6 @@ def generation_index(file_name: str) -> Optional[int]:
         return None
 
 
-def evaluations_file_name(generation_number: int):
-    return f"evaluations_{generation_number}.json"
-
-
 def metadata_file_name():
     return "metadata.json"
 
@@ -66,12 +76,19 @@ def _read_json(file_path: Path, *, log=False):
 
 @dataclass
 class ParametersSerializer:
+    """
+    Writes generations and evaluations to the run log of the folder, in the
+    background. Metadata stays a json file next to it. close() waits for every
+    pending write
+    """
+
     folder: str
     identifier: Optional[str] = None
     serialize_gap: int = 0
     _basepath: Path = field(init=False)
     _generation_number: int = field(init=False, default=0)
     _last_serialized_generation: int = field(init=False, default=0)
+    _run_log: RunLogWriter = field(init=False)
 
     def __post_init__(self):
         if self.identifier is not None:
@@ -82,6 +99,16 @@ class ParametersSerializer:
             else Path(self.folder)
         )
         self._basepath.mkdir(exist_ok=True, parents=False)
+        self._run_log = RunLogWriter(self._basepath)
+
+    def close(self):
+        self._run_log.close()
+
+    def __enter__(self) -> ParametersSerializer:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
 
     def _should_serialize(self):
         is_first = self._generation_number == 0
@@ -98,19 +125,19 @@ class ParametersSerializer:
         self, parameters_list: Sequence[Parameters], force: bool = False
     ):
         if self._should_serialize() or force:
-            file_name = generation_file_name(self._generation_number)
-            path = self._basepath.joinpath(file_name)
-            _write_json(
-                path, [asdict(parameters) for parameters in parameters_list], log=True
+            self._run_log.append(
+                self._generation_number,
+                PARAMETERS,
+                [asdict(parameters) for parameters in parameters_list],
             )
             self._last_serialized_generation = self._generation_number
         self._generation_number += 1
 
     def serialize_evaluation(self, evaluations: Evaluation, force: bool = False):
         if self._should_serialize() or force:
-            file_name = evaluations_file_name(self._generation_number)
-            path = self._basepath.joinpath(file_name)
-            _write_json(path, asdict(evaluations), log=True)
+            self._run_log.append(
+                self._generation_number, EVALUATION, asdict(evaluations)
+            )
 
     def serialize_metadata(self, metadata: Metadata):
         file_name = metadata_file_name()
@@ -130,46 +157,53 @@ def to_parameters(obj) -> Parameters:
 
 @dataclass
 class ParametersDeserializer:
+    """
+    Reads the run log of a folder, folders written before run logs existed
+    hold one json file per generation instead
+    """
+
     folder: str
     _basepath: Path = field(init=False)
+    _run_log: Optional[RunLogReader] = field(init=False, default=None)
 
     def __post_init__(self):
         self._basepath = Path(self.folder)
         assert self._basepath.is_dir()
-
-    def _find_max_generation_in_folder(self) -> int:
-        file_names = [path.name for path in self._basepath.glob("*.json")]
-        highest_generation = 0
-        for file_name in file_names:
-            generation_number = generation_index(file_name)
-            if generation_number is None:
-                continue
-            highest_generation = max(highest_generation, generation_number)
-        return highest_generation
+        if RunLogReader.exists(self._basepath):
+            run_log = RunLogReader(self._basepath)
+            # Evaluating an old folder only logs evaluations next to its files
+            if run_log.generations(PARAMETERS):
+                self._run_log = run_log
+
+    def _generations(self) -> List[int]:
+        if self._run_log is not None:
+            return self._run_log.generations(PARAMETERS)
+        file_names = [path.name for path in self._basepath.glob("generation_*.json")]
+        generations = (generation_index(file_name) for file_name in file_names)
+        return sorted(
+            generation for generation in generations if generation is not None
+        )
 
     def _max_generation_that_exists_below(self, generation_number: int) -> int:
-        original_number = generation_number
-        while generation_number >= 0:
-            file_name = generation_file_name(generation_number)
-            path = self._basepath.joinpath(file_name)
-            if path.exists():
-                return generation_number
-            generation_number -= 1
-        return original_number
+        generations = self._generations()
+        position = bisect_right(generations, generation_number)
+        return generations[position - 1] if position > 0 else generation_number
 
     def deserialize_parameters(
         self, generation_number: Optional[int]
     ) -> Tuple[int, Sequence[Parameters]]:
         if generation_number is None:
-            generation_number = self._find_max_generation_in_folder()
+            generation_number = max(self._generations(), default=0)
         else:
             generation_number = self._max_generation_that_exists_below(
                 generation_number
             )
-        file_name = generation_file_name(generation_number)
-        path = self._basepath.joinpath(file_name)
-        assert isinstance(path, Path)
-        parameters_objs = _read_json(path, log=True)
+        if self._run_log is not None:
+            tqdm.write(f"reading generation {generation_number} of {self._basepath}")
+            parameters_objs = self._run_log.read(generation_number, PARAMETERS)
+        else:
+            file_name = generation_file_name(generation_number)
+            parameters_objs = _read_json(self._basepath.joinpath(file_name), log=True)
         parameters_list = []
         for parameters_obj in parameters_objs:
             parameters_list.append(to_parameters(parameters_obj))
@@ -182,4 +216,7 @@ class ParametersDeserializer:
         team_metadata_1 = TeamMetadata(**json_data["teams"][0])
         team_metadata_2 = TeamMetadata(**json_data["teams"][0])
         json_data.pop("teams")
+        for name, config_type in CONFIG_TYPES.items():
+            if json_data.get(name) is not None:
+                json_data[name] = config_type(**json_data[name])
         return Metadata((team_metadata_1, team_metadata_2), **json_data)
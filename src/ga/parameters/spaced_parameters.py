@@ -1,8 +1,8 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from random import uniform, choice
+from random import Random
 from bball.create import created_spaced_strategy
-from bball.utils import clamp
+from bball.utils import clamp, GLOBAL_RNG
 from ga.utils import crossover, mutate
 from ga.evolution_types import IndividualInterface
 
@@ -35,22 +35,26 @@ class SpacedParameters(IndividualInterface):
         self.spacing_distance = clamp(self.spacing_distance, 0, self.width)
 
     @staticmethod
-    def generate_random(width: float) -> SpacedParameters:
+    def generate_random(width: float, rng: Random = GLOBAL_RNG) -> SpacedParameters:
         return SpacedParameters(
-            uniform(*SPACING_DISTANCE_RANGE),
-            uniform(*SHOT_QUALITY_RANGE),
-            uniform(*PASS_PROBABILITY_RANGE),
-            choice([True, False]),
-            uniform(*DEFENSIVE_TIGHTNESS_RANGE),
+            rng.uniform(*SPACING_DISTANCE_RANGE),
+            rng.uniform(*SHOT_QUALITY_RANGE),
+            rng.uniform(*PASS_PROBABILITY_RANGE),
+            rng.choice([True, False]),
+            rng.uniform(*DEFENSIVE_TIGHTNESS_RANGE),
             width,
         )
 
-    def mutate(self, delta: float, p_change: float) -> SpacedParameters:
-        spacing_distance = mutate(self.spacing_distance, delta, p_change)
-        shot_quality_threshold = mutate(self.shot_quality_threshold, delta, p_change)
-        pass_probability = mutate(self.pass_probability, delta, p_change)
-        dive_to_basket = mutate(self.dive_to_basket, True, p_change)
-        defensive_tightness = mutate(self.defensive_tightness, delta, p_change)
+    def mutate(
+        self, delta: float, p_change: float, rng: Random = GLOBAL_RNG
+    ) -> SpacedParameters:
+        spacing_distance = mutate(self.spacing_distance, delta, p_change, rng)
+        shot_quality_threshold = mutate(
+            self.shot_quality_threshold, delta, p_change, rng
+        )
+        pass_probability = mutate(self.pass_probability, delta, p_change, rng)
+        dive_to_basket = mutate(self.dive_to_basket, True, p_change, rng)
+        defensive_tightness = mutate(self.defensive_tightness, delta, p_change, rng)
         return SpacedParameters(
             spacing_distance,
             shot_quality_threshold,
@@ -60,15 +64,19 @@ class SpacedParameters(IndividualInterface):
             self.width,
         )
 
-    def crossover(self, other: SpacedParameters, p_first: float) -> SpacedParameters:
+    def crossover(
+        self, other: SpacedParameters, p_first: float, rng: Random = GLOBAL_RNG
+    ) -> SpacedParameters:
         return SpacedParameters(
-            crossover(self.spacing_distance, other.spacing_distance, p_first),
+            crossover(self.spacing_distance, other.spacing_distance, p_first, rng),
+            crossover(
+                self.shot_quality_threshold, other.shot_quality_threshold, p_first, rng
+            ),
+            crossover(self.pass_probability, other.pass_probability, p_first, rng),
+            crossover(self.dive_to_basket, other.dive_to_basket, p_first, rng),
             crossover(
-                self.shot_quality_threshold, other.shot_quality_threshold, p_first
+                self.defensive_tightness, other.defensive_tightness, p_first, rng
             ),
-            crossover(self.pass_probability, other.pass_probability, p_first),
-            crossover(self.dive_to_basket, other.dive_to_basket, p_first),
-            crossover(self.defensive_tightness, other.defensive_tightness, p_first),
             self.width,
         )
 
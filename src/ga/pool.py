@@ -0,0 +1,158 @@
+from __future__ import annotations
+import math
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Any, TYPE_CHECKING
+import numpy as np
+import multiprocess as mp  # type: ignore
+from multiprocess import shared_memory, resource_tracker  # type: ignore
+from bball.space import PYMUNK_BACKEND
+from ga.parameters import compare
+from ga.parameters.parameters import to_vector, from_vector, VECTOR_SIZE
+
+if TYPE_CHECKING:
+    from bball import Game
+    from ga.evolution_types import Population, IndexPair
+    from ga.comparison import EarlyStopping, VarianceReduction
+
+    GameGenerator = Callable[[], Game]
+
+CHUNKS_PER_WORKER = 4
+
+
+def worker_count() -> int:
+    # Leave some headroom on big machines without going to 0 on small runners
+    return max(1, mp.cpu_count() - 2)  # pylint: disable=no-member
+
+
+class _WorkerState:
+    template: Game
+    compare_kwargs: Dict[str, Any]
+    shared_population: Optional[Any] = None
+    population: Optional[np.ndarray] = None
+
+
+_worker = _WorkerState()
+
+
+def _initialize_worker(game_generator: GameGenerator, compare_kwargs: Dict[str, Any]):
+    _worker.template = game_generator()
+    _worker.compare_kwargs = compare_kwargs
+
+
+def _attach_population(name: str, shape: Tuple[int, int]) -> np.ndarray:
+    shared_population = _worker.shared_population
+    if shared_population is None or shared_population.name != name:
+        if shared_population is not None:
+            _worker.population = None
+            shared_population.close()
+        shared_population = shared_memory.SharedMemory(name=name)
+        # Attaching registers the segment as if this worker owned it, the
+        # parent process is the one that unlinks it
+        resource_tracker.unregister(shared_population._name, "shared_memory")
+        _worker.shared_population = shared_population
+        _worker.population = np.ndarray(
+            shape, dtype=np.float64, buffer=shared_population.buf
+        )
+    assert _worker.population is not None
+    return _worker.population
+
+
+def _compare_chunk(
+    name: str, shape: Tuple[int, int], index_pairs: Sequence[IndexPair]
+) -> List[float]:
+    population = _attach_population(name, shape)
+    return [
+        compare(
+            _worker.template,
+            from_vector(population[i]),
+            from_vector(population[j]),
+            **_worker.compare_kwargs,
+        )
+        for i, j in index_pairs
+    ]
+
+
+def _chunked(items: Sequence[IndexPair], chunk_size: int) -> List[Sequence[IndexPair]]:
+    return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+class ComparisonPool:
+    """
+    Worker processes that live across generations, each holding a template
+    game built once by game_generator. Populations are written to shared
+    memory as parameter vectors and workers only receive chunks of index pairs.
+    Every comparison is seeded from seed and its matchup, so results don't
+    depend on which worker ran them
+    """
+
+    _pool: Any
+    _processes: int
+
+    def __init__(
+        self,
+        game_generator: GameGenerator,
+        *,
+        duration: float,
+        fps: int,
+        speed_scale: float = 1.0,
+        seed: Optional[int] = None,
+        variance_reduction: Optional[VarianceReduction] = None,
+        early_stopping: Optional[EarlyStopping] = None,
+        backend: str = PYMUNK_BACKEND,
+        processes: Optional[int] = None,
+    ):
+        self._processes = processes if processes is not None else worker_count()
+        assert self._processes > 0
+        compare_kwargs = {
+            "duration": duration,
+            "fps": fps,
+            "speed_scale": speed_scale,
+            "seed": seed,
+            "variance_reduction": variance_reduction,
+            "early_stopping": early_stopping,
+            "backend": backend,
+        }
+        # pylint: disable=not-callable
+        self._pool = mp.Pool(
+            self._processes,
+            initializer=_initialize_worker,
+            initargs=(game_generator, compare_kwargs),
+        )
+
+    def __enter__(self) -> ComparisonPool:
+        return self
+
+    def __exit__(self, *_args):
+        self.close()
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+    def _chunk_size(self, num_pairs: int) -> int:
+        return max(1, math.ceil(num_pairs / (self._processes * CHUNKS_PER_WORKER)))
+
+    def __call__(
+        self, population: Population, index_pairs: Sequence[IndexPair]
+    ) -> List[float]:
+        if len(index_pairs) == 0:
+            return []
+        vectors = np.array(
+            [to_vector(individual) for individual in population],  # type: ignore
+            dtype=np.float64,
+        )
+        assert vectors.shape == (len(population), VECTOR_SIZE)
+        shared_population = shared_memory.SharedMemory(create=True, size=vectors.nbytes)
+        try:
+            np.ndarray(vectors.shape, dtype=np.float64, buffer=shared_population.buf)[
+                :
+            ] = vectors
+            chunks = _chunked(list(index_pairs), self._chunk_size(len(index_pairs)))
+            results = self._pool.starmap(
+                _compare_chunk,
+                [(shared_population.name, vectors.shape, chunk) for chunk in chunks],
+                chunksize=1,
+            )
+        finally:
+            shared_population.close()
+            shared_population.unlink()
+        return [delta for chunk_result in results for delta in chunk_result]
@@ -0,0 +1,229 @@
+from __future__ import annotations
+import math
+from dataclasses import dataclass, field
+from random import Random
+from typing import List, Sequence, Set, Tuple
+from ga.evolution_types import (
+    Population,
+    PairEvaluator,
+    TournamentScheduler,
+    Delta,
+    IndexPair,
+)
+from bball.utils import GLOBAL_RNG
+
+
+def round_robin(
+    population: Population, evaluator: PairEvaluator
+) -> Tuple[List[Delta], List[float]]:
+    index_pairs = [
+        (i, j) for i in range(0, len(population)) for j in range(i + 1, len(population))
+    ]
+    score_differences = evaluator(population, index_pairs)
+
+    fitness = [float("inf") for _ in population]
+    deltas = []
+    for (i, j), delta in zip(index_pairs, score_differences):
+        fitness[i] = min(fitness[i], delta)
+        fitness[j] = min(fitness[j], -delta)
+        deltas.append((i, j, delta))
+    return deltas, fitness
+
+
+def _result(delta: float) -> float:
+    if delta > 0:
+        return 1.0
+    if delta < 0:
+        return 0.0
+    return 0.5
+
+
+def _pair_adjacent(ranked: Sequence[int], played: Set[IndexPair]) -> List[IndexPair]:
+    """
+    Pairs each individual with the closest ranked individual it has not played
+    yet, falling back to a rematch when every remaining opponent was played
+    """
+    remaining = list(ranked)
+    pairs = []
+    while remaining:
+        first = remaining.pop(0)
+        opponent_position = next(
+            (
+                position
+                for position, other in enumerate(remaining)
+                if (min(first, other), max(first, other)) not in played
+            ),
+            0,
+        )
+        second = remaining.pop(opponent_position)
+        pairs.append((min(first, second), max(first, second)))
+    return pairs
+
+
+def _evaluate_round(
+    population: Population,
+    evaluator: PairEvaluator,
+    index_pairs: List[IndexPair],
+    deltas: List[Delta],
+) -> List[Delta]:
+    round_deltas = [
+        (i, j, delta)
+        for (i, j), delta in zip(index_pairs, evaluator(population, index_pairs))
+    ]
+    deltas.extend(round_deltas)
+    return round_deltas
+
+
+@dataclass
+class SwissScheduler:
+    """
+    Swiss-system rounds, each round pairs individuals with the same (or
+    closest) number of points, fitness is points with score difference as the
+    tiebreaker
+    """
+
+    rounds: int
+    rng: Random = field(default=GLOBAL_RNG, repr=False)
+
+    def __call__(
+        self, population: Population, evaluator: PairEvaluator
+    ) -> Tuple[List[Delta], List[float]]:
+        assert len(population) % 2 == 0
+        num_rounds = min(self.rounds, len(population) - 1)
+        points = [0.0 for _ in population]
+        score_differences = [0.0 for _ in population]
+        played: Set[IndexPair] = set()
+        deltas: List[Delta] = []
+
+        order = list(range(len(population)))
+        self.rng.shuffle(order)
+        for _ in range(num_rounds):
+            ranked = sorted(
+                order,
+                key=lambda ind: (points[ind], score_differences[ind]),
+                reverse=True,
+            )
+            index_pairs = _pair_adjacent(ranked, played)
+            for i, j, delta in _evaluate_round(
+                population, evaluator, index_pairs, deltas
+            ):
+                played.add((i, j))
+                points[i] += _result(delta)
+                points[j] += _result(-delta)
+                score_differences[i] += delta
+                score_differences[j] -= delta
+
+        max_difference = max(abs(difference) for difference in score_differences)
+        tiebreak_scale = 0.5 / max_difference if max_difference > 0 else 0.0
+        fitness = [
+            point + tiebreak_scale * difference
+            for point, difference in zip(points, score_differences)
+        ]
+        return deltas, fitness
+
+
+@dataclass
+class RandomOpponentsScheduler:
+    """
+    Every individual plays k distinct random opponents, fitness is the average
+    score difference over the games it played
+    """
+
+    opponents: int
+    rng: Random = field(default=GLOBAL_RNG, repr=False)
+
+    def __call__(
+        self, population: Population, evaluator: PairEvaluator
+    ) -> Tuple[List[Delta], List[float]]:
+        num_opponents = min(self.opponents, len(population) - 1)
+        index_pairs_set: Set[IndexPair] = set()
+        for i in range(len(population)):
+            candidates = [j for j in range(len(population)) if j != i]
+            for j in self.rng.sample(candidates, num_opponents):
+                index_pairs_set.add((min(i, j), max(i, j)))
+        index_pairs = sorted(index_pairs_set)
+
+        deltas: List[Delta] = []
+        totals = [0.0 for _ in population]
+        counts = [0 for _ in population]
+        for i, j, delta in _evaluate_round(population, evaluator, index_pairs, deltas):
+            totals[i] += delta
+            totals[j] -= delta
+            counts[i] += 1
+            counts[j] += 1
+        fitness = [total / max(1, count) for total, count in zip(totals, counts)]
+        return deltas, fitness
+
+
+@dataclass
+class EloScheduler:
+    """
+    Rounds of games between individuals with similar Elo ratings, stops early
+    once the top half of the ranking (the individuals that would survive)
+    changes by at most a `tolerance` fraction for `patience` consecutive rounds
+    """
+
+    max_rounds: int
+    patience: int = 2
+    tolerance: float = 0.1
+    k_factor: float = 32.0
+    initial_rating: float = 1500.0
+    rng: Random = field(default=GLOBAL_RNG, repr=False)
+
+    def __call__(
+        self, population: Population, evaluator: PairEvaluator
+    ) -> Tuple[List[Delta], List[float]]:
+        assert len(population) % 2 == 0
+        assert self.patience > 0
+        ratings = [self.initial_rating for _ in population]
+        played: Set[IndexPair] = set()
+        deltas: List[Delta] = []
+
+        order = list(range(len(population)))
+        self.rng.shuffle(order)
+        ranking = list(order)
+        survivors: Set[int] = set()
+        unchanged_rounds = 0
+        for _ in range(self.max_rounds):
+            index_pairs = _pair_adjacent(ranking, played)
+            for i, j, delta in _evaluate_round(
+                population, evaluator, index_pairs, deltas
+            ):
+                played.add((i, j))
+                self._update(ratings, i, j, _result(delta))
+
+            ranking = sorted(order, key=lambda ind: ratings[ind], reverse=True)
+            new_survivors = set(ranking[: len(ranking) // 2])
+            changed = len(new_survivors - survivors)
+            if changed <= self.tolerance * len(new_survivors):
+                unchanged_rounds += 1
+                if unchanged_rounds >= self.patience:
+                    break
+            else:
+                unchanged_rounds = 0
+            survivors = new_survivors
+        return deltas, ratings
+
+    def _update(self, ratings: List[float], i: int, j: int, result: float):
+        expected = 1.0 / (1.0 + 10 ** ((ratings[j] - ratings[i]) / 400.0))
+        change = self.k_factor * (result - expected)
+        ratings[i] += change
+        ratings[j] -= change
+
+
+SCHEDULER_NAMES = ["round-robin", "swiss", "random", "elo"]
+
+
+def scheduler_for(
+    name: str, population_size: int, rng: Random = GLOBAL_RNG
+) -> TournamentScheduler:
+    log_size = max(1, math.ceil(math.log2(max(2, population_size))))
+    if name == "round-robin":
+        return round_robin
+    if name == "swiss":
+        return SwissScheduler(rounds=log_size + 2, rng=rng)
+    if name == "random":
+        return RandomOpponentsScheduler(opponents=log_size, rng=rng)
+    if name == "elo":
+        return EloScheduler(max_rounds=4 * log_size, rng=rng)
+    assert False, f"unknown scheduler {name}, expected one of {SCHEDULER_NAMES}"
@@ -0,0 +1,35 @@
+from __future__ import annotations
+from dataclasses import asdict
+from random import Random, SystemRandom
+from typing import Any
+from ga.cache import canonical_hash
+from ga.evolution_types import IndividualInterface
+
+SEED_BITS = 63
+
+
+def new_run_seed() -> int:
+    # Drawn from the OS so unseeded runs still record a seed to rerun them with
+    return SystemRandom().getrandbits(SEED_BITS)
+
+
+def derive_seed(seed: int, *keys: Any) -> int:
+    """
+    Seed of the stream named by keys within a run seeded with seed. Keys are
+    hashed as json, so the result is the same in every process and Python
+    version, unlike hash()
+    """
+    return int(canonical_hash([seed, *keys]), 16) >> (256 - SEED_BITS)
+
+
+def derive_rng(seed: int, *keys: Any) -> Random:
+    return Random(derive_seed(seed, *keys))
+
+
+def matchup_seed(
+    seed: int, individual_1: IndividualInterface, individual_2: IndividualInterface
+) -> int:
+    # Depends only on who plays whom, so repeated matchups replay exactly
+    return derive_seed(
+        seed, "matchup", asdict(individual_1), asdict(individual_2)  # type: ignore
+    )
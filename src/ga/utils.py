@@ -1,11 +1,12 @@
 from __future__ import annotations
+from random import Random
 from typing import TypeVar
-from random import uniform, random
+from bball.utils import GLOBAL_RNG
 
 
-def crossover(val1, val2, p_first: float):
-    if random() < 0.5:
-        if random() < p_first:
+def crossover(val1, val2, p_first: float, rng: Random = GLOBAL_RNG):
+    if rng.random() < 0.5:
+        if rng.random() < p_first:
             return val1
         return val2
     return (val1 + val2) / 2.0
@@ -14,10 +15,10 @@ def crossover(val1, val2, p_first: float):
 T = TypeVar("T", float, bool)
 
 
-def mutate(val: T, delta: T, prob: float):
-    if random() < prob:
+def mutate(val: T, delta: T, prob: float, rng: Random = GLOBAL_RNG):
+    if rng.random() < prob:
         if isinstance(val, float):
-            return val + uniform(-delta, delta)
+            return val + rng.uniform(-delta, delta)
         if isinstance(val, bool):
             return val ^ delta
         assert False
@@ -0,0 +1,181 @@
+from __future__ import annotations
+import random
+import shutil
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple
+import numpy as np
+import gym
+import multiprocess as mp  # type: ignore
+from stable_baselines3.common.base_class import BaseAlgorithm
+from stable_baselines3.common.callbacks import BaseCallback, EvalCallback
+from stable_baselines3.common.evaluation import evaluate_policy
+
+BEST_MODEL_NAME = "best_model.zip"
+
+
+class _EvaluatorState:
+    algo: Any
+    env: gym.Env
+
+
+_evaluator = _EvaluatorState()
+
+
+def _initialize_evaluator(algo: Any, env_generator: Callable[[], gym.Env], seed: int):
+    random.seed(seed)
+    np.random.seed(seed % 2**32)
+    _evaluator.algo = algo
+    _evaluator.env = env_generator()
+
+
+def _evaluate(
+    model_path: str, n_eval_episodes: int, deterministic: bool
+) -> Tuple[float, float]:
+    model = _evaluator.algo.load(model_path, device="cpu")
+    mean_reward, std_reward = evaluate_policy(
+        model,
+        _evaluator.env,
+        n_eval_episodes=n_eval_episodes,
+        deterministic=deterministic,
+        return_episode_rewards=False,
+    )
+    assert isinstance(mean_reward, float) and isinstance(std_reward, float)
+    return mean_reward, std_reward
+
+
+class AsyncEvalCallback(BaseCallback):
+    """
+    Replacement for EvalCallback that saves a snapshot of the model every
+    eval_freq calls and evaluates it in a separate process, so training keeps
+    stepping while evaluation episodes run. Results are logged once they are
+    ready, the best snapshot is kept as best_model_save_path/best_model.zip
+    """
+
+    def __init__(
+        self,
+        algo: Any,
+        env_generator: Callable[[], gym.Env],
+        snapshot_folder: Path,
+        best_model_save_path: Path,
+        *,
+        eval_freq: int,
+        n_eval_episodes: int = 5,
+        deterministic: bool = True,
+        seed: int = 0,
+        verbose: int = 0,
+    ):
+        super().__init__(verbose)
+        assert eval_freq > 0
+        self.eval_freq = eval_freq
+        self.n_eval_episodes = n_eval_episodes
+        self.deterministic = deterministic
+        self.snapshot_folder = snapshot_folder
+        self.best_model_save_path = best_model_save_path
+        self.best_mean_reward = -np.inf
+        self._pending: List[Tuple[int, Path, Any]] = []
+        # pylint: disable=not-callable
+        self._pool: Optional[Any] = mp.Pool(
+            1, initializer=_initialize_evaluator, initargs=(algo, env_generator, seed)
+        )
+
+    def _init_callback(self):
+        self.snapshot_folder.mkdir(parents=True, exist_ok=True)
+        self.best_model_save_path.mkdir(parents=True, exist_ok=True)
+
+    def _on_step(self) -> bool:
+        if self.n_calls % self.eval_freq == 0:
+            self._submit()
+        self._collect(wait=False)
+        return True
+
+    def _on_training_end(self):
+        try:
+            self._collect(wait=True)
+        finally:
+            self.close()
+
+    def close(self):
+        # Training that stops with an exception never reaches
+        # _on_training_end, so callers close the callback themselves
+        if self._pool is None:
+            return
+        pool, self._pool = self._pool, None
+        if self._pending:
+            pool.terminate()
+        else:
+            pool.close()
+        pool.join()
+        for _, snapshot_path, _ in self._pending:
+            snapshot_path.unlink(missing_ok=True)
+        self._pending = []
+
+    def _submit(self):
+        model: BaseAlgorithm = self.model
+        snapshot_path = self.snapshot_folder.joinpath(f"eval_{self.num_timesteps}.zip")
+        model.save(snapshot_path)
+        assert self._pool is not None, "evaluation callback is closed"
+        result = self._pool.apply_async(
+            _evaluate,
+            (str(snapshot_path), self.n_eval_episodes, self.deterministic),
+        )
+        self._pending.append((self.num_timesteps, snapshot_path, result))
+
+    def _collect(self, wait: bool):
+        # Results are handled in submission order, the worker evaluates one
+        # snapshot at a time
+        while self._pending and (wait or self._pending[0][2].ready()):
+            timesteps, snapshot_path, result = self._pending.pop(0)
+            mean_reward, std_reward = result.get()
+            self.logger.record("eval/mean_reward", mean_reward)
+            self.logger.record("eval/std_reward", std_reward)
+            self.logger.record("eval/timesteps", timesteps)
+            if self.verbose > 0:
+                print(
+                    f"Eval num_timesteps={timesteps}, "
+                    f"episode_reward={mean_reward:.2f} +/- {std_reward:.2f}"
+                )
+            if mean_reward > self.best_mean_reward:
+                self.best_mean_reward = mean_reward
+                shutil.copyfile(
+                    snapshot_path, self.best_model_save_path.joinpath(BEST_MODEL_NAME)
+                )
+            snapshot_path.unlink()
+
+
+def close_eval_callback(callback: BaseCallback):
+    # EvalCallback holds no processes
+    if isinstance(callback, AsyncEvalCallback):
+        callback.close()
+
+
+def make_eval_callback(
+    algo: Any,
+    env_generator: Callable[[], gym.Env],
+    output_folder: Path,
+    *,
+    eval_freq: int,
+    workers: int,
+    seed: int,
+    n_eval_episodes: int = 5,
+    monitor: Optional[Callable[[gym.Env], gym.Env]] = None,
+) -> BaseCallback:
+    # Serial runs keep the synchronous EvalCallback
+    wrap = monitor if monitor is not None else (lambda env: env)
+    if workers <= 1:
+        return EvalCallback(
+            wrap(env_generator()),
+            best_model_save_path=str(output_folder.joinpath("best")),
+            deterministic=True,
+            render=False,
+            eval_freq=eval_freq,
+            n_eval_episodes=n_eval_episodes,
+        )
+    return AsyncEvalCallback(
+        algo,
+        lambda: wrap(env_generator()),
+        output_folder.joinpath("eval_snapshots"),
+        output_folder.joinpath("best"),
+        eval_freq=eval_freq,
+        n_eval_episodes=n_eval_episodes,
+        seed=seed,
+    )
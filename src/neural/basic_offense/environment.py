@@ -1,11 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, List, Optional, Tuple
 import numpy as np
 import gym
 from gym import spaces
 from experiment.initiate import canonical_game
-from bball import BallMode
 from bball.create import create_space
 from bball.utils import (
     interpolation_coefficient,
@@ -14,12 +13,7 @@ from bball.utils import (
     in_range,
     close_to,
 )
-from stable_baselines3.common.env_checker import check_env
-
-import pygame
-from runner.draw import resolution_for, padded_resolution_for, Drawer
 from runner.setup import step_space, BACKGROUND_COLOR, time_frame_for
-from engine import Engine
 from bball.draw import draw_game
 
 if TYPE_CHECKING:
@@ -32,12 +26,18 @@ speed_scale = 3.0
 time_frame = time_frame_for(fps, speed_scale)
 display_scale = 0.3
 
+shot_value_scale = 1.0 * 10**0
+incorrect_action_scale = 1.0 * 10**1
+out_of_bounds_scale = 0  # 1.0 * 10**0
+energy_scale = 0.0  # 2.5 * 10**-3
+
 action_shape = (3,)
 action_dtype = np.float32
 Action = np.ndarray
 observation_shape = (7,)
 observation_dtype = np.float32
 Observation = np.ndarray
+start_state_batch_size = 1024
 
 
 def _validate_action(action: Action):
@@ -152,6 +152,46 @@ class PlayerState:
         )
 
 
+class StartStates:
+    """
+    Uniformly random (x, y, orientation_degrees) rows for the offensive player
+    at the start of an episode, drawn in batches of batch_size
+    """
+
+    def __init__(
+        self,
+        court_dimensions: Tuple[float, float],
+        seed: Optional[int] = None,
+        batch_size: int = start_state_batch_size,
+    ):
+        assert batch_size > 0
+        self._low = np.array([0.0, 0.0, -180.0])
+        self._high = np.array([*court_dimensions, 180.0])
+        self._batch_size = batch_size
+        self.seed(seed)
+
+    def seed(self, seed: Optional[int] = None):
+        self._rng = np.random.default_rng(seed)
+        self._buffer = np.empty((0, 3))
+        self._cursor = 0
+
+    def _draw(self, count: int) -> np.ndarray:
+        return self._rng.uniform(self._low, self._high, size=(count, 3))
+
+    def sample(self, count: int) -> np.ndarray:
+        if count > len(self._buffer) - self._cursor:
+            if count > self._batch_size:
+                return self._draw(count)
+            self._buffer = self._draw(self._batch_size)
+            self._cursor = 0
+        rows = self._buffer[self._cursor : self._cursor + count]
+        self._cursor += count
+        return rows.copy()
+
+    def next(self) -> np.ndarray:
+        return self.sample(1)[0]
+
+
 @dataclass
 class PlayerAction:
     acceleration_multiplier: float
@@ -183,9 +223,15 @@ class Environment(gym.Env):
             high=np.ones(observation_shape, dtype=observation_dtype),
         )
         self.total_reward = 0.0
+        self.start_states = StartStates(self.game.court.dimensions)
 
         self.visualize = visualize
         if self.visualize:
+            # The visualization stack is only loaded by environments that draw
+            import pygame
+            from runner.draw import resolution_for, padded_resolution_for, Drawer
+            from engine import Engine
+
             pygame.init()
             resolution = resolution_for(self.game, display_scale)
             padded_resolution = padded_resolution_for(
@@ -215,11 +261,6 @@ class Environment(gym.Env):
                 self.player.shoot_at(self.target_hoop.position)
         step_space(self.space, time_frame)
 
-        shot_value_scale = 1.0 * 10**0
-        incorrect_action_scale = 1.0 * 10**1
-        out_of_bounds_scale = 0  # 1.0 * 10**0
-        energy_scale = 0.0  # 2.5 * 10**-3
-
         observation = self._get_observation()
         done = self._lost_possession()
 
@@ -258,31 +299,21 @@ class Environment(gym.Env):
         self.player = self.game.teams[0][0]
         self.target_hoop = self.game.target_hoop(self.player)
 
-        while self.game.ball.mode != BallMode.HELD:
-            self.space.step(0.0)
-
-        if not self.player.has_ball:
-            self.game.ball.turnover()
-
-        player_state = PlayerState.from_observation(
-            self.observation_space.sample(), self.player, self.court, self.game
+        # The player is first in team order, so its placement is the first row
+        _, placements = self.game.inbound_placements(
+            self.game.team_index_of(self.player)
         )
-
-        def place_at_random_state():
-            self.player.place_at(
-                (player_state.position_x, player_state.position_y),
-                player_state.orientation,
-            )
-
-        place_at_random_state()
-        while self.game.ball.mode != BallMode.HELD:
-            self.space.step(0.0)
-            place_at_random_state()
+        placements[0] = self.start_states.next()
+        self.game.reset_possession(self.player, placements)
 
         assert close_to(self.player.velocity, (0.0, 0.0))
         observation = self._get_observation()
         return observation
 
+    def seed(self, seed: Optional[int] = None) -> List[Optional[int]]:
+        self.start_states.seed(seed)
+        return [seed]
+
     def _fraction_time_left(self):
         return self.game.shot_clock / self.game.shot_clock_duration
 
@@ -302,7 +333,7 @@ class Environment(gym.Env):
         assert in_range(standstill_bonus, 0.0, 1.0)
         assert in_range(no_turn_bonus, 0.0, 1.0)
         no_movement_multiplier = 1 + standstill_bonus + no_turn_bonus
-        raw_shot_value = self.target_hoop.expected_value_of_shot_by(self.player)
+        raw_shot_value = self.game.expected_value_of_shot_by(self.player)
         return no_movement_multiplier * raw_shot_value
 
     def _standstill_bonus(self):
@@ -334,6 +365,8 @@ class Environment(gym.Env):
         return self.game.team_with_last_possession != team_index
 
     def render(self):
+        import pygame
+
         try:
             if not self.engine.should_loop():
                 self.visualize = False
@@ -359,7 +392,12 @@ class Environment(gym.Env):
 
     def close(self):
         if self.visualize:
+            import pygame
+
             pygame.quit()
 
 
-check_env(Environment())
+def check():
+    from stable_baselines3.common.env_checker import check_env
+
+    check_env(Environment())
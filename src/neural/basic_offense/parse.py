@@ -2,6 +2,10 @@ import argparse
 
 LEARN = "learn"
 LOAD = "load"
+CHECK = "check"
+
+DEFAULT_NUM_ENVS = 64
+DEFAULT_WORKERS = 1
 
 sb3_learn_args = "learn 10000000000 10000000 output/basic_offense"
 sb3_load_args = "load 20 output/basic_offense -v"
@@ -13,6 +17,9 @@ def _build_sb3_learning_subparser(parser: argparse.ArgumentParser):
     parser.add_argument("checkpoint_interval", type=int)
     parser.add_argument("output_path", type=str)
     parser.add_argument("--continue", "--epoch", dest="epoch", type=int, default=None)
+    parser.add_argument("--num-envs", type=int, default=DEFAULT_NUM_ENVS)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--seed", type=int, default=None)
 
 
 def _build_sb3_loading_subparser(parser: argparse.ArgumentParser):
@@ -24,8 +31,15 @@ def _build_sb3_loading_subparser(parser: argparse.ArgumentParser):
 
 def _build_parser(parser: argparse.ArgumentParser):
     subparsers = parser.add_subparsers(dest="type", required=True)
-    _build_sb3_learning_subparser(subparsers.add_parser(LEARN))
+    _build_sb3_learning_subparser(
+        subparsers.add_parser(
+            LEARN,
+            help="train on a batched approximation in which the player does not "
+            "collide with the defender, evaluate on the pymunk environment",
+        )
+    )
     _build_sb3_loading_subparser(subparsers.add_parser(LOAD))
+    subparsers.add_parser(CHECK)
 
 
 def parse(args=None):
@@ -6,27 +6,38 @@ from stable_baselines3.common.callbacks import (
     CallbackList,
     CheckpointCallback,
     ProgressBarCallback,
-    EvalCallback,
 )
 from stable_baselines3.common.monitor import Monitor
+from stable_baselines3.common.vec_env import VecMonitor
 from neural.save import suffix_for
-from neural.basic_offense import environment
+from neural.vec_env import make_vec_env
+from neural.async_eval import close_eval_callback, make_eval_callback
+from neural.basic_offense import environment, vec_environment
+from neural.basic_offense.parse import DEFAULT_NUM_ENVS, DEFAULT_WORKERS
 
 Algo = PPO
 
-seed = randint(0, 10**8)
-
 
 def model_name_for(epoch):
     return f"model{suffix_for(epoch)}{'_steps' if epoch else ''}"
 
 
 def learn(
-    epochs, checkpoint_interval, continue_from_epoch: Optional[int], output_folder: Path
+    epochs,
+    checkpoint_interval,
+    continue_from_epoch: Optional[int],
+    output_folder: Path,
+    num_envs: int = DEFAULT_NUM_ENVS,
+    workers: int = DEFAULT_WORKERS,
+    seed: Optional[int] = None,
 ):
-    env = environment.Environment()
-    eval_env = Monitor(environment.Environment())
-    env.reset()
+    # Drawn per run rather than at import, so a run can be repeated with --seed
+    if seed is None:
+        seed = randint(0, 10**8)
+    # Training uses the batched approximation, evaluation the pymunk environment
+    env = VecMonitor(
+        make_vec_env(vec_environment.VecEnvironment, num_envs, workers, seed)
+    )
 
     if continue_from_epoch is None:
         model = Algo(
@@ -40,21 +51,29 @@ def learn(
         input_path = output_folder.joinpath(model_name_for(continue_from_epoch))
         model = Algo.load(input_path, env=env)
     checkpoint_callback = CheckpointCallback(
-        save_freq=checkpoint_interval, save_path=output_folder, name_prefix="model"
+        save_freq=max(checkpoint_interval // num_envs, 1),
+        save_path=output_folder,
+        name_prefix="model",
     )
-    eval_callback = EvalCallback(
-        eval_env,
-        best_model_save_path=output_folder.joinpath("best"),
-        deterministic=True,
-        render=False,
-        eval_freq=checkpoint_interval // 4,
+    eval_callback = make_eval_callback(
+        Algo,
+        environment.Environment,
+        output_folder,
+        eval_freq=max(checkpoint_interval // 4 // num_envs, 1),
+        workers=workers,
+        seed=seed,
         n_eval_episodes=50,
+        monitor=Monitor,
     )
     callback_list = CallbackList(
         [checkpoint_callback, eval_callback, ProgressBarCallback()]
     )
-    model.learn(epochs, reset_num_timesteps=False, callback=callback_list)
-    model.save(output_folder.joinpath("model"))
+    try:
+        model.learn(epochs, reset_num_timesteps=False, callback=callback_list)
+        model.save(output_folder.joinpath("model"))
+    finally:
+        close_eval_callback(eval_callback)
+        env.close()
 
 
 def load(episodes, visualize, input_folder: Path, epoch=None):
@@ -0,0 +1,232 @@
+from __future__ import annotations
+import math
+from typing import Any, List, Optional, Sequence
+import numpy as np
+from gym import spaces
+from stable_baselines3.common.vec_env import VecEnv
+from bball import BallMode, BatchSpace
+from bball.array_utils import vector_lengths
+from runner.setup import MAX_SUBSTEP_LENGTH
+from neural.basic_offense.environment import (
+    game_template,
+    num_players,
+    time_frame,
+    action_shape,
+    action_dtype,
+    observation_shape,
+    observation_dtype,
+    shot_value_scale,
+    incorrect_action_scale,
+    out_of_bounds_scale,
+    energy_scale,
+    StartStates,
+)
+
+PLAYER_INDEX = 0
+
+
+class VecEnvironment(VecEnv):
+    """
+    Runs num_envs copies of Environment as a single BatchSpace, finished episodes
+    are reset automatically. Game rules are applied after every substep like
+    Space.step does, but the offensive player does not collide with the idle
+    defender since BatchSpace does not resolve collisions. Policies are still
+    evaluated on Environment, where the defender blocks the player
+    """
+
+    def __init__(self, num_envs: int, seed: Optional[int] = None):
+        assert num_envs > 0
+        super().__init__(
+            num_envs,
+            spaces.Box(
+                low=-np.ones(observation_shape, dtype=observation_dtype),
+                high=np.ones(observation_shape, dtype=observation_dtype),
+            ),
+            spaces.Box(
+                low=-np.ones(action_shape, dtype=action_dtype),
+                high=np.ones(action_shape, dtype=action_dtype),
+            ),
+        )
+        game = game_template(num_players)
+        self.player = game.teams[0][PLAYER_INDEX]
+        self.court = game.court
+        self.target_hoop = game.target_hoop(self.player)
+        self.shot_clock_duration = game.shot_clock_duration
+        self.width, self.height = self.court.dimensions
+
+        physical = self.player.physical_attributes
+        self.max_velocity = physical.max_velocity
+        self.batch = BatchSpace(num_envs, 1)
+        self.batch.max_velocities[:] = physical.max_velocity
+        self.batch.max_accelerations[:] = physical.max_acceleration
+        self.batch.max_turn_degrees[:] = physical.max_turn_degrees
+        self.batch.velocity_decays[:] = physical.velocity_decay
+
+        self.num_substeps = math.ceil(time_frame / MAX_SUBSTEP_LENGTH)
+        self.substep_length = time_frame / self.num_substeps
+        self.shot_clocks = np.full(num_envs, float(self.shot_clock_duration))
+        self.start_states = StartStates(self.court.dimensions, seed)
+        self.actions = np.zeros((num_envs, *action_shape), dtype=action_dtype)
+
+    def _reset_envs(self, env_indices: np.ndarray):
+        batch = self.batch
+        start_states = self.start_states.sample(len(env_indices))
+        batch.positions[env_indices, PLAYER_INDEX] = start_states[:, 0:2]
+        batch.orientations_degrees[env_indices, PLAYER_INDEX] = start_states[:, 2]
+        batch.velocities[env_indices] = 0.0
+        batch.ball_modes[env_indices] = BallMode.HELD.value
+        batch.ball_holders[env_indices] = PLAYER_INDEX
+        batch.ball_positions[env_indices] = batch.positions[env_indices, PLAYER_INDEX]
+        batch.ball_flight_times[env_indices] = 0.0
+        self.shot_clocks[env_indices] = self.shot_clock_duration
+
+    def reset(self) -> np.ndarray:
+        self._reset_envs(np.arange(self.num_envs))
+        return self._observations()
+
+    def step_async(self, actions: np.ndarray):
+        self.actions = np.asarray(actions, dtype=action_dtype)
+
+    def step_wait(self):
+        actions = self.actions
+        assert actions.shape == (self.num_envs, *action_shape)
+        accelerations = actions[:, 0:1].astype(float)
+        turns = actions[:, 1:2].astype(float)
+        shoots = actions[:, 2] > 0
+
+        batch = self.batch
+        held = batch.held_by(PLAYER_INDEX)
+        invalid = shoots & ~held
+        shooting = np.flatnonzero(shoots & held)
+        if shooting.size > 0:
+            batch.shoot_at(
+                shooting,
+                np.array(self.target_hoop.position),
+                self.player.skill_attributes.shot_velocity,
+            )
+
+        dones = np.zeros(self.num_envs, dtype=bool)
+        for _ in range(self.num_substeps):
+            modes_before = batch.ball_modes.copy()
+            batch.turn(turns).accelerate(accelerations).step(self.substep_length)
+            dones |= self._apply_rules(modes_before)
+
+        observations = self._observations()
+        rewards = self._rewards(dones, invalid, shooting, turns[:, 0])
+        infos: List[dict] = [{} for _ in range(self.num_envs)]
+        finished = np.flatnonzero(dones)
+        if finished.size > 0:
+            for env_index in finished:
+                infos[env_index]["terminal_observation"] = observations[
+                    env_index
+                ].copy()
+            self._reset_envs(finished)
+            observations[finished] = self._observations()[finished]
+        return observations, rewards, dones, infos
+
+    def _apply_rules(self, modes_before: np.ndarray) -> np.ndarray:
+        # Mirrors Game._step for a team of one without an inbounding team mate,
+        # returns the games in which the other team gets the ball
+        batch = self.batch
+        modes = batch.ball_modes
+        held = modes == BallMode.HELD.value
+        self.shot_clocks[held] -= self.substep_length
+        expired = held & (self.shot_clocks <= 0.0)
+        positions = batch.positions[:, PLAYER_INDEX]
+        out_of_bounds = held & (
+            (positions[:, 0] < 0.0)
+            | (positions[:, 0] > self.width)
+            | (positions[:, 1] < 0.0)
+            | (positions[:, 1] > self.height)
+        )
+        reached_shot = modes_before == BallMode.REACHEDSHOT.value
+        modes[expired | out_of_bounds | reached_shot] = BallMode.DEAD.value
+        return modes_before == BallMode.DEAD.value
+
+    def _shot_clock_fractions(self) -> np.ndarray:
+        held = self.batch.held_by(PLAYER_INDEX)
+        remaining = np.maximum(self.shot_clocks, 0.0)
+        return np.where(held, remaining / self.shot_clock_duration, 1.0)
+
+    def _observations(self) -> np.ndarray:
+        batch = self.batch
+        positions = batch.positions[:, PLAYER_INDEX]
+        velocities = batch.velocities[:, PLAYER_INDEX]
+        coefficients = np.stack(
+            [
+                positions[:, 0] / self.width,
+                positions[:, 1] / self.height,
+                (batch.orientations_degrees[:, PLAYER_INDEX] + 180) / 360,
+                (velocities[:, 0] + self.max_velocity) / (2 * self.max_velocity),
+                (velocities[:, 1] + self.max_velocity) / (2 * self.max_velocity),
+                batch.held_by(PLAYER_INDEX).astype(float),
+                self._shot_clock_fractions(),
+            ],
+            axis=1,
+        )
+        return (2 * coefficients - 1).astype(observation_dtype)
+
+    def _expected_shot_values(self, env_indices: np.ndarray) -> np.ndarray:
+        return self.target_hoop.expected_values_of_shots_from(
+            self.batch.positions[env_indices, PLAYER_INDEX],
+            self.player.skill_attributes.shot_probability,
+        )
+
+    def _rewards(
+        self,
+        dones: np.ndarray,
+        invalid: np.ndarray,
+        shooting: np.ndarray,
+        turns: np.ndarray,
+    ) -> np.ndarray:
+        speeds = vector_lengths(self.batch.velocities[:, PLAYER_INDEX])
+        velocity_scales = speeds / self.max_velocity
+        fractions_time_left = self._shot_clock_fractions()
+
+        energy_consumed = 1 + np.abs(turns) + velocity_scales
+        rewards = -energy_scale * energy_consumed
+        if shooting.size > 0:
+            standstill_bonus = np.where(
+                velocity_scales[shooting] > 1, 0.0, 1 - velocity_scales[shooting]
+            )
+            no_turn_bonus = 1 - np.abs(turns[shooting])
+            rewards[shooting] = (
+                shot_value_scale
+                * (1 + standstill_bonus + no_turn_bonus)
+                * self._expected_shot_values(shooting)
+            )
+        rewards[invalid] = -incorrect_action_scale * fractions_time_left[invalid]
+        rewards[dones] = -out_of_bounds_scale * fractions_time_left[dones]
+        return rewards.astype(np.float32)
+
+    def close(self):
+        return
+
+    def seed(self, seed: Optional[int] = None) -> List[Optional[int]]:
+        self.start_states = StartStates(self.court.dimensions, seed)
+        return [seed for _ in range(self.num_envs)]
+
+    # Every env index is this one object, so attributes are shared and
+    # methods run once with their result repeated for each index
+    def get_attr(self, attr_name: str, indices=None) -> List[Any]:
+        value = getattr(self, attr_name)
+        return [value for _ in self._get_indices(indices)]
+
+    def set_attr(self, attr_name: str, value: Any, indices=None):
+        env_indices = set(self._get_indices(indices))
+        assert env_indices == set(range(self.num_envs)), "attributes are shared"
+        setattr(self, attr_name, value)
+
+    def env_method(self, method_name: str, *method_args, indices=None, **kwargs):
+        env_indices = list(self._get_indices(indices))
+        if not env_indices:
+            return []
+        result = getattr(self, method_name)(*method_args, **kwargs)
+        return [result for _ in env_indices]
+
+    def get_images(self) -> Sequence[np.ndarray]:
+        # render() warns instead, the batch has no pymunk space to draw
+        raise NotImplementedError("VecEnvironment games have no images")
+
+    def env_is_wrapped(self, wrapper_class, indices=None) -> List[bool]:
+        return [False for _ in self._get_indices(indices)]
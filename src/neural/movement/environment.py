@@ -8,12 +8,7 @@ from experiment.initiate import canonical_game
 from bball import BallMode
 from bball.create import create_space
 from bball.utils import interpolation_coefficient, vector_length, in_range, close_to
-from stable_baselines3.common.env_checker import check_env
-
-import pygame
-from runner.draw import resolution_for, padded_resolution_for, Drawer
 from runner.setup import step_space, BACKGROUND_COLOR, time_frame_for
-from engine import Engine
 from bball.draw import draw_game
 
 if TYPE_CHECKING:
@@ -135,6 +130,11 @@ class Environment(gym.Env):
 
         self.visualize = visualize
         if self.visualize:
+            # The visualization stack is only loaded by environments that draw
+            import pygame
+            from runner.draw import resolution_for, padded_resolution_for, Drawer
+            from engine import Engine
+
             pygame.init()
             resolution = resolution_for(self.game, display_scale)
             padded_resolution = padded_resolution_for(
@@ -215,7 +215,7 @@ class Environment(gym.Env):
         assert in_range(standstill_bonus, 0.0, 1.0)
         assert in_range(no_turn_bonus, 0.0, 1.0)
         no_movement_multiplier = 1 + standstill_bonus + no_turn_bonus
-        raw_shot_value = self.target_hoop.expected_value_of_shot_by(self.player)
+        raw_shot_value = self.game.expected_value_of_shot_by(self.player)
         return no_movement_multiplier * raw_shot_value
 
     def _standstill_bonus(self):
@@ -246,6 +246,8 @@ class Environment(gym.Env):
         return not self.player.has_ball
 
     def render(self):
+        import pygame
+
         try:
             if not self.engine.should_loop():
                 self.visualize = False
@@ -271,6 +273,8 @@ class Environment(gym.Env):
 
     def close(self):
         if self.visualize:
+            import pygame
+
             pygame.quit()
 
 
@@ -282,4 +286,7 @@ def makegymnasium():
     return Environment()
 
 
-check_env(Environment())
+def check():
+    from stable_baselines3.common.env_checker import check_env
+
+    check_env(Environment())
@@ -1,11 +1,20 @@
 from pathlib import Path
-from neural.movement import parse, sb3
+from neural.movement import parse, sb3, environment
 
 
 def main(args=None):
     args = parse.parse(args)
     if args.type == parse.LEARN:
-        sb3.learn(args.epochs, args.checkpoint_interval, Path(args.output_path))
+        sb3.learn(
+            args.epochs,
+            args.checkpoint_interval,
+            Path(args.output_path),
+            args.num_envs,
+            args.workers,
+            args.seed,
+        )
+    elif args.type == parse.CHECK:
+        environment.check()
     else:
         assert args.type == parse.LOAD
         sb3.load(args.episodes, args.visualize, Path(args.input_path), args.epoch)
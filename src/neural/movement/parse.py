@@ -2,6 +2,10 @@ import argparse
 
 LEARN = "learn"
 LOAD = "load"
+CHECK = "check"
+
+DEFAULT_NUM_ENVS = 1
+DEFAULT_WORKERS = 1
 
 sb3_learn_args = "learn 10000000 100000 output/movement"
 sb3_load_args = "load 10 output/movement --visualize"
@@ -12,6 +16,9 @@ def _build_sb3_learning_subparser(parser: argparse.ArgumentParser):
     parser.add_argument("epochs", type=int)
     parser.add_argument("checkpoint_interval", type=int)
     parser.add_argument("output_path", type=str)
+    parser.add_argument("--num-envs", type=int, default=DEFAULT_NUM_ENVS)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--seed", type=int, default=None)
 
 
 def _build_sb3_loading_subparser(parser: argparse.ArgumentParser):
@@ -25,6 +32,7 @@ def _build_parser(parser: argparse.ArgumentParser):
     subparsers = parser.add_subparsers(dest="type", required=True)
     _build_sb3_learning_subparser(subparsers.add_parser(LEARN))
     _build_sb3_loading_subparser(subparsers.add_parser(LOAD))
+    subparsers.add_parser(CHECK)
 
 
 def parse(args=None):
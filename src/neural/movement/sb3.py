@@ -1,3 +1,4 @@
+from typing import Optional
 from pathlib import Path
 from random import randint
 from stable_baselines3 import PPO
@@ -5,21 +6,32 @@ from stable_baselines3.common.callbacks import (
     CallbackList,
     CheckpointCallback,
     ProgressBarCallback,
-    EvalCallback,
 )
 from stable_baselines3.common.monitor import Monitor
+from stable_baselines3.common.vec_env import VecMonitor
 from neural.save import suffix_for
+from neural.vec_env import make_vec_env, seeded_dummy_vec_env
+from neural.async_eval import close_eval_callback, make_eval_callback
 from neural.movement import environment
+from neural.movement.parse import DEFAULT_NUM_ENVS, DEFAULT_WORKERS
 
 Algo = PPO
 
-seed = randint(0, 10**8)
 
-
-def learn(epochs, checkpoint_interval, output_folder: Path):
-    env = environment.makegym()
-    eval_env = Monitor(environment.makegym())
-    env.reset()
+def learn(
+    epochs,
+    checkpoint_interval,
+    output_folder: Path,
+    num_envs: int = DEFAULT_NUM_ENVS,
+    workers: int = DEFAULT_WORKERS,
+    seed: Optional[int] = None,
+):
+    # Drawn per run rather than at import, so a run can be repeated with --seed
+    if seed is None:
+        seed = randint(0, 10**8)
+    env = VecMonitor(
+        make_vec_env(seeded_dummy_vec_env(environment.makegym), num_envs, workers, seed)
+    )
     model = Algo(
         "MlpPolicy",
         env,
@@ -27,20 +39,28 @@ def learn(epochs, checkpoint_interval, output_folder: Path):
         seed=seed,
     )
     checkpoint_callback = CheckpointCallback(
-        save_freq=checkpoint_interval, save_path=output_folder, name_prefix="model"
+        save_freq=max(checkpoint_interval // num_envs, 1),
+        save_path=output_folder,
+        name_prefix="model",
     )
-    eval_callback = EvalCallback(
-        eval_env,
-        best_model_save_path=output_folder.joinpath("best"),
-        deterministic=True,
-        render=False,
-        eval_freq=checkpoint_interval // 4,
+    eval_callback = make_eval_callback(
+        Algo,
+        environment.makegym,
+        output_folder,
+        eval_freq=max(checkpoint_interval // 4 // num_envs, 1),
+        workers=workers,
+        seed=seed,
+        monitor=Monitor,
     )
     callback_list = CallbackList(
         [checkpoint_callback, eval_callback, ProgressBarCallback()]
     )
-    model.learn(epochs, reset_num_timesteps=True, callback=callback_list)
-    model.save(output_folder.joinpath("model"))
+    try:
+        model.learn(epochs, reset_num_timesteps=True, callback=callback_list)
+        model.save(output_folder.joinpath("model"))
+    finally:
+        close_eval_callback(eval_callback)
+        env.close()
 
 
 def load(episodes, visualize, input_folder: Path, epoch=None):
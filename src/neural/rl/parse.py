@@ -6,6 +6,9 @@ QLEARNING = "q"
 DQN = "dqn"
 SB3 = "sb3"
 
+DEFAULT_NUM_ENVS = 1
+DEFAULT_WORKERS = 1
+
 q_learn_args = "q learn 1000000 0.1 0.7 0.00001 0.001 output/qlearn/q.txt"
 q_load_args = "q load 5 50 output/qlearn/q.txt --visualize"
 q_noviz_load_args = "q load 1000 100000 output/qlearn/q.txt"
@@ -55,6 +58,9 @@ def _build_sb3_learning_subparser(parser: argparse.ArgumentParser):
     parser.add_argument("epochs", type=int)
     parser.add_argument("checkpoint_interval", type=int)
     parser.add_argument("output_path", type=str)
+    parser.add_argument("--num-envs", type=int, default=DEFAULT_NUM_ENVS)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--seed", type=int, default=None)
 
 
 def _build_sb3_loading_subparser(parser: argparse.ArgumentParser):
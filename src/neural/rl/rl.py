@@ -21,7 +21,14 @@ def main(args=None):
             )
     elif args.algo == parse.SB3:
         if args.type == parse.LEARN:
-            sb3.learn(args.epochs, args.checkpoint_interval, Path(args.output_path))
+            sb3.learn(
+                args.epochs,
+                args.checkpoint_interval,
+                Path(args.output_path),
+                args.num_envs,
+                args.workers,
+                args.seed,
+            )
         else:
             assert args.type == parse.LOAD
             sb3.load(args.episodes, args.visualize, Path(args.input_path), args.epoch)
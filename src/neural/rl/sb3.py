@@ -1,37 +1,63 @@
+from typing import Optional
 from pathlib import Path
+from random import randint
 from tqdm import tqdm
 from stable_baselines3 import PPO
 from stable_baselines3.common.callbacks import (
     CallbackList,
     CheckpointCallback,
     ProgressBarCallback,
-    EvalCallback,
 )
+from stable_baselines3.common.vec_env import VecMonitor
 from neural.rl import frozen
+from neural.rl.parse import DEFAULT_NUM_ENVS, DEFAULT_WORKERS
 from neural.save import suffix_for
+from neural.vec_env import make_vec_env, seeded_dummy_vec_env
+from neural.async_eval import close_eval_callback, make_eval_callback
 
 Algo = PPO
 
+# EvalCallback's default evaluation frequency
+EVAL_FREQUENCY = 10000
 
-def learn(epochs, checkpoint_interval, output_folder: Path):
-    env = frozen.makegym()
-    eval_env = frozen.makegym()
-    env.reset()
-    model = Algo("MlpPolicy", env)
+
+def learn(
+    epochs,
+    checkpoint_interval,
+    output_folder: Path,
+    num_envs: int = DEFAULT_NUM_ENVS,
+    workers: int = DEFAULT_WORKERS,
+    seed: Optional[int] = None,
+):
+    # Drawn per run rather than at import, so a run can be repeated with --seed
+    if seed is None:
+        seed = randint(0, 10**8)
+    env = VecMonitor(
+        make_vec_env(seeded_dummy_vec_env(frozen.makegym), num_envs, workers, seed)
+    )
+    model = Algo("MlpPolicy", env, seed=seed)
     checkpoint_callback = CheckpointCallback(
-        save_freq=checkpoint_interval, save_path=output_folder, name_prefix="model"
+        save_freq=max(checkpoint_interval // num_envs, 1),
+        save_path=output_folder,
+        name_prefix="model",
     )
-    eval_callback = EvalCallback(
-        eval_env,
-        best_model_save_path=output_folder.joinpath("best"),
-        deterministic=True,
-        render=False,
+    eval_callback = make_eval_callback(
+        Algo,
+        frozen.makegym,
+        output_folder,
+        eval_freq=max(EVAL_FREQUENCY // num_envs, 1),
+        workers=workers,
+        seed=seed,
     )
     callback_list = CallbackList(
         [checkpoint_callback, eval_callback, ProgressBarCallback()]
     )
-    model.learn(epochs, reset_num_timesteps=True, callback=callback_list)
-    model.save(output_folder.joinpath("model"))
+    try:
+        model.learn(epochs, reset_num_timesteps=True, callback=callback_list)
+        model.save(output_folder.joinpath("model"))
+    finally:
+        close_eval_callback(eval_callback)
+        env.close()
 
 
 def load(episodes, visualize, input_folder: Path, epoch=None):
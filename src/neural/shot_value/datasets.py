@@ -1,62 +1,67 @@
-from copy import deepcopy
-from random import uniform
+from typing import Optional, Tuple
+import numpy as np
 import torch
-from torch.utils.data import Dataset
-from bball import Game, Player, Court, Hoop
-from bball.utils import divide_by
+from torch.utils.data import Dataset, IterableDataset, get_worker_info
+from bball import Game
+from bball.array_utils import angles_degrees_to_vectors, normalized_angles_degrees
 
+stream_chunk_size = 4096
 
-def create_player_on_court(base_player: Player, court: Court) -> Player:
-    player = deepcopy(base_player)
-    position = tuple((uniform(0, court.dimensions[i]) for i in range(2)))
-    random_angle = uniform(0, 360)
-    max_velocity = player.physical_attributes.max_acceleration * 3
-    velocity_magnitude = uniform(0, max_velocity)
-    return player.place_at(position, random_angle).with_velocity(velocity_magnitude)
 
+def generate_arrays(
+    n: int, game: Game, rng: np.random.Generator
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    n random states for the first player of the game as (n, 5) rows of position,
+    velocity (both divided by the bigger court dimension) and orientation / 360,
+    labelled with (n, 1) expected shot values at the target hoop divided by 3
+    """
+    player = game.teams[0][0]
+    court = game.court
+    target_hoop = game.target_hoop(player)
+    positions = rng.uniform((0.0, 0.0), court.dimensions, size=(n, 2))
+    orientations = normalized_angles_degrees(rng.uniform(0.0, 360.0, size=n))
+    max_velocity = player.physical_attributes.max_acceleration * 3
+    velocities = angles_degrees_to_vectors(
+        orientations, rng.uniform(0.0, max_velocity, size=n)
+    )
 
-def to_tensor(player: Player, court: Court):
     bigger_dimension = max(court.dimensions)
-    position = divide_by(player.position, bigger_dimension)
-    velocity = divide_by(player.velocity, bigger_dimension)
-    orientation = player.orientation_degrees / 360
-    return torch.Tensor((*position, *velocity, orientation))
-
-
-def evaluate_state(player: Player, hoop: Hoop):
-    shot_value = hoop.expected_value_of_shot_by(player) / 3
-    assert 0 <= shot_value <= 1
-    return shot_value
+    points = np.concatenate(
+        [
+            positions / bigger_dimension,
+            velocities / bigger_dimension,
+            orientations[:, np.newaxis] / 360,
+        ],
+        axis=1,
+    )
+    shot_values = (
+        target_hoop.expected_values_of_shots_from(
+            positions, player.skill_attributes.shot_probability
+        )
+        / 3
+    )
+    assert ((0 <= shot_values) & (shot_values <= 1)).all()
+    return points.astype(np.float32), shot_values[:, np.newaxis].astype(np.float32)
 
 
-def generate_data(game: Game):
-    base_player = game.teams[0][0]
-    target_hoop = game.target_hoop(base_player)
-    random_player = create_player_on_court(base_player, game.court)
-    player_tensor = to_tensor(random_player, game.court)
-    fitness_value = evaluate_state(random_player, target_hoop)
-
-    fitness = torch.Tensor(1)
-    fitness.fill_(fitness_value)
-    assert player_tensor.shape == (5,)
-    assert fitness.shape == (1,)
-    return player_tensor, fitness
-
-
-def generate_data_n(n: int, game: Game):
-    vecs = []
-    fitnesses = []
-    for _ in range(n):
-        vec, fitness = generate_data(game)
-        vecs.append(vec)
-        fitnesses.append(fitness)
-    return vecs, fitnesses
+def generate_data_n(
+    n: int, game: Game, seed: Optional[int] = None
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    points, labels = generate_arrays(n, game, np.random.default_rng(seed))
+    return torch.from_numpy(points), torch.from_numpy(labels)
 
 
 class PlayerDataset(Dataset):
-    def __init__(self, n: int, game: Game, transform=None, target_transform=None):
-        game = deepcopy(game)
-        self.points, self.labels = generate_data_n(n, game)
+    def __init__(
+        self,
+        n: int,
+        game: Game,
+        transform=None,
+        target_transform=None,
+        seed: Optional[int] = None,
+    ):
+        self.points, self.labels = generate_data_n(n, game, seed)
         self.game = game
         self.transform = transform
         self.target_transform = target_transform
@@ -72,3 +77,45 @@ class PlayerDataset(Dataset):
         if self.target_transform:
             label = self.target_transform(label)
         return point, label
+
+
+class StreamingPlayerDataset(IterableDataset):
+    """
+    Endless PlayerDataset samples, generated chunk_size at a time. Each
+    DataLoader worker draws from its own generator, seeded from seed and the
+    worker id when seed is given
+    """
+
+    def __init__(
+        self,
+        game: Game,
+        transform=None,
+        target_transform=None,
+        seed: Optional[int] = None,
+        chunk_size: int = stream_chunk_size,
+    ):
+        assert chunk_size > 0
+        self.game = game
+        self.transform = transform
+        self.target_transform = target_transform
+        self.seed = seed
+        self.chunk_size = chunk_size
+
+    def _rng(self) -> np.random.Generator:
+        if self.seed is None:
+            return np.random.default_rng()
+        worker_info = get_worker_info()
+        worker_id = 0 if worker_info is None else worker_info.id
+        return np.random.default_rng([self.seed, worker_id])
+
+    def __iter__(self):
+        rng = self._rng()
+        while True:
+            points, labels = generate_arrays(self.chunk_size, self.game, rng)
+            for point, label in zip(torch.from_numpy(points), torch.from_numpy(labels)):
+                point = point.unsqueeze(0)
+                if self.transform:
+                    point = self.transform(point)
+                if self.target_transform:
+                    label = self.target_transform(label)
+                yield point, label
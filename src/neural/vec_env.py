@@ -0,0 +1,290 @@
+from __future__ import annotations
+import random
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+import gym
+import multiprocess as mp  # type: ignore
+from multiprocess import shared_memory, resource_tracker  # type: ignore
+from stable_baselines3.common.vec_env import VecEnv, DummyVecEnv
+
+# Builds a VecEnv with the given number of environments, seeded with seed
+VecEnvGenerator = Callable[[int, int], VecEnv]
+
+STEP = "step"
+RESET = "reset"
+SEED = "seed"
+GET_ATTR = "get_attr"
+SET_ATTR = "set_attr"
+ENV_METHOD = "env_method"
+ENV_IS_WRAPPED = "env_is_wrapped"
+CLOSE = "close"
+
+
+def seeded_dummy_vec_env(env_generator: Callable[[], gym.Env]) -> VecEnvGenerator:
+    def generate(num_envs: int, seed: int) -> VecEnv:
+        vec_env = DummyVecEnv([env_generator for _ in range(num_envs)])
+        vec_env.seed(seed)
+        for rank, env in enumerate(vec_env.envs):
+            env.observation_space.seed(seed + rank)
+            env.action_space.seed(seed + rank)
+        return vec_env
+
+    return generate
+
+
+def make_vec_env(
+    vec_env_generator: VecEnvGenerator, num_envs: int, workers: int, seed: int
+) -> VecEnv:
+    if workers <= 1:
+        return vec_env_generator(num_envs, seed)
+    return SharedMemoryVecEnv(vec_env_generator, num_envs, workers, seed)
+
+
+class _Buffers:
+    # Views into one shared memory segment per buffer, rows are environments
+    _segments: Dict[str, Any]
+    arrays: Dict[str, np.ndarray]
+
+    def __init__(self, segments: Dict[str, Any], layouts: Dict[str, Tuple]):
+        self._segments = segments
+        self.arrays = {
+            name: np.ndarray(shape, dtype=dtype, buffer=segments[name].buf)
+            for name, (shape, dtype) in layouts.items()
+        }
+
+    @staticmethod
+    def create(layouts: Dict[str, Tuple]) -> _Buffers:
+        segments = {
+            name: shared_memory.SharedMemory(
+                create=True, size=max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            )
+            for name, (shape, dtype) in layouts.items()
+        }
+        return _Buffers(segments, layouts)
+
+    @staticmethod
+    def attach(names: Dict[str, str], layouts: Dict[str, Tuple]) -> _Buffers:
+        segments = {}
+        for buffer_name, segment_name in names.items():
+            segment = shared_memory.SharedMemory(name=segment_name)
+            # The parent process owns (and unlinks) the segment
+            resource_tracker.unregister(segment._name, "shared_memory")
+            segments[buffer_name] = segment
+        return _Buffers(segments, layouts)
+
+    @property
+    def names(self) -> Dict[str, str]:
+        return {name: segment.name for name, segment in self._segments.items()}
+
+    def close(self, unlink: bool = False):
+        self.arrays = {}
+        for segment in self._segments.values():
+            segment.close()
+            if unlink:
+                segment.unlink()
+
+
+def _layouts(
+    num_envs: int, observation_space: gym.Space, action_space: gym.Space
+) -> Dict[str, Tuple]:
+    return {
+        "observations": (
+            (num_envs, *observation_space.shape),
+            observation_space.dtype,
+        ),
+        "actions": ((num_envs, *action_space.shape), action_space.dtype),
+        "rewards": ((num_envs,), np.float32),
+        "dones": ((num_envs,), np.bool_),
+    }
+
+
+def _run_worker(
+    pipe,
+    vec_env_generator: VecEnvGenerator,
+    num_envs: int,
+    total_envs: int,
+    offset: int,
+    seed: int,
+):
+    random.seed(seed)
+    np.random.seed(seed % 2**32)
+    vec_env = vec_env_generator(num_envs, seed)
+    pipe.send((vec_env.observation_space, vec_env.action_space))
+    layouts = _layouts(total_envs, vec_env.observation_space, vec_env.action_space)
+    buffers = _Buffers.attach(pipe.recv(), layouts)
+    rows = slice(offset, offset + num_envs)
+    observations = buffers.arrays["observations"][rows]
+    actions = buffers.arrays["actions"][rows]
+    rewards = buffers.arrays["rewards"][rows]
+    dones = buffers.arrays["dones"][rows]
+    try:
+        while True:
+            command, args = pipe.recv()
+            if command == STEP:
+                step_observations, step_rewards, step_dones, infos = vec_env.step(
+                    actions.copy()
+                )
+                observations[:] = step_observations
+                rewards[:] = step_rewards
+                dones[:] = step_dones
+                pipe.send(infos)
+            elif command == RESET:
+                observations[:] = vec_env.reset()
+                pipe.send(None)
+            elif command == SEED:
+                pipe.send(vec_env.seed(args + offset))
+            elif command == GET_ATTR:
+                pipe.send(vec_env.get_attr(*args))
+            elif command == SET_ATTR:
+                pipe.send(vec_env.set_attr(*args))
+            elif command == ENV_METHOD:
+                name, method_args, indices, kwargs = args
+                pipe.send(
+                    vec_env.env_method(name, *method_args, indices=indices, **kwargs)
+                )
+            elif command == ENV_IS_WRAPPED:
+                pipe.send(vec_env.env_is_wrapped(*args))
+            else:
+                assert command == CLOSE, f"Unknown command {command}"
+                vec_env.close()
+                pipe.send(None)
+                break
+    finally:
+        observations = actions = rewards = dones = None  # type: ignore
+        buffers.close()
+
+
+class SharedMemoryVecEnv(VecEnv):
+    """
+    Splits num_envs environments evenly over worker processes, each worker
+    owns the VecEnv built by vec_env_generator for its share and is seeded with
+    seed + the index of its first environment. Observations, actions, rewards
+    and dones live in shared memory, only commands and infos go through pipes
+    """
+
+    _pipes: List[Any]
+    _processes: List[Any]
+    _offsets: List[int]
+    _envs_per_worker: int
+    _buffers: _Buffers
+    _closed: bool
+
+    def __init__(
+        self,
+        vec_env_generator: VecEnvGenerator,
+        num_envs: int,
+        workers: int,
+        seed: int,
+    ):
+        assert workers > 0
+        assert num_envs % workers == 0, "num_envs must be a multiple of workers"
+        self._envs_per_worker = num_envs // workers
+        self._offsets = [rank * self._envs_per_worker for rank in range(workers)]
+        self._pipes = []
+        self._processes = []
+        for offset in self._offsets:
+            parent_pipe, child_pipe = mp.Pipe()  # pylint: disable=no-member
+            process = mp.Process(  # pylint: disable=not-callable
+                target=_run_worker,
+                args=(
+                    child_pipe,
+                    vec_env_generator,
+                    self._envs_per_worker,
+                    num_envs,
+                    offset,
+                    seed + offset,
+                ),
+                daemon=True,
+            )
+            process.start()
+            child_pipe.close()
+            self._pipes.append(parent_pipe)
+            self._processes.append(process)
+
+        observation_space, action_space = self._pipes[0].recv()
+        for pipe in self._pipes[1:]:
+            pipe.recv()
+        super().__init__(num_envs, observation_space, action_space)
+        self._buffers = _Buffers.create(
+            _layouts(num_envs, observation_space, action_space)
+        )
+        for pipe in self._pipes:
+            pipe.send(self._buffers.names)
+        self._closed = False
+
+    def _worker_indices(self, indices) -> Dict[int, List[int]]:
+        # Maps worker rank to the local indices of the requested environments
+        by_worker: Dict[int, List[int]] = {}
+        for index in self._get_indices(indices):
+            rank, local_index = divmod(index, self._envs_per_worker)
+            by_worker.setdefault(rank, []).append(local_index)
+        return by_worker
+
+    def _request(self, ranks: Sequence[int], command: str, args_for) -> List[Any]:
+        for rank in ranks:
+            self._pipes[rank].send((command, args_for(rank)))
+        return [self._pipes[rank].recv() for rank in ranks]
+
+    def reset(self) -> np.ndarray:
+        self._request(range(len(self._pipes)), RESET, lambda _: None)
+        return self._buffers.arrays["observations"].copy()
+
+    def step_async(self, actions: np.ndarray):
+        self._buffers.arrays["actions"][:] = actions
+        for pipe in self._pipes:
+            pipe.send((STEP, None))
+
+    def step_wait(self):
+        infos = [info for pipe in self._pipes for info in pipe.recv()]
+        arrays = self._buffers.arrays
+        return (
+            arrays["observations"].copy(),
+            arrays["rewards"].copy(),
+            arrays["dones"].copy(),
+            infos,
+        )
+
+    def seed(self, seed: Optional[int] = None) -> List[Any]:
+        if seed is None:
+            seed = np.random.randint(0, 2**31 - 1)
+        results = self._request(range(len(self._pipes)), SEED, lambda _: seed)
+        return [worker_seed for worker_seeds in results for worker_seed in worker_seeds]
+
+    def _gather(self, command: str, indices, args_for) -> List[Any]:
+        by_worker = self._worker_indices(indices)
+        ranks = sorted(by_worker)
+        return self._request(ranks, command, lambda rank: args_for(by_worker[rank]))
+
+    def get_attr(self, attr_name: str, indices=None) -> List[Any]:
+        results = self._gather(GET_ATTR, indices, lambda local: (attr_name, local))
+        return [value for worker_values in results for value in worker_values]
+
+    def set_attr(self, attr_name: str, value: Any, indices=None):
+        self._gather(SET_ATTR, indices, lambda local: (attr_name, value, local))
+
+    def env_method(self, method_name: str, *method_args, indices=None, **kwargs):
+        results = self._gather(
+            ENV_METHOD,
+            indices,
+            lambda local: (method_name, method_args, local, kwargs),
+        )
+        return [value for worker_values in results for value in worker_values]
+
+    def get_images(self) -> Sequence[np.ndarray]:
+        # render() warns instead, environments draw to their own pygame window
+        raise NotImplementedError("SharedMemoryVecEnv environments have no images")
+
+    def env_is_wrapped(self, wrapper_class, indices=None) -> List[bool]:
+        results = self._gather(
+            ENV_IS_WRAPPED, indices, lambda local: (wrapper_class, local)
+        )
+        return [value for worker_values in results for value in worker_values]
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._request(range(len(self._pipes)), CLOSE, lambda _: None)
+        for process in self._processes:
+            process.join()
+        self._buffers.close(unlink=True)
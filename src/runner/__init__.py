@@ -1 +1,2 @@
-from .setup import run, run_headless
+from .setup import run, run_headless, replay, at_possession_boundaries
+from .trace import TraceRecorder, Trace
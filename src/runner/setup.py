@@ -1,13 +1,40 @@
+from __future__ import annotations
 import math
-from bball import Game, Space, draw_game
-from engine import Engine
-from runner.draw import Drawer, resolution_for, padded_resolution_for
+from typing import Callable, Iterable, Optional, TYPE_CHECKING
+from bball import Game, Space, Instrumentation, draw_game
+from bball.space import PYMUNK_BACKEND
+
+if TYPE_CHECKING:
+    from engine import Engine
+    from runner.draw import Drawer
+    from runner.trace import TraceFrame
 
 GRAYSCALE = 230
 BACKGROUND_COLOR = (GRAYSCALE, GRAYSCALE, GRAYSCALE)
 
 MAX_SUBSTEP_LENGTH = 0.01
 
+# Checked before every step of run_headless, True ends the run early
+StopCondition = Callable[[Game], bool]
+
+
+def at_possession_boundaries(should_stop: StopCondition) -> StopCondition:
+    """
+    Only asks should_stop at the start of a run and after a possession ends,
+    so runs never end in the middle of a possession
+    """
+    last_possessions = None
+
+    def stop_at_boundary(game: Game) -> bool:
+        nonlocal last_possessions
+        possessions = game.scoreboard.possessions
+        if possessions == last_possessions:
+            return False
+        last_possessions = possessions
+        return should_stop(game)
+
+    return stop_at_boundary
+
 
 def time_frame_for(fps: int, speed_scale: float) -> float:
     return speed_scale / fps
@@ -17,22 +44,36 @@ def step_space(space: Space, time_frame: float):
     space.step(time_frame, MAX_SUBSTEP_LENGTH)
 
 
-def loop(game: Game, engine: Engine, drawer: Drawer, time_frame: float):
-    space = Space().add(game)
+def _draw(engine: Engine, drawer: Drawer, game: Game):
+    drawer.surface.fill(BACKGROUND_COLOR)
+    draw_game(drawer, game)
 
-    def _loop():
-        drawer.surface.fill(BACKGROUND_COLOR)
-        draw_game(drawer, game)
+    target_rectangle = engine.surface.get_rect()
+    source_rectangle = drawer.surface.get_rect(center=target_rectangle.center)
+    engine.surface.blit(drawer.surface, source_rectangle)
+
+
+def loop(
+    game: Game,
+    engine: Engine,
+    drawer: Drawer,
+    time_frame: float,
+    instrumentation: Optional[Instrumentation] = None,
+):
+    space = Space(instrumentation=instrumentation).add(game)
 
-        target_rectangle = engine.surface.get_rect()
-        source_rectangle = drawer.surface.get_rect(center=target_rectangle.center)
-        engine.surface.blit(drawer.surface, source_rectangle)
+    def _loop():
+        _draw(engine, drawer, game)
         step_space(space, time_frame)
 
     return _loop
 
 
-def run(game: Game, fps: int, speed_scale: float, display_scale: float, monitor=None):
+def _window(game: Game, fps: int, display_scale: float):
+    # pygame is only imported when a window is opened, headless runs skip it
+    from engine import Engine
+    from runner.draw import Drawer, resolution_for, padded_resolution_for
+
     resolution = resolution_for(game, display_scale)
     padded_resolution = padded_resolution_for(game, display_scale, display_scale)
     scale = resolution[0] / game.court.dimensions[0]
@@ -40,9 +81,20 @@ def run(game: Game, fps: int, speed_scale: float, display_scale: float, monitor=
 
     drawer = Drawer(padded_resolution, scale, (padding, padding))
     engine = Engine(padded_resolution, fps)
-
+    return engine, drawer
+
+
+def run(
+    game: Game,
+    fps: int,
+    speed_scale: float,
+    display_scale: float,
+    monitor=None,
+    instrumentation: Optional[Instrumentation] = None,
+):
+    engine, drawer = _window(game, fps, display_scale)
     time_frame = time_frame_for(fps, speed_scale)
-    main_loop = loop(game, engine, drawer, time_frame)
+    main_loop = loop(game, engine, drawer, time_frame, instrumentation)
 
     def game_loop():
         if monitor is not None:
@@ -52,11 +104,37 @@ def run(game: Game, fps: int, speed_scale: float, display_scale: float, monitor=
     engine.run(game_loop)
 
 
+def replay(game: Game, frames: Iterable[TraceFrame], fps: int, display_scale: float):
+    """
+    Draws one recorded frame per display frame, game only holds the state to
+    draw and is never stepped. The last frame stays up until the window closes
+    """
+    from runner.trace import show_frame
+
+    engine, drawer = _window(game, fps, display_scale)
+    remaining = iter(frames)
+
+    def replay_loop():
+        frame = next(remaining, None)
+        if frame is not None:
+            show_frame(game, frame)
+        _draw(engine, drawer, game)
+
+    engine.run(replay_loop)
+
+
 def run_headless(
-    game: Game, fps: int, speed_scale: float, duration: float, monitor=None
+    game: Game,
+    fps: int,
+    speed_scale: float,
+    duration: float,
+    monitor=None,
+    backend: str = PYMUNK_BACKEND,
+    instrumentation: Optional[Instrumentation] = None,
+    should_stop: Optional[StopCondition] = None,
 ) -> Game:
     time_frame = time_frame_for(fps, speed_scale)
-    space = Space().add(game)
+    space = Space(backend, instrumentation).add(game)
     num_steps = math.ceil(duration / time_frame)
 
     def game_loop():
@@ -65,5 +143,7 @@ def run_headless(
         step_space(space, time_frame)
 
     for _ in range(num_steps):
+        if should_stop is not None and should_stop(game):
+            break
         game_loop()
     return game
@@ -0,0 +1,191 @@
+from __future__ import annotations
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple, Union
+import numpy as np
+from bball import Game, GameState, Scoreboard
+from bball.ball import BallSnapshot
+from bball.ball.dead_ball import DeadBall
+from bball.game.game import ShotClock
+
+INDEX_FILE_NAME = "index.json"
+TRACE_VERSION = 1
+DEFAULT_CHUNK_SIZE = 1024
+
+# Per frame columns, the leading dimension of every chunk file is the frame
+# count. Player rows are Player._snapshot tuples in game team order
+PLAYERS = "players"
+BALL_POSITIONS = "ball_positions"
+BALL_MODES = "ball_modes"
+SHOT_CLOCKS = "shot_clocks"
+SCORES = "scores"
+POSSESSIONS = "possessions"
+TIMES = "times"
+PLAYER_FIELDS = 6
+
+
+def _columns(num_players: int) -> Dict[str, Tuple[Tuple[int, ...], np.dtype]]:
+    return {
+        PLAYERS: ((num_players, PLAYER_FIELDS), np.dtype(np.float64)),
+        BALL_POSITIONS: ((2,), np.dtype(np.float64)),
+        BALL_MODES: ((), np.dtype(np.int8)),
+        SHOT_CLOCKS: ((), np.dtype(np.float64)),
+        SCORES: ((2,), np.dtype(np.float64)),
+        POSSESSIONS: ((2,), np.dtype(np.int32)),
+        TIMES: ((), np.dtype(np.float64)),
+    }
+
+
+def _chunk_folder_name(chunk_index: int) -> str:
+    return f"chunk_{chunk_index:06d}"
+
+
+@dataclass(frozen=True)
+class TraceFrame:
+    players: np.ndarray
+    ball_position: Tuple[float, float]
+    ball_mode: int
+    shot_clock: float
+    score: Tuple[float, float]
+    possessions: Tuple[int, int]
+    time: float
+
+
+class TraceRecorder:
+    """
+    Monitor for run / run_headless that appends the state of game before every
+    step to folder. Frames are buffered in memory and written as one .npy file
+    per column every chunk_size frames, index.json lists the chunks written so
+    far so partially written traces can be read
+    """
+
+    def __init__(
+        self,
+        folder: Union[str, Path],
+        game: Game,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        assert chunk_size > 0
+        self._folder = Path(folder)
+        self._folder.mkdir(parents=True, exist_ok=True)
+        self._game = game
+        self._players = [player for team in game.teams for player in team]
+        self._chunk_size = chunk_size
+        self._columns = _columns(len(self._players))
+        self._buffers = {
+            name: np.empty((chunk_size, *shape), dtype=dtype)
+            for name, (shape, dtype) in self._columns.items()
+        }
+        self._buffered = 0
+        self._chunks: List[Dict[str, Union[str, int]]] = []
+        self._time = 0.0
+        self._write_index()
+
+    def __call__(self, time_frame: float):
+        game = self._game
+        row = self._buffered
+        buffers = self._buffers
+        buffers[PLAYERS][row] = [player._snapshot() for player in self._players]
+        buffers[BALL_POSITIONS][row] = game.ball.position
+        buffers[BALL_MODES][row] = game.ball.mode.value
+        buffers[SHOT_CLOCKS][row] = game.shot_clock
+        buffers[SCORES][row] = game.scoreboard.score
+        buffers[POSSESSIONS][row] = game.scoreboard.possessions
+        buffers[TIMES][row] = self._time
+        self._time += time_frame
+        self._buffered += 1
+        if self._buffered == self._chunk_size:
+            self.flush()
+
+    def flush(self):
+        if self._buffered == 0:
+            return
+        name = _chunk_folder_name(len(self._chunks))
+        chunk_folder = self._folder.joinpath(name)
+        chunk_folder.mkdir(exist_ok=True)
+        for column, buffer in self._buffers.items():
+            np.save(chunk_folder.joinpath(f"{column}.npy"), buffer[: self._buffered])
+        self._chunks.append({"folder": name, "frames": self._buffered})
+        self._buffered = 0
+        self._write_index()
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self) -> TraceRecorder:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def _write_index(self):
+        team_sizes = [len(team) for team in self._game.teams]
+        index = {
+            "version": TRACE_VERSION,
+            "team_sizes": team_sizes,
+            "shot_clock_duration": self._game.shot_clock_duration,
+            "chunks": self._chunks,
+        }
+        index_path = self._folder.joinpath(INDEX_FILE_NAME)
+        temporary_path = index_path.with_suffix(".tmp")
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(index, file, indent=4)
+        temporary_path.replace(index_path)
+
+
+class Trace:
+    """Reads a folder written by TraceRecorder, chunks are memory mapped"""
+
+    def __init__(self, folder: Union[str, Path]):
+        self._folder = Path(folder)
+        with open(
+            self._folder.joinpath(INDEX_FILE_NAME), "r", encoding="utf-8"
+        ) as file:
+            index = json.load(file)
+        assert index["version"] == TRACE_VERSION, f"Unknown trace {index['version']}"
+        self.team_sizes: List[int] = index["team_sizes"]
+        self.shot_clock_duration: float = index["shot_clock_duration"]
+        self._chunks: List[Dict[str, Union[str, int]]] = index["chunks"]
+
+    def __len__(self) -> int:
+        return sum(int(chunk["frames"]) for chunk in self._chunks)
+
+    def chunks(self) -> Iterator[Dict[str, np.ndarray]]:
+        for chunk in self._chunks:
+            chunk_folder = self._folder.joinpath(str(chunk["folder"]))
+            yield {
+                column: np.load(chunk_folder.joinpath(f"{column}.npy"), mmap_mode="r")
+                for column in _columns(0)
+            }
+
+    def column(self, name: str) -> np.ndarray:
+        # Whole column in memory, for analysis
+        return np.concatenate([chunk[name] for chunk in self.chunks()])
+
+    def frames(self) -> Iterator[TraceFrame]:
+        for chunk in self.chunks():
+            for row in range(len(chunk[TIMES])):
+                yield TraceFrame(
+                    np.array(chunk[PLAYERS][row]),
+                    tuple(chunk[BALL_POSITIONS][row].tolist()),
+                    int(chunk[BALL_MODES][row]),
+                    float(chunk[SHOT_CLOCKS][row]),
+                    tuple(chunk[SCORES][row].tolist()),
+                    tuple(chunk[POSSESSIONS][row].tolist()),
+                    float(chunk[TIMES][row]),
+                )
+
+
+def show_frame(game: Game, frame: TraceFrame) -> Game:
+    """
+    Puts game in the recorded state for drawing without stepping it. The ball
+    is left dead at its recorded position, its mode only lives in the trace
+    """
+    clock = ShotClock(game.shot_clock_duration)
+    if frame.shot_clock < game.shot_clock_duration:
+        clock.active_possession = 0
+        clock.deadline = frame.shot_clock
+    scoreboard = Scoreboard(*frame.score, *frame.possessions)
+    ball = BallSnapshot(DeadBall(False), frame.ball_position, None)
+    return game.restore(GameState(frame.players, ball, clock, scoreboard))
@@ -0,0 +1,73 @@
+from random import seed
+import numpy as np
+from bball import BallMode, BatchSpace
+from bball.utils import close_to, approx
+from bball.create import (
+    create_initialized_player,
+    create_player_attributes,
+    create_teams,
+    create_game,
+    create_space,
+)
+from .utils import parametrize_movement, setup_players
+
+seed(2)
+
+
+def setup_games(num_games: int, velocity_decay: float, max_velocity: float):
+    games = []
+    for _ in range(num_games):
+        players = setup_players(velocity_decay, max_velocity)
+        games.append(create_game(create_teams(players[:2], players[2:])))
+    return games
+
+
+@parametrize_movement
+def test_matches_space(velocity_decay, max_velocity, max_substep_length):
+    num_games = 3
+    time_frame = 0.2
+    games = setup_games(num_games, velocity_decay, max_velocity)
+    batch = BatchSpace.from_games(games)
+    spaces = [create_space(*game.teams) for game in games]
+    rng = np.random.default_rng(2)
+    for _ in range(30):
+        turns = rng.uniform(-1, 1, (num_games, batch.num_players))
+        accelerations = rng.uniform(-1, 1, (num_games, batch.num_players))
+        for game_index, game in enumerate(games):
+            players = [player for team in game.teams for player in team]
+            for player_index, player in enumerate(players):
+                player.turn(float(turns[game_index, player_index])).accelerate(
+                    float(accelerations[game_index, player_index])
+                )
+            spaces[game_index].step(time_frame, max_substep_length)
+        batch.turn(turns).accelerate(accelerations).step(time_frame, max_substep_length)
+
+    for game_index, game in enumerate(games):
+        players = [player for team in game.teams for player in team]
+        for player_index, player in enumerate(players):
+            index = (game_index, player_index)
+            assert close_to(player.position, tuple(batch.positions[index]))
+            assert close_to(player.velocity, tuple(batch.velocities[index]))
+            assert approx(player.orientation_degrees, batch.orientations_degrees[index])
+
+
+def test_held_ball_and_shot():
+    player = create_initialized_player(
+        attributes=create_player_attributes(shot_velocity=1.0)
+    )
+    game = create_game(create_teams(player))
+    game.ball.jump_ball_won_by(player)
+    batch = BatchSpace.from_games([game])
+    assert batch.held_by(0)[0]
+
+    batch.accelerate(np.ones((1, 1))).step(1)
+    assert close_to(tuple(batch.ball_positions[0]), (1, 0))
+
+    batch.shoot_at(np.array([0]), np.array([[4.0, 0.0]]), 1.0)
+    for time_since_shot in range(1, 3):
+        batch.step(1)
+        assert batch.mode_mask(BallMode.MIDSHOT)[0]
+        assert close_to(tuple(batch.ball_positions[0]), (1 + time_since_shot, 0))
+    batch.step(1)
+    assert batch.mode_mask(BallMode.REACHEDSHOT)[0]
+    assert close_to(tuple(batch.ball_positions[0]), (4, 0))
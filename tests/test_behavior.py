@@ -2,7 +2,15 @@ import math
 from random import uniform, seed
 import pytest
 from bball import ReachVelocity, Stop, ReachPosition
-from bball.utils import close_to, approx
+from bball.utils import (
+    close_to,
+    approx,
+    angle_degrees_to_vector,
+    distance_between,
+    sum_of,
+)
+from bball.behavior import kinematics, utils
+from bball.behavior.reach_velocity import ideal_acceleration_multiplier
 from bball.create import (
     create_initialized_player,
     create_team,
@@ -167,3 +175,48 @@ def test_stopping():
         space.step(time_frame)
     assert close_to(player_1.velocity, (0, 0))
     assert close_to(player_2.velocity, (0, 0))
+
+
+@pytest.mark.parametrize("_trial_index", range(200))
+def test_closed_form_kinematics_match_reference(_trial_index):
+    a_max = uniform(0.1, 10)
+    v_curr = uniform(0, 20) if _trial_index % 2 else 0.0
+    distance = uniform(0, 60) if _trial_index % 3 else uniform(0, 0.1)
+    time_frame = [0.01, 1 / 60, 0.2, 1.0][_trial_index % 4]
+    args = (a_max, v_curr, distance, time_frame)
+
+    assert kinematics.steady_steps_needed(*args) == utils.steady_steps_needed(*args)
+    assert approx(kinematics.min_steps_needed(*args), utils.min_steps_needed(*args))
+    acceleration, steps = kinematics.acceleration_for(*args)
+    reference_acceleration, reference_steps = utils.acceleration_for(*args)
+    assert steps == reference_steps
+    assert approx(acceleration, reference_acceleration)
+    assert approx(
+        kinematics.highest_acceleration_without_overshoot(*args),
+        utils.highest_acceleration_without_overshoot(*args),
+    )
+
+
+@pytest.mark.parametrize("_trial_index", range(20))
+def test_ideal_acceleration_multiplier(_trial_index):
+    time_frame = 0.1
+    players = [
+        create_initialized_player(
+            attributes=create_player_attributes(max_acceleration=uniform(0.5, 5)),
+            orientation_degrees=uniform(-180, 180),
+        ).with_velocity(uniform(-3, 3))
+        for _ in range(5)
+    ]
+    targets = [(uniform(-3, 3), uniform(-3, 3)) for _ in players]
+    for player, target in zip(players, targets):
+        multiplier = ideal_acceleration_multiplier(player, target, time_frame)
+
+        def error_after(coeff):
+            a_max = player.physical_attributes.max_acceleration
+            step = angle_degrees_to_vector(
+                player.orientation_degrees, coeff * a_max * time_frame
+            )
+            return distance_between(sum_of(player.velocity, step), target)
+
+        candidates = [-1 + 2 * index / 1000 for index in range(1001)]
+        assert error_after(multiplier) <= min(map(error_after, candidates)) + 10**-9
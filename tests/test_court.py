@@ -1,12 +1,17 @@
 from typing import Tuple
+import numpy as np
 from bball import Court, Hoop, Player, Space
+from bball.court import shot_value_grid_for
 from bball.create import (
     create_initialized_player,
     create_court,
     create_three_point_line,
     create_hoop,
     create_space,
+    create_linear_shot_probability,
+    create_player_attributes,
 )
+from bball.utils import approx
 from .utils import require_exception
 
 
@@ -152,3 +157,54 @@ def test_left_three_point_line():
         assert is_position_beyond_line(right_hoop, reflect(position))
     for position in within_line_positions:
         assert not is_position_beyond_line(right_hoop, reflect(position))
+
+    positions = np.array(beyond_line_positions + within_line_positions)
+    expected_beyond = [True] * len(beyond_line_positions) + [False] * len(
+        within_line_positions
+    )
+    assert left_hoop.three_point_line.are_beyond(positions).tolist() == expected_beyond
+    assert left_hoop.values_of_shots_from(positions).tolist() == [
+        3 if beyond else 2 for beyond in expected_beyond
+    ]
+
+
+def test_expected_values_of_shots_from():
+    width = 20
+    height = 10
+    hoop = create_hoop(width, height)
+    shot_probability = create_linear_shot_probability(max_shot_distance=12)
+    positions = np.array([[0, 0], [1, 5], [4, 8], [10, 5], [19, 1], [20, 10]])
+    expected_values = hoop.expected_values_of_shots_from(positions, shot_probability)
+    for position, expected_value in zip(positions.tolist(), expected_values):
+        player = create_initialized_player(
+            position=tuple(position),
+            attributes=create_player_attributes(shot_probability=shot_probability),
+        )
+        assert approx(hoop.expected_value_of_shot_by(player), expected_value)
+
+
+def test_shot_value_grid():
+    width = 20
+    height = 10
+    hoop = create_hoop(width, height)
+    shot_probability = create_linear_shot_probability(max_shot_distance=12)
+    grid = shot_value_grid_for((width, height), hoop, shot_probability, 2.0)
+    assert grid is shot_value_grid_for(
+        (width, height), create_hoop(width, height), shot_probability, 2.0
+    )
+    assert grid is not shot_value_grid_for((width, height), hoop, shot_probability, 4.0)
+
+    grid_points = np.array([[0, 0], [0.5, 5], [3, 4.5], [20, 10]])
+    exact_values = hoop.expected_values_of_shots_from(grid_points, shot_probability)
+    assert np.allclose(grid.values_at(grid_points), exact_values)
+    for position, exact_value in zip(grid_points.tolist(), exact_values):
+        assert approx(grid(tuple(position)), exact_value)
+
+    off_grid_points = np.array([[1.2, 5.1], [2.7, 4.3], [-1, -1], [25, 12]])
+    interpolated_values = grid.values_at(off_grid_points)
+    for position, interpolated_value in zip(
+        off_grid_points.tolist(), interpolated_values
+    ):
+        assert approx(grid(tuple(position)), interpolated_value)
+    assert approx(interpolated_values[2], grid((0, 0)))
+    assert approx(interpolated_values[3], grid((width, height)))
@@ -0,0 +1,78 @@
+from ga.cache import MatchupCache
+from ga.evaluation_game import evaluation_game
+from ga.learn import cache_config
+from ga.metadata import Metadata
+from ga.parameters import RegularParameters
+
+CONFIG = {"duration": 10}
+
+
+def setup_individuals(count: int):
+    return [RegularParameters(0.1 * index, 0.5, 28.0) for index in range(count)]
+
+
+def test_flipped_pair_hits_with_negated_delta():
+    first, second = setup_individuals(2)
+    cache = MatchupCache(CONFIG)
+    assert cache.lookup(first, second) is None
+    cache.store(first, second, 3.0)
+    assert cache.lookup(first, second) == 3.0
+    assert cache.lookup(second, first) == -3.0
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_store_averages_samples():
+    first, second = setup_individuals(2)
+    cache = MatchupCache(CONFIG)
+    cache.store(first, second, 2.0)
+    cache.store(second, first, 2.0)
+    cache.store(first, second, 6.0)
+    assert cache.lookup(first, second) == 2.0
+    assert len(cache) == 1
+
+
+def test_least_recently_used_pair_is_evicted():
+    first, second, third, fourth = setup_individuals(4)
+    cache = MatchupCache(CONFIG, capacity=2)
+    cache.store(first, second, 1.0)
+    cache.store(first, third, 2.0)
+    assert cache.lookup(first, second) == 1.0
+    cache.store(first, fourth, 3.0)
+    assert len(cache) == 2
+    assert cache.lookup(first, third) is None
+    assert cache.lookup(first, second) == 1.0
+    assert cache.lookup(first, fourth) == 3.0
+
+
+def test_save_and_load(tmp_path):
+    first, second, third = setup_individuals(3)
+    path = str(tmp_path.joinpath("cache", "matchups.json"))
+    cache = MatchupCache(CONFIG, path)
+    cache.store(first, second, 1.0)
+    cache.store(second, third, -2.0)
+    cache.store(second, third, 0.0)
+    cache.save()
+    loaded = MatchupCache(CONFIG, path)
+    assert len(loaded) == 2
+    assert loaded.lookup(second, first) == -1.0
+    # Loaded sample counts keep averaging
+    loaded.store(second, third, -4.0)
+    assert loaded.lookup(second, third) == -2.0
+    assert len(MatchupCache(CONFIG, path, capacity=1)) == 1
+    assert MatchupCache({"duration": 20}, path).lookup(first, second) is None
+
+
+def test_expected_value_games_share_the_cache_across_seeds():
+    def config(seed: int, use_ev: bool):
+        def game_generator():
+            game = evaluation_game(1)
+            game.settings.use_expected_value_for_points = use_ev
+            return game
+
+        metadata = Metadata.create(
+            game_generator, 4, 1, duration=10, fps=20, speed_scale=1.0, seed=seed
+        )
+        return cache_config(metadata, game_generator())
+
+    assert config(1, True) == config(2, True)
+    assert config(1, False) != config(2, False)
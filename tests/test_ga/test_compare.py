@@ -0,0 +1,86 @@
+import pytest
+from bball.space import BACKENDS
+from ga import EarlyStopping
+from ga.evaluation_game import evaluation_game
+from ga.parameters import RegularParameters, compare
+from ga.parameters import parameters as parameters_module
+from runner import run_headless
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_compare_plays_in_backend(backend, monkeypatch):
+    backends = []
+
+    def recording_run_headless(*args, **kwargs):
+        backends.append(kwargs["backend"])
+        return run_headless(*args, **kwargs)
+
+    monkeypatch.setattr(parameters_module, "run_headless", recording_run_headless)
+    game = evaluation_game(1)
+    width = game.court.width
+    compare(
+        game,
+        RegularParameters(0.9, 0.2, width),
+        RegularParameters(0.3, 0.8, width),
+        duration=2,
+        fps=20,
+        backend=backend,
+    )
+    assert backends == [backend] * parameters_module.PERIODS
+
+
+def record_played_time(monkeypatch):
+    played = []
+
+    def recording_run_headless(game, *args, **kwargs):
+        start_time = game.elapsed_time
+        run_headless(game, *args, **kwargs)
+        played.append(game.elapsed_time - start_time)
+        return game
+
+    monkeypatch.setattr(parameters_module, "run_headless", recording_run_headless)
+    return played
+
+
+# Stopping at possession boundaries waits for the possession in progress
+@pytest.mark.parametrize(
+    "at_possession_boundaries, played_fraction", [(False, 0.9), (True, 0.99)]
+)
+def test_early_stopping_ends_lopsided_matchup(
+    at_possession_boundaries, played_fraction, monkeypatch
+):
+    game = evaluation_game(2)
+    width = game.court.width
+    shooter = RegularParameters(0.05, 1.0, width)
+    non_shooter = RegularParameters(1.0, 0.0, width)
+    kwargs = {"duration": 100, "fps": 20, "speed_scale": 3.0, "seed": 1}
+    full_delta = compare(game, shooter, non_shooter, **kwargs)
+    played = record_played_time(monkeypatch)
+    delta = compare(
+        game,
+        shooter,
+        non_shooter,
+        early_stopping=EarlyStopping(at_possession_boundaries),
+        **kwargs,
+    )
+    assert sum(played) < played_fraction * kwargs["duration"]
+    # The margin at the stop point is scaled up to the full duration
+    assert delta == pytest.approx(full_delta, rel=0.25)
+
+
+def test_early_stopping_plays_close_matchup_out(monkeypatch):
+    game = evaluation_game(1)
+    width = game.court.width
+    parameters_1 = RegularParameters(0.3, 0.6, width)
+    parameters_2 = RegularParameters(0.35, 0.5, width)
+    # The game clock lags the steps run at this frame rate
+    kwargs = {"duration": 100, "fps": 60, "speed_scale": 3.0, "seed": 1}
+    full_delta = compare(game, parameters_1, parameters_2, **kwargs)
+    played = record_played_time(monkeypatch)
+    delta = compare(
+        game, parameters_1, parameters_2, early_stopping=EarlyStopping(), **kwargs
+    )
+    assert sum(played) < kwargs["duration"]
+    assert full_delta != 0
+    # Samples that aren't decided are not extrapolated
+    assert delta == full_delta
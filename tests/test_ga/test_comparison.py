@@ -0,0 +1,137 @@
+import pickle
+from random import Random
+
+import pytest
+from bball.create import create_strategy, created_spaced_strategy
+from ga import (
+    Comparison,
+    ComparisonPool,
+    EarlyStopping,
+    VarianceReduction,
+    compare,
+    evaluation_game,
+)
+from ga.comparison import AntitheticRandom
+from ga.parameters import RegularParameters
+from .utils import random_points_game
+
+COMPARE_KWARGS = {"duration": 30, "fps": 20, "speed_scale": 3.0, "seed": 7}
+VARIANCE_REDUCTION = VarianceReduction(min_samples=2, max_samples=3)
+
+
+def matchup(width):
+    return RegularParameters(0.9, 0.2, width), RegularParameters(0.3, 0.8, width)
+
+
+def test_is_done_waits_for_min_samples():
+    variance_reduction = VarianceReduction(min_samples=3, max_samples=5)
+    assert not variance_reduction.is_done([])
+    assert not variance_reduction.is_done([10.0, 10.0])
+
+
+def test_is_done_at_max_samples():
+    variance_reduction = VarianceReduction(min_samples=3, max_samples=5)
+    assert variance_reduction.is_done([1.0, -1.0, 2.0, -2.0, 0.0])
+
+
+def test_identical_zero_samples_are_not_a_decision():
+    variance_reduction = VarianceReduction(min_samples=3, max_samples=5)
+    assert not variance_reduction.is_done([0.0, 0.0, 0.0])
+
+
+def test_is_done_when_interval_excludes_zero():
+    variance_reduction = VarianceReduction(min_samples=3, max_samples=5)
+    assert variance_reduction.is_done([2.0, 2.0, 2.0])
+    assert variance_reduction.is_done([4.0, 5.0, 6.0])
+    assert not variance_reduction.is_done([4.0, -3.0, 1.0])
+
+
+def test_antithetic_random_mirrors_seeded_random():
+    rng = Random(3)
+    antithetic = AntitheticRandom(3)
+    for _ in range(10):
+        assert antithetic.random() == pytest.approx(1.0 - rng.random())
+
+
+def test_comparison_pickles_with_sampling():
+    comparison = pickle.loads(pickle.dumps(Comparison(1.5, 3, 0.25)))
+    assert isinstance(comparison, Comparison)
+    assert comparison == 1.5
+    assert comparison.samples == 3
+    assert comparison.standard_error == 0.25
+
+
+def test_strategies_draw_random_numbers():
+    assert not create_strategy().draws_random_numbers
+    assert created_spaced_strategy(pass_probability=0.5).draws_random_numbers
+    assert not created_spaced_strategy(pass_probability=0).draws_random_numbers
+
+
+def test_seeded_compare_is_deterministic():
+    game = random_points_game()
+    parameters = matchup(game.court.width)
+    deltas = [compare(game, *parameters, **COMPARE_KWARGS) for _ in range(2)]
+    deltas.append(compare(random_points_game(), *parameters, **COMPARE_KWARGS))
+    assert deltas[0] == deltas[1] == deltas[2]
+    kwargs = dict(COMPARE_KWARGS, variance_reduction=VARIANCE_REDUCTION)
+    first = compare(game, *parameters, **kwargs)
+    second = compare(random_points_game(), *parameters, **kwargs)
+    assert first == second
+    assert (first.samples, first.standard_error) == (
+        second.samples,
+        second.standard_error,
+    )
+
+
+def test_expected_value_game_plays_one_sample():
+    game = evaluation_game(2)
+    parameters = matchup(game.court.width)
+    comparison = compare(
+        game, *parameters, variance_reduction=VARIANCE_REDUCTION, **COMPARE_KWARGS
+    )
+    assert comparison.samples == 1
+    assert comparison.standard_error == 0.0
+    assert comparison == compare(game, *parameters, **COMPARE_KWARGS)
+
+
+def test_random_game_resamples():
+    game = random_points_game()
+    comparison = compare(
+        game,
+        *matchup(game.court.width),
+        variance_reduction=VARIANCE_REDUCTION,
+        **COMPARE_KWARGS
+    )
+    assert comparison.samples >= VARIANCE_REDUCTION.min_samples
+
+
+def test_pool_returns_comparisons():
+    game = random_points_game()
+    population = list(matchup(game.court.width))
+    kwargs = dict(COMPARE_KWARGS, variance_reduction=VARIANCE_REDUCTION)
+    expected = compare(game, *population, **kwargs)
+    with ComparisonPool(random_points_game, processes=2, **kwargs) as pool:
+        (delta,) = pool(population, [(0, 1)])
+    assert isinstance(delta, Comparison)
+    assert delta == expected
+    assert delta.samples == expected.samples
+    assert delta.standard_error == expected.standard_error
+
+
+def test_early_stopping_counts_scoring_possessions():
+    early_stopping = EarlyStopping()
+    # 2 scoring possessions fit in the time left, plus the one in progress
+    assert not early_stopping.is_decided(6.0, 10.0, 5.0, 2.0)
+    assert early_stopping.is_decided(6.5, 10.0, 5.0, 2.0)
+    assert early_stopping.is_decided(-6.5, 10.0, 5.0, 2.0)
+    assert early_stopping.is_decided(2.5, 0.0, 5.0, 2.0)
+
+
+def test_early_stopping_allows_short_non_scoring_possessions():
+    # The leading side can turn the ball over right after every inbound, so
+    # the trailing side may score in every one of the 3 possessions that fit
+    assert not EarlyStopping().is_decided(5.0, 10.0, 5.0, 2.0)
+
+
+def test_early_stopping_needs_a_possession_bound():
+    assert not EarlyStopping().is_decided(100.0, 10.0, 0.0, 2.0)
@@ -0,0 +1,26 @@
+from ga import ComparisonPool, compare
+from ga.parameters import RegularParameters
+from .utils import random_points_game
+
+COMPARE_KWARGS = {"duration": 30, "fps": 20, "speed_scale": 3.0, "seed": 7}
+
+
+def test_matches_serial_compare():
+    game = random_points_game()
+    width = game.court.width
+    population = [
+        RegularParameters(0.9, 0.2, width),
+        RegularParameters(0.3, 0.8, width),
+        RegularParameters(0.5, 0.5, width),
+    ]
+    index_pairs = [(0, 1), (0, 2), (1, 2)]
+    expected = [
+        compare(game, population[i], population[j], **COMPARE_KWARGS)
+        for i, j in index_pairs
+    ]
+    assert any(delta != 0 for delta in expected)
+    with ComparisonPool(random_points_game, processes=2, **COMPARE_KWARGS) as pool:
+        assert pool(population, index_pairs) == expected
+        # Workers keep their template games across calls
+        assert pool(population, index_pairs[::-1]) == expected[::-1]
+        assert pool(population, []) == []
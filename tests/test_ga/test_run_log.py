@@ -0,0 +1,152 @@
+import json
+from dataclasses import asdict
+import pytest
+from ga.evaluation import Evaluation
+from ga.parameters import RegularParameters
+from ga.parameters.run_log import (
+    EVALUATION,
+    INDEX_FILE_NAME,
+    INDEX_RECORD,
+    LOG_FILE_NAME,
+    PARAMETERS,
+    RunLogReader,
+    RunLogWriter,
+)
+from ga.parameters.serializer import (
+    ParametersDeserializer,
+    ParametersSerializer,
+    generation_file_name,
+)
+
+
+def write_records(folder, records):
+    with RunLogWriter(folder) as writer:
+        for record in records:
+            writer.append(*record)
+
+
+def read_all(folder, kind=PARAMETERS):
+    reader = RunLogReader(folder)
+    return {
+        generation: reader.read(generation, kind)
+        for generation in reader.generations(kind)
+    }
+
+
+def population(size):
+    return [RegularParameters(index / size, 0.5, 10.0) for index in range(size)]
+
+
+def test_written_records_are_read_back(tmp_path):
+    write_records(
+        tmp_path,
+        [
+            (0, PARAMETERS, [1, 2]),
+            (0, EVALUATION, {"fitness": [0.5]}),
+            (2, PARAMETERS, [3]),
+            # Later records of a generation win
+            (2, PARAMETERS, [4]),
+        ],
+    )
+    reader = RunLogReader(tmp_path)
+    assert reader.generations(PARAMETERS) == [0, 2]
+    assert reader.generations(EVALUATION) == [0]
+    assert reader.read(2, PARAMETERS) == [4]
+    assert reader.read(0, EVALUATION) == {"fitness": [0.5]}
+    assert reader.latest_at_or_below(1, PARAMETERS) == 0
+    assert reader.latest_at_or_below(5, PARAMETERS) == 2
+    assert reader.latest_at_or_below(1, EVALUATION) == 0
+    assert reader.latest_at_or_below(-1, PARAMETERS) is None
+
+
+def test_reopened_writer_appends(tmp_path):
+    write_records(tmp_path, [(0, PARAMETERS, [1])])
+    write_records(tmp_path, [(1, PARAMETERS, [2])])
+    assert read_all(tmp_path) == {0: [1], 1: [2]}
+
+
+def test_writer_errors_are_raised_by_the_caller(tmp_path):
+    writer = RunLogWriter(tmp_path)
+    writer.append(0, PARAMETERS, [1])
+    writer.append(1, PARAMETERS, object())
+    writer.append(2, PARAMETERS, [3])
+    with pytest.raises(TypeError):
+        writer.flush()
+    # Records after the error are dropped, the log stays readable
+    writer.append(3, PARAMETERS, [4])
+    writer.close()
+    assert read_all(tmp_path) == {0: [1], 3: [4]}
+
+
+def test_partial_line_is_dropped_on_resume(tmp_path):
+    write_records(tmp_path, [(0, PARAMETERS, [1]), (1, PARAMETERS, [2])])
+    log_path = tmp_path.joinpath(LOG_FILE_NAME)
+    size = log_path.stat().st_size
+    with open(log_path, "ab") as log_file:
+        log_file.write(b'{"generation": 2, "kind": "param')
+    # Readers only follow the index
+    assert read_all(tmp_path) == {0: [1], 1: [2]}
+    write_records(tmp_path, [(2, PARAMETERS, [3])])
+    assert read_all(tmp_path) == {0: [1], 1: [2], 2: [3]}
+    lines = log_path.read_bytes()[size:].splitlines()
+    assert [json.loads(line)["generation"] for line in lines] == [2]
+
+
+def test_partial_index_record_is_dropped_on_resume(tmp_path):
+    write_records(tmp_path, [(0, PARAMETERS, [1])])
+    index_path = tmp_path.joinpath(INDEX_FILE_NAME)
+    with open(index_path, "ab") as index_file:
+        index_file.write(INDEX_RECORD.pack(1, 0, 0, 0)[:5])
+    assert read_all(tmp_path) == {0: [1]}
+    write_records(tmp_path, [(1, PARAMETERS, [2])])
+    assert index_path.stat().st_size == 2 * INDEX_RECORD.size
+    assert read_all(tmp_path) == {0: [1], 1: [2]}
+
+
+def test_missing_index_is_rebuilt(tmp_path):
+    write_records(
+        tmp_path,
+        [(0, PARAMETERS, [1]), (0, EVALUATION, {"a": 1}), (1, PARAMETERS, [2])],
+    )
+    index_path = tmp_path.joinpath(INDEX_FILE_NAME)
+    index = index_path.read_bytes()
+    index_path.unlink()
+    assert read_all(tmp_path) == {0: [1], 1: [2]}
+    assert read_all(tmp_path, EVALUATION) == {0: {"a": 1}}
+    assert index_path.read_bytes() == index
+
+
+def test_index_is_rebuilt_without_partial_line(tmp_path):
+    write_records(tmp_path, [(0, PARAMETERS, [1])])
+    with open(tmp_path.joinpath(LOG_FILE_NAME), "ab") as log_file:
+        log_file.write(b'{"generation": 1')
+    tmp_path.joinpath(INDEX_FILE_NAME).unlink()
+    assert read_all(tmp_path) == {0: [1]}
+    write_records(tmp_path, [(1, PARAMETERS, [2])])
+    assert read_all(tmp_path) == {0: [1], 1: [2]}
+
+
+def test_serialized_generations_are_deserialized(tmp_path):
+    generations = [population(3), population(2)]
+    with ParametersSerializer(str(tmp_path), serialize_gap=2) as serializer:
+        for parameters_list in generations * 2:
+            serializer.serialize_evaluation(Evaluation([(0, 1, 0.0)], [0.0, 0.0], [0]))
+            serializer.serialize_parameters(parameters_list)
+    deserializer = ParametersDeserializer(str(tmp_path))
+    # The gap skips generations 1 and 3
+    assert deserializer.deserialize_parameters(None) == (2, generations[0])
+    assert deserializer.deserialize_parameters(1) == (0, generations[0])
+
+
+def test_legacy_folder_is_deserialized(tmp_path):
+    generations = {0: population(3), 4: population(2)}
+    for generation, parameters_list in generations.items():
+        path = tmp_path.joinpath(generation_file_name(generation))
+        path.write_text(
+            json.dumps([asdict(parameters) for parameters in parameters_list])
+        )
+    # Evaluating an old folder starts a run log holding evaluations only
+    write_records(tmp_path, [(4, EVALUATION, {"a": 1})])
+    deserializer = ParametersDeserializer(str(tmp_path))
+    assert deserializer.deserialize_parameters(None) == (4, generations[4])
+    assert deserializer.deserialize_parameters(3) == (0, generations[0])
@@ -0,0 +1,118 @@
+from collections import Counter
+from random import Random
+import pytest
+from ga.schedulers import (
+    SCHEDULER_NAMES,
+    EloScheduler,
+    RandomOpponentsScheduler,
+    SwissScheduler,
+    round_robin,
+    scheduler_for,
+)
+
+POPULATION_SIZE = 8
+
+
+class Strength:
+    # Stand in individual, matchups are decided by the strength difference
+    def __init__(self, strength: float):
+        self.strength = strength
+
+
+def setup_population(rng: Random):
+    strengths = list(range(POPULATION_SIZE))
+    rng.shuffle(strengths)
+    return [Strength(strength) for strength in strengths]
+
+
+def strength_difference(population, index_pairs):
+    return [population[i].strength - population[j].strength for i, j in index_pairs]
+
+
+def played_pairs(deltas):
+    return [(i, j) for i, j, _ in deltas]
+
+
+def check_pairs(deltas):
+    for i, j in played_pairs(deltas):
+        assert 0 <= i < j < POPULATION_SIZE
+
+
+@pytest.mark.parametrize("name", SCHEDULER_NAMES)
+def test_scheduler_results(name):
+    population = setup_population(Random(1))
+    scheduler = scheduler_for(name, POPULATION_SIZE, Random(2))
+    deltas, fitness = scheduler(population, strength_difference)
+    assert len(fitness) == POPULATION_SIZE
+    check_pairs(deltas)
+    for i, j, delta in deltas:
+        assert delta == population[i].strength - population[j].strength
+    # Every scheduler finds the strongest individual
+    strongest = max(range(POPULATION_SIZE), key=lambda i: population[i].strength)
+    assert max(range(POPULATION_SIZE), key=lambda i: fitness[i]) == strongest
+
+
+@pytest.mark.parametrize("name", SCHEDULER_NAMES)
+def test_seeded_schedulers_are_deterministic(name):
+    def run(seed: int):
+        population = setup_population(Random(1))
+        scheduler = scheduler_for(name, POPULATION_SIZE, Random(seed))
+        return scheduler(population, strength_difference)
+
+    assert run(3) == run(3)
+
+
+def test_round_robin_plays_every_pair_once():
+    deltas, _ = round_robin(setup_population(Random(1)), strength_difference)
+    pairs = played_pairs(deltas)
+    assert len(pairs) == len(set(pairs)) == POPULATION_SIZE * (POPULATION_SIZE - 1) // 2
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_swiss_rounds_pair_everyone_without_rematches(seed):
+    rounds = 3
+    population = setup_population(Random(seed))
+    scheduler = SwissScheduler(rounds=rounds, rng=Random(seed))
+    deltas, _ = scheduler(population, strength_difference)
+    pairs = played_pairs(deltas)
+    assert len(pairs) == rounds * POPULATION_SIZE // 2
+    assert len(set(pairs)) == len(pairs)
+    for round_index in range(rounds):
+        round_pairs = pairs[round_index * 4 : (round_index + 1) * 4]
+        assert sorted(i for pair in round_pairs for i in pair) == list(
+            range(POPULATION_SIZE)
+        )
+
+
+def test_swiss_rounds_are_capped():
+    scheduler = SwissScheduler(rounds=20, rng=Random(0))
+    deltas, _ = scheduler(setup_population(Random(0)), strength_difference)
+    assert len(deltas) == (POPULATION_SIZE - 1) * POPULATION_SIZE // 2
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_random_opponents(seed):
+    opponents = 3
+    scheduler = RandomOpponentsScheduler(opponents=opponents, rng=Random(seed))
+    deltas, fitness = scheduler(setup_population(Random(seed)), strength_difference)
+    pairs = played_pairs(deltas)
+    assert len(set(pairs)) == len(pairs)
+    check_pairs(deltas)
+    games_played = Counter(i for pair in pairs for i in pair)
+    assert all(games_played[i] >= opponents for i in range(POPULATION_SIZE))
+    for index, value in enumerate(fitness):
+        total = sum(
+            delta if i == index else -delta for i, j, delta in deltas if index in (i, j)
+        )
+        assert value == pytest.approx(total / games_played[index])
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_elo_rounds(seed):
+    max_rounds = 6
+    scheduler = EloScheduler(max_rounds=max_rounds, rng=Random(seed))
+    deltas, ratings = scheduler(setup_population(Random(seed)), strength_difference)
+    num_rounds, remainder = divmod(len(deltas), POPULATION_SIZE // 2)
+    assert remainder == 0 and scheduler.patience <= num_rounds <= max_rounds
+    # Rating changes are zero sum
+    assert sum(ratings) == pytest.approx(POPULATION_SIZE * scheduler.initial_rating)
@@ -0,0 +1,8 @@
+from ga import evaluation_game
+
+
+def random_points_game():
+    # Made and missed shots are drawn, so results depend on the seeding
+    game = evaluation_game(2)
+    game.settings.use_expected_value_for_points = False
+    return game
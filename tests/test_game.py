@@ -1,4 +1,7 @@
 import math
+import random
+from typing import Optional
+import numpy as np
 from dataclasses import dataclass
 from bball import BallMode, Scoreboard
 from bball.utils import close_to, distance_between, approx
@@ -12,6 +15,7 @@ from bball.create import (
     create_hoop,
     create_uninitialized_player,
     create_guaranteed_shot_probability,
+    create_linear_shot_probability,
     create_player_attributes,
 )
 
@@ -63,6 +67,26 @@ def test_pass_completion():
     assert player_2.has_ball
 
 
+def test_pass_to_teleported_receiver():
+    player_1 = create_initialized_player(
+        attributes=create_player_attributes(pass_velocity=1.0)
+    )
+    player_2 = create_initialized_player(position=(20, 0))
+    game = create_game(create_teams([player_1, player_2]))
+    space = create_space().add(game)
+    ball = game.ball
+    ball.jump_ball_won_by(player_1)
+    player_1.pass_to(player_2)
+    space.step(0.5)
+    assert ball.mode == BallMode.MIDPASS
+    # Far faster than the receiver could run, the pass completes on arrival
+    player_2.place_at((0.75, 0), 0)
+    space.step(0.1)
+    assert ball.mode == BallMode.MIDPASS
+    space.step(0.2)
+    assert ball.mode == BallMode.RECEIVEDPASS
+
+
 def test_shot_completion_with_movement_after_shot():
     width = 10
     height = 6
@@ -154,7 +178,7 @@ def _check_probability_in_threshold(
     assert lower_bound <= rounded_probability <= upper_bound, unsafe_probability_msg
 
 
-def setup_scoring_test(use_ev: bool) -> ScoringTest:
+def setup_scoring_test(use_ev: bool, seed: Optional[int] = None) -> ScoringTest:
     width = 50
     court = create_court(width=width)
     player = create_initialized_player(
@@ -164,7 +188,7 @@ def setup_scoring_test(use_ev: bool) -> ScoringTest:
         teams=create_teams(player),
         settings=create_game_settings(use_expected_value_for_points=use_ev),
         court=court,
-    )
+    ).seed(seed)
     ball = game.ball
     space = create_space().add(game)
     ball.jump_ball_won_by(player)
@@ -201,3 +225,194 @@ def test_non_guaranteed_scoring():
         if did_score:
             times_scored += 1
     assert 0 < times_scored < trials
+
+
+def test_seeded_scoring():
+    seeds = range(20)
+    random.seed(0)
+    expected_draw = random.random()
+    random.seed(0)
+    scores = [setup_scoring_test(use_ev=False, seed=seed).score for seed in seeds]
+    assert random.random() == expected_draw
+    assert [setup_scoring_test(False, seed).score for seed in seeds] == scores
+    assert len(set(scores)) > 1
+
+
+def test_max_points_per_possession():
+    player = create_initialized_player()
+    game = create_game(create_teams(player))
+    assert game.max_points_per_possession() == 3
+    game.settings.use_expected_value_for_points = True
+    probability = player.skill_attributes.shot_probability(0.0)
+    assert approx(game.max_points_per_possession(), 3 * probability)
+
+
+def test_min_possession_duration():
+    def inbound_distance(game):
+        player = game.teams[0][0]
+        _, placements = game.inbound_placements(0)
+        return distance_between(placements[0][:2], game.target_hoop(player).position)
+
+    def setup_game(shot_velocity, shot_probability):
+        attributes = create_player_attributes(
+            max_velocity=4.0,
+            shot_probability=shot_probability,
+            shot_velocity=shot_velocity,
+        )
+        player_1 = create_initialized_player(attributes=attributes)
+        player_2 = create_initialized_player(attributes=attributes)
+        return create_game(
+            create_teams(player_1, player_2),
+            court=create_court(20, 10),
+            settings=create_game_settings(use_instant_inbounding=False),
+        )
+
+    # Shooting from the inbound spot
+    game = setup_game(10.0, create_guaranteed_shot_probability())
+    assert approx(game.min_possession_duration(), inbound_distance(game) / 10.0)
+    # Running to the hoop beats slow shots
+    game = setup_game(2.0, create_guaranteed_shot_probability())
+    assert approx(game.min_possession_duration(), inbound_distance(game) / 4.0)
+    # Running into range of a short shot first
+    game = setup_game(10.0, create_linear_shot_probability(1.0, 0.0, 0.0, 5.0))
+    duration = game.min_possession_duration()
+    assert inbound_distance(game) / 10.0 < duration < inbound_distance(game) / 4.0
+    game.settings.use_instant_inbounding = True
+    assert game.min_possession_duration() == 0.0
+
+
+def test_shot_clock():
+    player_1 = create_initialized_player(position=(1, 1))
+    player_2 = create_initialized_player(position=(2, 2))
+    game = create_game(
+        create_teams(player_1, player_2),
+        settings=create_game_settings(shot_clock_duration=1.0),
+    )
+    space = create_space().add(game)
+    assert game.team_index_of(player_1) == 0
+    assert game.team_index_of(player_2) == 1
+
+    game.ball.jump_ball_won_by(player_1)
+    for _ in range(3):
+        space.step(0.25)
+        assert game.ball.mode == BallMode.HELD
+    assert approx(game.shot_clock, 0.25)
+    space.step(0.25)
+    assert game.ball.mode == BallMode.DEAD
+    assert game.scoreboard.possessions[0] == 1
+    assert approx(game.shot_clock, game.shot_clock_duration)
+
+    space.step(0.25)
+    assert player_2.has_ball
+    space.step(0.25)
+    assert approx(game.shot_clock, 0.75)
+
+
+def test_snapshot_and_restore():
+    player_1 = create_initialized_player(
+        position=(1, 1), attributes=create_player_attributes(pass_velocity=2.0)
+    )
+    player_2 = create_initialized_player(position=(4, 3))
+    game = create_game(
+        create_teams([player_1, player_2]),
+        settings=create_game_settings(shot_clock_duration=20.0),
+    )
+    space = create_space().add(game)
+    game.ball.jump_ball_won_by(player_1)
+    player_1.turn(0.5).accelerate(1.0)
+    space.step(0.25)
+    state = game.snapshot()
+    position_1, velocity_1 = player_1.position, player_1.velocity
+    shot_clock = game.shot_clock
+
+    player_1.pass_to(player_2)
+    player_2.accelerate(1.0)
+    space.step(0.5)
+    assert game.ball.mode == BallMode.MIDPASS
+    assert not player_1.has_ball
+
+    space.restore(state)
+    assert game.ball.mode == BallMode.HELD
+    assert player_1.has_ball and not player_2.has_ball
+    assert player_1.position == position_1
+    assert player_1.velocity == velocity_1
+    assert close_to(player_2.position, (4, 3))
+    assert game.shot_clock == shot_clock
+
+    player_1.pass_to(player_2)
+    space.step(0.5)
+    mid_pass_state = game.snapshot()
+    ball_position = game.ball.position
+    for _ in range(10):
+        space.step(0.5)
+    assert player_2.has_ball
+
+    game.restore(mid_pass_state)
+    assert game.ball.mode == BallMode.MIDPASS
+    assert game.ball.position == ball_position
+    for _ in range(10):
+        space.step(0.5)
+    assert player_2.has_ball
+    assert game.scoreboard.possessions == (0, 0)
+
+
+def test_reset_possession():
+    player_1 = create_initialized_player(position=(1, 1))
+    player_2 = create_initialized_player(position=(2, 2))
+    game = create_game(
+        create_teams(player_1, player_2),
+        settings=create_game_settings(shot_clock_duration=1.0),
+    )
+    space = create_space().add(game)
+    game.ball.jump_ball_won_by(player_2)
+    space.step(0.5)
+    assert approx(game.shot_clock, 0.5)
+
+    placements = np.array([[3.0, 4.0, 90.0], [5.0, 2.0, -90.0]])
+    game.reset_possession(player_1, placements)
+    assert game.ball.mode == BallMode.HELD
+    assert player_1.has_ball and not player_2.has_ball
+    assert close_to(player_1.position, (3, 4))
+    assert close_to(player_2.position, (5, 2))
+    assert approx(player_2.orientation_degrees, -90)
+    assert approx(game.shot_clock, game.shot_clock_duration)
+    assert game.scoreboard.possessions == (0, 0)
+
+    game.reset_possession(player_1, placements)
+    assert player_1.has_ball
+    space.step(0.25)
+    assert approx(game.shot_clock, 0.75)
+
+
+def test_expected_value_of_shot_by_grid():
+    player = create_initialized_player(position=(10.3, 2.7))
+    exact_game = create_game(create_teams(player))
+    exact_value = exact_game.expected_value_of_shot_by(player)
+    assert exact_value == exact_game.target_hoop(player).expected_value_of_shot_by(
+        player
+    )
+
+    grid_game = create_game(
+        create_teams(player),
+        settings=create_game_settings(use_shot_value_grid=True),
+    )
+    grid_value = grid_game.expected_value_of_shot_by(player)
+    assert grid_value != exact_value
+    assert abs(grid_value - exact_value) < 0.01
+
+
+def test_possession_of_a_shot_taken_when_the_ball_is_gained():
+    # The possession starts on the transition to HELD, even when the shot is
+    # taken before the game looks at the ball again
+    player_1 = create_initialized_player(
+        position=(1, 1), attributes=create_player_attributes(shot_velocity=100.0)
+    )
+    player_2 = create_initialized_player(position=(2, 2))
+    game = create_game(create_teams(player_1, player_2))
+    space = create_space().add(game)
+    for expected_possessions in [(1, 0), (2, 0)]:
+        game.ball.jump_ball_won_by(player_1)
+        player_1.shoot_at(game.target_hoop(player_1).position)
+        while game.ball.mode != BallMode.DEAD:
+            space.step(0.1)
+        assert game.scoreboard.possessions == expected_possessions
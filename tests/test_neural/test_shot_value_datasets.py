@@ -0,0 +1,71 @@
+from itertools import islice
+import numpy as np
+import pytest
+
+torch = pytest.importorskip("torch")
+
+# pylint: disable=wrong-import-position
+from experiment.initiate import canonical_game
+from neural.shot_value.datasets import (
+    PlayerDataset,
+    StreamingPlayerDataset,
+    generate_arrays,
+    generate_data_n,
+)
+
+N = 10
+CHUNK_SIZE = 4
+SEED = 5
+
+
+def test_arrays_shapes_and_ranges():
+    game = canonical_game(1)
+    points, labels = generate_arrays(N, game, np.random.default_rng(SEED))
+    assert points.shape == (N, 5) and points.dtype == np.float32
+    assert labels.shape == (N, 1) and labels.dtype == np.float32
+    assert ((0 <= points[:, 0:2]) & (points[:, 0:2] <= 1)).all()
+    assert ((-0.5 <= points[:, 4]) & (points[:, 4] < 0.5)).all()
+    assert ((0 <= labels) & (labels <= 1)).all()
+
+
+def test_seeded_data_is_deterministic():
+    game = canonical_game(1)
+    points, labels = generate_data_n(N, game, SEED)
+    assert points.dtype == labels.dtype == torch.float32
+    same_points, same_labels = generate_data_n(N, game, SEED)
+    assert torch.equal(points, same_points) and torch.equal(labels, same_labels)
+    other_points, _ = generate_data_n(N, game, SEED + 1)
+    assert not torch.equal(points, other_points)
+
+
+def test_player_dataset_items():
+    game = canonical_game(1)
+    dataset = PlayerDataset(
+        N, game, target_transform=lambda label: 2 * label, seed=SEED
+    )
+    points, labels = generate_data_n(N, game, SEED)
+    assert len(dataset) == N
+    point, label = dataset[3]
+    assert point.shape == (1, 5)
+    assert torch.equal(point[0], points[3])
+    assert torch.equal(label, 2 * labels[3])
+
+
+def test_streaming_chunks_cover_samples():
+    game = canonical_game(1)
+    dataset = StreamingPlayerDataset(game, seed=SEED, chunk_size=CHUNK_SIZE)
+    samples = list(islice(dataset, N))
+    assert len(samples) == N
+    assert all(point.shape == (1, 5) for point, _ in samples)
+
+    # N is not a multiple of CHUNK_SIZE, the last chunk is cut short
+    rng = np.random.default_rng([SEED, 0])
+    chunks = [generate_arrays(CHUNK_SIZE, game, rng) for _ in range(3)]
+    points = np.concatenate([points for points, _ in chunks])[:N]
+    labels = np.concatenate([labels for _, labels in chunks])[:N]
+    assert np.array_equal(np.stack([point[0] for point, _ in samples]), points)
+    assert np.array_equal(np.stack([label for _, label in samples]), labels)
+    assert all(
+        torch.equal(point, other_point)
+        for (point, _), (other_point, _) in zip(samples, islice(dataset, N))
+    )
@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("gym")
+pytest.importorskip("stable_baselines3")
+
+# pylint: disable=wrong-import-position
+from stable_baselines3 import PPO
+from neural.async_eval import AsyncEvalCallback, BEST_MODEL_NAME
+from neural.basic_offense.environment import Environment, action_dtype
+from neural.vec_env import SharedMemoryVecEnv, seeded_dummy_vec_env
+
+NUM_ENVS = 4
+WORKERS = 2
+SEED = 3
+STEPS = 40
+
+
+class MarkedEnvironment(Environment):
+    marker = -1
+
+    def marker_times(self, factor: int) -> int:
+        return self.marker * factor
+
+
+def setup_actions() -> np.ndarray:
+    rng = np.random.default_rng(SEED)
+    return rng.uniform(-1, 1, (STEPS, NUM_ENVS, 3)).astype(action_dtype)
+
+
+def rollout(vec_env):
+    results = [vec_env.reset()]
+    for actions in setup_actions():
+        vec_env.step_async(actions)
+        observations, rewards, dones, infos = vec_env.step_wait()
+        results.extend([observations, rewards, dones])
+        results.extend(
+            info["terminal_observation"]
+            for info in infos
+            if "terminal_observation" in info
+        )
+    return results
+
+
+def test_workers_match_dummy_vec_env():
+    generator = seeded_dummy_vec_env(Environment)
+    dummy_vec_env = generator(NUM_ENVS, SEED)
+    expected = rollout(dummy_vec_env)
+    dummy_vec_env.close()
+    shared_vec_env = SharedMemoryVecEnv(generator, NUM_ENVS, WORKERS, SEED)
+    try:
+        results = rollout(shared_vec_env)
+    finally:
+        shared_vec_env.close()
+    assert len(results) == len(expected)
+    for result, expected_result in zip(results, expected):
+        assert np.array_equal(result, expected_result)
+
+
+def test_attributes_and_methods_are_routed_by_index():
+    generator = seeded_dummy_vec_env(MarkedEnvironment)
+    vec_env = SharedMemoryVecEnv(generator, NUM_ENVS, WORKERS, SEED)
+    try:
+        for index in range(NUM_ENVS):
+            vec_env.set_attr("marker", index, indices=[index])
+        assert vec_env.get_attr("marker") == list(range(NUM_ENVS))
+        assert vec_env.get_attr("marker", indices=[3, 1]) == [1, 3]
+        assert vec_env.env_method("marker_times", 10, indices=[0, 2, 3]) == [
+            0,
+            20,
+            30,
+        ]
+        assert vec_env.env_method("marker_times", factor=2) == [0, 2, 4, 6]
+        assert vec_env.env_is_wrapped(PPO) == [False] * NUM_ENVS
+        with pytest.warns(UserWarning):
+            assert vec_env.render() is None
+    finally:
+        vec_env.close()
+    vec_env.close()
+
+
+def test_async_evaluation_keeps_best_model(tmp_path):
+    env = seeded_dummy_vec_env(Environment)(1, SEED)
+    model = PPO("MlpPolicy", env, n_steps=16, batch_size=16, n_epochs=1, seed=SEED)
+    callback = AsyncEvalCallback(
+        PPO,
+        Environment,
+        tmp_path.joinpath("snapshots"),
+        tmp_path.joinpath("best"),
+        eval_freq=16,
+        n_eval_episodes=1,
+        seed=SEED,
+    )
+    model.learn(32, callback=callback)
+    assert callback._pool is None
+    assert tmp_path.joinpath("best", BEST_MODEL_NAME).exists()
+    assert list(tmp_path.joinpath("snapshots").iterdir()) == []
+    env.close()
+
+
+def test_async_evaluation_closes_after_failed_training(tmp_path):
+    class FailingCallback(AsyncEvalCallback):
+        def _on_step(self) -> bool:
+            super()._on_step()
+            raise RuntimeError("training failed")
+
+    env = seeded_dummy_vec_env(Environment)(1, SEED)
+    model = PPO("MlpPolicy", env, n_steps=16, batch_size=16, n_epochs=1, seed=SEED)
+    callback = FailingCallback(
+        PPO,
+        Environment,
+        tmp_path.joinpath("snapshots"),
+        tmp_path.joinpath("best"),
+        eval_freq=1,
+        n_eval_episodes=1,
+        seed=SEED,
+    )
+    pool = callback._pool
+    with pytest.raises(RuntimeError):
+        model.learn(32, callback=callback)
+    assert callback._pool is pool
+    callback.close()
+    callback.close()
+    assert callback._pool is None
+    assert list(tmp_path.joinpath("snapshots").iterdir()) == []
+    with pytest.raises(ValueError):
+        pool.apply(sum, ([],))
+    env.close()
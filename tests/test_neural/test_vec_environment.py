@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+pytest.importorskip("gym")
+pytest.importorskip("stable_baselines3")
+
+# pylint: disable=wrong-import-position
+from neural.basic_offense.environment import (
+    Environment,
+    action_dtype,
+    action_shape,
+    observation_shape,
+)
+from neural.basic_offense.vec_environment import VecEnvironment
+
+NUM_ENVS = 4
+STEPS = 60
+SHOT_EVERY = 15
+
+
+def setup_actions(seed: int, num_envs: int) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    actions = rng.uniform(-1, 1, (STEPS, num_envs, *action_shape))
+    # Shots every SHOT_EVERY steps, the steps in between play without the ball
+    # once a shot is in the air so invalid shots are covered too
+    shots = np.arange(STEPS) % SHOT_EVERY == SHOT_EVERY - 1
+    actions[:, :, 2] = np.where(shots[:, None], 1.0, -1.0)
+    return actions.astype(action_dtype)
+
+
+def test_shapes():
+    vec_env = VecEnvironment(NUM_ENVS, seed=0)
+    observations = vec_env.reset()
+    assert observations.shape == (NUM_ENVS, *observation_shape)
+    assert vec_env.observation_space.contains(observations[0])
+    vec_env.step_async(setup_actions(0, NUM_ENVS)[0])
+    observations, rewards, dones, infos = vec_env.step_wait()
+    assert observations.shape == (NUM_ENVS, *observation_shape)
+    assert rewards.shape == (NUM_ENVS,)
+    assert dones.shape == (NUM_ENVS,)
+    assert len(infos) == NUM_ENVS
+
+
+def test_auto_reset_keeps_terminal_observation():
+    vec_env = VecEnvironment(NUM_ENVS, seed=1)
+    vec_env.reset()
+    finished = 0
+    for actions in setup_actions(1, NUM_ENVS):
+        vec_env.step_async(actions)
+        observations, _, dones, infos = vec_env.step_wait()
+        for env_index in np.flatnonzero(dones):
+            finished += 1
+            terminal_observation = infos[env_index]["terminal_observation"]
+            assert terminal_observation.shape == observation_shape
+            # The returned observation starts the next episode with the ball
+            assert observations[env_index][5] == 1.0
+            assert observations[env_index][6] == 1.0
+            assert not np.array_equal(terminal_observation, observations[env_index])
+        for env_index in np.flatnonzero(~dones):
+            assert "terminal_observation" not in infos[env_index]
+    assert finished > 0
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_matches_environment(seed):
+    # These seeds keep the player clear of the defender, which only
+    # Environment collides with
+    vec_env = VecEnvironment(1, seed)
+    vec_observations = vec_env.reset()
+    env = Environment()
+    env.seed(seed)
+    observation = env.reset()
+    assert np.array_equal(observation, vec_observations[0])
+    for actions in setup_actions(seed, 1):
+        observation, reward, done, _ = env.step(actions[0])
+        if done:
+            observation = env.reset()
+        vec_env.step_async(actions)
+        vec_observations, rewards, dones, _ = vec_env.step_wait()
+        assert done == dones[0]
+        assert reward == pytest.approx(rewards[0], abs=1e-5)
+        assert np.allclose(observation, vec_observations[0], atol=1e-5)
+
+
+def test_env_method_runs_once():
+    vec_env = VecEnvironment(NUM_ENVS, seed=0)
+    calls = []
+    vec_env.count_call = lambda value: calls.append(value) or len(calls)
+    assert vec_env.env_method("count_call", 5) == [1] * NUM_ENVS
+    assert vec_env.env_method("count_call", 6, indices=[1, 2]) == [2, 2]
+    assert calls == [5, 6]
+    assert vec_env.env_method("seed", 3) == [[3] * NUM_ENVS] * NUM_ENVS
+    assert vec_env.get_attr("num_envs", indices=[0, 3]) == [NUM_ENVS, NUM_ENVS]
+    vec_env.set_attr("shot_clock_duration", 10.0)
+    assert vec_env.shot_clock_duration == 10.0
+    with pytest.raises(AssertionError):
+        vec_env.set_attr("shot_clock_duration", 5.0, indices=[0])
+
+
+def test_render_warns():
+    vec_env = VecEnvironment(NUM_ENVS, seed=0)
+    vec_env.reset()
+    with pytest.warns(UserWarning):
+        assert vec_env.render() is None
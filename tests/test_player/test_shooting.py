@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+import numpy as np
 from bball import Player, Space, Ball, BallMode
 from bball.utils import close_to, approx
 from bball.create import (
@@ -6,6 +7,7 @@ from bball.create import (
     create_space,
     create_ball,
     create_linear_shot_probability,
+    create_guaranteed_shot_probability,
     create_player_attributes,
 )
 
@@ -55,3 +57,24 @@ def test_shot_probability():
     assert approx(shot_probability(max_shot_distance / 2), 0.5)
     assert approx(shot_probability(7), 3 / 10)
     assert approx(shot_probability(3), 7 / 10)
+
+
+def test_shot_probabilities_match_scalar():
+    shot_probability = create_linear_shot_probability(
+        max_percentage=0.8,
+        min_shot_distance=2,
+        min_percentage=0.2,
+        max_shot_distance=10,
+    )
+    distances = np.array([[0.0, 1.0, 2.0, 5.5], [9.99, 10.0, 10.01, 50.0]])
+    probabilities = shot_probability.probabilities(distances)
+    assert probabilities.shape == distances.shape
+    for distance, probability in zip(distances.ravel(), probabilities.ravel()):
+        assert approx(shot_probability(distance), probability)
+
+
+def test_guaranteed_shot_probabilities():
+    shot_probability = create_guaranteed_shot_probability()
+    probabilities = shot_probability.probabilities(np.array([[0.0, 5.0, 1000.0]]))
+    assert probabilities.shape == (1, 3)
+    assert (probabilities == 1.0).all()
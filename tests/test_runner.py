@@ -0,0 +1,44 @@
+from bball.create import (
+    create_initialized_player,
+    create_teams,
+    create_game,
+    create_game_settings,
+)
+from runner import run_headless, at_possession_boundaries
+from runner.setup import time_frame_for
+
+
+def _game():
+    player_1 = create_initialized_player(position=(1, 1))
+    player_2 = create_initialized_player(position=(2, 2))
+    game = create_game(
+        create_teams(player_1, player_2),
+        settings=create_game_settings(shot_clock_duration=1.0),
+    )
+    game.ball.jump_ball_won_by(player_1)
+    return game
+
+
+def test_run_headless_should_stop():
+    game = _game()
+    time_frame = time_frame_for(10, 1.0)
+    run_headless(game, 10, 1.0, 10.0, should_stop=lambda game: game.elapsed_time > 2)
+    assert 2 < game.elapsed_time <= 2 + time_frame + 1e-9
+
+    game = _game()
+    run_headless(game, 10, 1.0, 10.0, should_stop=lambda _: True)
+    assert game.elapsed_time == 0
+
+
+def test_stop_at_possession_boundaries():
+    game = _game()
+    calls = []
+
+    def should_stop(game) -> bool:
+        calls.append(game.elapsed_time)
+        return len(calls) > 2
+
+    run_headless(game, 10, 1.0, 10.0, should_stop=at_possession_boundaries(should_stop))
+    # The start, then the two shot clock violations
+    assert len(calls) == 3
+    assert sum(game.scoreboard.possessions) == 2
@@ -0,0 +1,137 @@
+from random import uniform, seed
+from copy import deepcopy
+import pytest
+from bball.space import BACKENDS, KINEMATIC_BACKEND, PYMUNK_BACKEND
+from bball import BallMode
+from bball.instrumentation import (
+    Instrumentation,
+    SECTIONS,
+    STRATEGIES,
+    PLAYERS,
+    PHYSICS,
+    BALL,
+    RULES,
+)
+from bball.utils import close_to, approx
+from bball.create import (
+    create_initialized_player,
+    create_player_attributes,
+    create_teams,
+    create_space,
+    create_game,
+)
+from .utils import parametrize_movement, setup_players
+
+seed(3)
+
+
+@parametrize_movement
+def test_kinematic_backend_matches_pymunk(
+    velocity_decay, max_velocity, max_substep_length
+):
+    pymunk_players = setup_players(velocity_decay, max_velocity)
+    kinematic_players = deepcopy(pymunk_players)
+    pymunk_space = create_space(create_teams(pymunk_players[:2], pymunk_players[2:]))
+    kinematic_space = create_space(
+        create_teams(kinematic_players[:2], kinematic_players[2:]),
+        backend=KINEMATIC_BACKEND,
+    )
+    for _ in range(30):
+        moves = [(uniform(-1, 1), uniform(-1, 1)) for _ in pymunk_players]
+        for players in [pymunk_players, kinematic_players]:
+            for player, (turn, acceleration) in zip(players, moves):
+                player.turn(turn).accelerate(acceleration)
+        pymunk_space.step(0.2, max_substep_length)
+        kinematic_space.step(0.2, max_substep_length)
+
+    for pymunk_player, kinematic_player in zip(pymunk_players, kinematic_players):
+        assert close_to(pymunk_player.position, kinematic_player.position)
+        assert close_to(pymunk_player.velocity, kinematic_player.velocity)
+        assert approx(
+            pymunk_player.orientation_degrees, kinematic_player.orientation_degrees
+        )
+
+
+def test_switching_backends_keeps_state():
+    player = create_initialized_player(position=(1, 2), orientation_degrees=90)
+    create_space(player, backend=KINEMATIC_BACKEND)
+    player.accelerate(1.0)
+    player.place_at((3, 4), 45)
+    create_space(player, backend=PYMUNK_BACKEND)
+    assert close_to(player.position, (3, 4))
+    assert approx(player.orientation_degrees, 45)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_restore_replays_identically(backend):
+    players = setup_players(0.05, 8.0)
+    game = create_game(create_teams(players[:2], players[2:]))
+    space = create_space(game, backend=backend)
+    moves = [[(uniform(-1, 1), uniform(-1, 1)) for _ in players] for _ in range(20)]
+
+    def run():
+        for step_moves in moves:
+            for player, (turn, acceleration) in zip(players, step_moves):
+                player.turn(turn).accelerate(acceleration)
+            space.step(0.2)
+        return [(player.position, player.velocity) for player in players]
+
+    state = game.snapshot()
+    first_run = run()
+    space.restore(state)
+    assert run() == first_run
+    # Running the same game in a new space after the old one is discarded
+    space.restore(state)
+    space = create_space(game, backend=backend)
+    assert run() == first_run
+
+
+def test_instrumentation_counts_sections():
+    def run(instrumentation):
+        seed(5)
+        players = setup_players(0.05, 8.0)
+        game = create_game(create_teams(players[:2], players[2:]))
+        space = create_space(game, instrumentation=instrumentation)
+        game.ball.jump_ball_won_by(players[0])
+        for _ in range(10):
+            # The ball handler stands still so the ball stays held and no
+            # substep ends early
+            for player in players[1:]:
+                player.turn(0.3).accelerate(1.0)
+            space.step(0.2, 0.05)
+        assert game.ball.mode == BallMode.HELD
+        return [(player.position, player.velocity) for player in players]
+
+    instrumentation = Instrumentation()
+    assert run(instrumentation) == run(None)
+    assert instrumentation.steps == 10
+    assert instrumentation.substeps == 40
+    stats = instrumentation.stats()
+    for section in SECTIONS:
+        section_stats = stats["sections"][section]
+        assert section_stats["calls"] == 40
+        assert 0.0 < section_stats["max_time"] <= section_stats["total_time"]
+    assert approx(stats["total_time"], instrumentation.total_time)
+    instrumentation.reset()
+    assert instrumentation.substeps == 0
+    assert instrumentation.stats()["sections"][PHYSICS]["calls"] == 0
+
+
+def test_instrumentation_skips_rules_after_ball_transitions():
+    shooter = create_initialized_player(
+        attributes=create_player_attributes(shot_velocity=100.0)
+    )
+    game = create_game(create_teams(shooter, create_initialized_player()))
+    instrumentation = Instrumentation()
+    space = create_space(game, instrumentation=instrumentation)
+    game.ball.jump_ball_won_by(shooter)
+    shooter.shoot_at(game.target_hoop(shooter).position)
+    # The ball reaches the hoop, the rules score the shot and then inbound
+    for mode in [BallMode.REACHEDSHOT, BallMode.DEAD, BallMode.HELD]:
+        space.step(0.5)
+        assert game.ball.mode == mode
+    calls = {
+        section: stats["calls"]
+        for section, stats in instrumentation.stats()["sections"].items()
+    }
+    assert calls == {STRATEGIES: 3, PLAYERS: 3, PHYSICS: 3, BALL: 3, RULES: 2}
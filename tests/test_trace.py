@@ -0,0 +1,52 @@
+import numpy as np
+from bball import BallMode, ReachVelocity
+from bball.utils import close_to, approx
+from bball.create import (
+    create_initialized_player,
+    create_teams,
+    create_game,
+    create_game_settings,
+    create_space,
+)
+from runner.trace import Trace, TraceRecorder, show_frame
+
+
+def _game():
+    player_1 = create_initialized_player(position=(1, 1))
+    player_2 = create_initialized_player(position=(4, 2), orientation_degrees=90)
+    return create_game(
+        create_teams(player_1, player_2),
+        settings=create_game_settings(shot_clock_duration=2.0),
+    )
+
+
+def test_record_and_show_frames(tmp_path):
+    game = _game()
+    space = create_space().add(game)
+    game.ball.jump_ball_won_by(game.teams[0][0])
+    behavior = ReachVelocity((1, 1))
+    positions = []
+    with TraceRecorder(tmp_path, game, chunk_size=4) as recorder:
+        for _ in range(10):
+            recorder(0.1)
+            behavior.drive(game.teams[0][0], 0.1)
+            positions.append(game.teams[0][0].position)
+            space.step(0.1)
+
+    trace = Trace(tmp_path)
+    assert len(trace) == 10
+    assert trace.team_sizes == [1, 1]
+    assert len(list(trace.chunks())) == 3
+    assert np.allclose(trace.column("times"), np.arange(10) * 0.1)
+    frames = list(trace.frames())
+    assert frames[0].ball_mode == BallMode.HELD.value
+    assert approx(frames[0].shot_clock, 2.0)
+
+    replayed = _game()
+    for frame, position in zip(frames, positions):
+        show_frame(replayed, frame)
+        assert close_to(replayed.teams[0][0].position, position)
+        assert approx(replayed.shot_clock, frame.shot_clock)
+        assert close_to(replayed.ball.position, frame.ball_position)
+    assert not close_to(positions[0], positions[-1])
+    assert approx(replayed.shot_clock, 2.0 - 0.9)
@@ -0,0 +1,85 @@
+import math
+from random import uniform, seed
+import numpy as np
+import pymunk
+import pytest
+from bball import array_utils
+from bball.utils import (
+    approx,
+    close_to,
+    normalized_angle,
+    normalized_angle_degrees,
+    distance_between,
+    vector_angle_degrees,
+    angle_degrees_to_vector,
+    interpolate_points,
+    in_between_of,
+    dot_product,
+)
+
+seed(4)
+
+
+@pytest.mark.parametrize(
+    "degrees", [-180.0, 179.999, 180.0, -540.0, 725.5, -1e6 - 0.25, 1e-17 - 180]
+)
+def test_normalized_angle_degrees(degrees):
+    normalized = normalized_angle_degrees(degrees)
+    assert -180 <= normalized < 180
+    assert approx(math.remainder(normalized - degrees, 360), 0.0)
+    assert -math.pi <= normalized_angle(math.radians(degrees)) < math.pi
+
+
+@pytest.mark.parametrize("_trial_index", range(20))
+def test_matches_vec2d(_trial_index):
+    point_1 = (uniform(-10, 10), uniform(-10, 10))
+    point_2 = (uniform(-10, 10), uniform(-10, 10))
+    vec_1, vec_2 = pymunk.Vec2d(*point_1), pymunk.Vec2d(*point_2)
+    angle_degrees = uniform(-180, 180)
+    interp = uniform(0, 1)
+
+    assert approx(distance_between(point_1, point_2), vec_1.get_distance(vec_2))
+    assert approx(dot_product(point_1, point_2), vec_1.dot(vec_2))
+    assert approx(vector_angle_degrees(point_1), vec_1.angle_degrees)
+    assert close_to(
+        angle_degrees_to_vector(angle_degrees, 2.0),
+        tuple(pymunk.Vec2d(2.0, 0).rotated_degrees(angle_degrees)),
+    )
+    assert close_to(
+        interpolate_points(point_1, point_2, interp),
+        tuple(vec_1.interpolate_to(vec_2, interp)),
+    )
+
+
+def test_array_utils_match_scalar():
+    rng = np.random.default_rng(0)
+    points_1 = rng.uniform(-10, 10, (8, 2))
+    points_2 = rng.uniform(-10, 10, (8, 2))
+    candidates = rng.uniform(-10, 10, (8, 2))
+    angles_degrees = rng.uniform(-720, 720, 8)
+    interps = rng.uniform(0, 1, 8)
+
+    distances = array_utils.distances_between(points_1, points_2)
+    angles = array_utils.vector_angles_degrees(points_1)
+    vectors = array_utils.angles_degrees_to_vectors(angles_degrees, distances)
+    interpolated = array_utils.interpolate_points(points_1, points_2, interps)
+    normalized = array_utils.normalized_angles_degrees(angles_degrees)
+    between = array_utils.in_between_of(candidates, points_1, points_2)
+    for index in range(8):
+        point_1, point_2 = tuple(points_1[index]), tuple(points_2[index])
+        assert approx(distances[index], distance_between(point_1, point_2))
+        assert approx(angles[index], vector_angle_degrees(point_1))
+        assert close_to(
+            tuple(vectors[index]),
+            angle_degrees_to_vector(angles_degrees[index], distances[index]),
+        )
+        assert close_to(
+            tuple(interpolated[index]),
+            interpolate_points(point_1, point_2, interps[index]),
+        )
+        assert approx(
+            normalized[index], normalized_angle_degrees(angles_degrees[index])
+        )
+        assert between[index] == in_between_of(
+            tuple(candidates[index]), point_1, point_2
+        )
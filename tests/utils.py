@@ -1,7 +1,17 @@
-from typing import Callable, Any, TypeVar
+from random import uniform
+from typing import Callable, Any, List, TypeVar
+import pytest
+from bball import Player
+from bball.create import create_initialized_player, create_player_attributes
 
 T = TypeVar("T")
 
+MOVEMENT_SETTINGS = [
+    pytest.mark.parametrize("velocity_decay", [0.0, 0.05]),
+    pytest.mark.parametrize("max_velocity", [1.5, 8.0]),
+    pytest.mark.parametrize("max_substep_length", [None, 0.05]),
+]
+
 
 def require_exception(callback: Callable[[], T], exception_type: Any):
     success = False
@@ -10,3 +20,28 @@ def require_exception(callback: Callable[[], T], exception_type: Any):
     except exception_type:
         success = True
     assert success
+
+
+def parametrize_movement(test: Callable) -> Callable:
+    # Runs test for every velocity_decay, max_velocity and max_substep_length
+    for mark in reversed(MOVEMENT_SETTINGS):
+        test = mark(test)
+    return test
+
+
+def setup_players(
+    velocity_decay: float, max_velocity: float, num_players: int = 4
+) -> List[Player]:
+    attributes = create_player_attributes(
+        max_velocity=max_velocity,
+        max_acceleration=2.0,
+        velocity_decay=velocity_decay,
+    )
+    return [
+        create_initialized_player(
+            attributes=attributes,
+            position=(uniform(0, 10), uniform(0, 5)),
+            orientation_degrees=uniform(-180, 180),
+        )
+        for _ in range(num_players)
+    ]